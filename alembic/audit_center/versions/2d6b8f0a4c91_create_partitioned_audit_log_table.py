@@ -0,0 +1,69 @@
+"""create partitioned audit_log table
+
+Revision ID: 2d6b8f0a4c91
+Revises: 
+Create Date: 2026-10-18 09:12:44.508316
+
+"""
+from datetime import date, datetime, timezone
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2d6b8f0a4c91'
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# 先建当月及之后几个月的分区，再往后的由审计分区维护任务补建（AUDIT_LOG_PARTITION_AHEAD_MONTHS）
+AHEAD_MONTHS = 3
+
+
+def _month(value: date, offset: int) -> date:
+    months = value.year * 12 + value.month - 1 + offset
+    return date(months // 12, months % 12 + 1, 1)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('au_audit_log',
+    sa.Column('id', sa.BigInteger(), autoincrement=True, nullable=False),
+    sa.Column('user_id', sa.String(length=50), nullable=True, comment='操作用户ID'),
+    sa.Column('username', sa.String(length=100), nullable=True, comment='操作用户名'),
+    sa.Column('module', sa.String(length=100), nullable=False, comment='操作模块，例如 cloud、asset、user'),
+    sa.Column('action', sa.String(length=100), nullable=False, comment='操作动作，例如 create、update、delete'),
+    sa.Column('target_type', sa.String(length=100), nullable=True, comment='目标类型，例如 cloud_region、instance'),
+    sa.Column('target_id', sa.String(length=100), nullable=True, comment='目标对象ID'),
+    sa.Column('request_data', sa.Text(), nullable=True, comment='操作请求参数（JSON）'),
+    sa.Column('description', sa.Text(), nullable=True, comment="操作描述，例如 '创建云实例'"),
+    sa.Column('status', sa.String(length=20), nullable=False, comment='操作状态：success / failed'),
+    sa.Column('error_message', sa.Text(), nullable=True, comment='失败时的错误信息'),
+    sa.Column('ip_address', sa.String(length=50), nullable=True, comment='请求来源IP'),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, comment='创建时间 (UTC)，分区键'),
+    # 分区列必须包含在主键里
+    sa.PrimaryKeyConstraint('id', 'created_at'),
+    comment='操作审计日志表（按月分区）'
+    )
+    op.create_index('ix_au_audit_log_user_created', 'au_audit_log', ['user_id', 'created_at'], unique=False)
+    op.create_index('ix_au_audit_log_module_action_created', 'au_audit_log', ['module', 'action', 'created_at'], unique=False)
+    op.create_index('ix_au_audit_log_created_at', 'au_audit_log', ['created_at'], unique=False)
+
+    # 按月 RANGE 分区：pYYYYMM 存放该月数据，pmax 兜底；过期月份由维护任务整体 DROP PARTITION
+    current = _month(datetime.now(timezone.utc).date(), 0)
+    partitions = [
+        f"PARTITION p{_month(current, i):%Y%m} VALUES LESS THAN ('{_month(current, i + 1).isoformat()}')"
+        for i in range(AHEAD_MONTHS + 1)
+    ]
+    partitions.append("PARTITION pmax VALUES LESS THAN (MAXVALUE)")
+    op.execute(f"ALTER TABLE au_audit_log PARTITION BY RANGE COLUMNS(created_at) ({', '.join(partitions)})")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_au_audit_log_created_at', table_name='au_audit_log')
+    op.drop_index('ix_au_audit_log_module_action_created', table_name='au_audit_log')
+    op.drop_index('ix_au_audit_log_user_created', table_name='au_audit_log')
+    op.drop_table('au_audit_log')
@@ -0,0 +1,37 @@
+"""create catalog_sync_state table
+
+Revision ID: 3f1c2a7d9b10
+Revises: ac5730ab836b
+Create Date: 2025-12-02 10:12:40.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f1c2a7d9b10'
+down_revision: Union[str, Sequence[str], None] = 'ac5730ab836b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('pu_catalog_sync_state',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('provider_code', sa.String(length=50), nullable=False, comment='云厂商编码，例如 aliyun'),
+    sa.Column('kind', sa.String(length=50), nullable=False, comment='目录类型，例如 zones、vpcs'),
+    sa.Column('scope', sa.String(length=200), nullable=False, comment='同步范围：region_id 或 region_id/vpc_id，厂商级为空串'),
+    sa.Column('synced_at', sa.DateTime(timezone=True), nullable=False, comment='最近一次成功同步时间 (UTC)'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('provider_code', 'kind', 'scope', name='uq_provider_kind_scope'),
+    comment='云资源目录同步时间'
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('pu_catalog_sync_state')
@@ -0,0 +1,35 @@
+"""create token_revocation table
+
+Revision ID: 5b8e2f1c7a43
+Revises: e01edf435039
+Create Date: 2026-10-18 08:20:11.402917
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b8e2f1c7a43'
+down_revision: Union[str, Sequence[str], None] = 'e01edf435039'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('ss_token_revocations',
+    sa.Column('user_id', sa.Integer(), autoincrement=False, nullable=False, comment='用户ID'),
+    sa.Column('revoked_before', sa.DateTime(timezone=True), nullable=False, comment='吊销时间点 (UTC)，各 worker 按此增量同步'),
+    sa.PrimaryKeyConstraint('user_id'),
+    comment='access token 吊销记录：签发时间早于 revoked_before 的 token 一律失效'
+    )
+    op.create_index(op.f('ix_ss_token_revocations_revoked_before'), 'ss_token_revocations', ['revoked_before'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_ss_token_revocations_revoked_before'), table_name='ss_token_revocations')
+    op.drop_table('ss_token_revocations')
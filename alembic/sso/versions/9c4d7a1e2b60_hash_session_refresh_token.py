@@ -0,0 +1,47 @@
+"""hash session refresh_token
+
+Revision ID: 9c4d7a1e2b60
+Revises: 5b8e2f1c7a43
+Create Date: 2026-10-18 08:45:37.215804
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9c4d7a1e2b60'
+down_revision: Union[str, Sequence[str], None] = '5b8e2f1c7a43'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('ss_sessions', sa.Column('token_hash', sa.String(length=64), nullable=True, comment='刷新 token 的 SHA-256（hex），不存原文'))
+    # 过期会话不再迁移，直接删除
+    op.execute("DELETE FROM ss_sessions WHERE expires_at < UTC_TIMESTAMP()")
+    # 已有会话就地换成摘要，用户无需重新登录（与 app.core.security.hash_refresh_token 一致）
+    op.execute("UPDATE ss_sessions SET token_hash = SHA2(refresh_token, 256)")
+    # 同一 token 理论上不会重复入库，建唯一索引前仍只保留最新一条
+    op.execute(
+        "DELETE s1 FROM ss_sessions s1 JOIN ss_sessions s2 "
+        "ON s1.token_hash = s2.token_hash AND s1.id < s2.id"
+    )
+    op.alter_column('ss_sessions', 'token_hash', existing_type=sa.String(length=64), nullable=False,
+                    existing_comment='刷新 token 的 SHA-256（hex），不存原文')
+    op.create_index(op.f('ix_ss_sessions_token_hash'), 'ss_sessions', ['token_hash'], unique=True)
+    op.create_index(op.f('ix_ss_sessions_expires_at'), 'ss_sessions', ['expires_at'], unique=False)
+    op.drop_column('ss_sessions', 'refresh_token')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # 摘要无法还原出 token 原文：回退时清空会话，用户需重新登录
+    op.execute("DELETE FROM ss_sessions")
+    op.add_column('ss_sessions', sa.Column('refresh_token', sa.String(length=512), nullable=False, comment='刷新 token（hash 或原文）'))
+    op.drop_index(op.f('ix_ss_sessions_expires_at'), table_name='ss_sessions')
+    op.drop_index(op.f('ix_ss_sessions_token_hash'), table_name='ss_sessions')
+    op.drop_column('ss_sessions', 'token_hash')
@@ -0,0 +1,148 @@
+# app/clients/aliyun_async_client.py
+from typing import AsyncIterator, List, Optional
+
+from alibabacloud_ecs20140526 import models as ecs_models
+
+from app.clients.base import BaseCloudClient
+from app.clients.paginator import paginate_async
+from app.core.config import settings
+from app.clients.aliyun_client import (
+    VPC_PAGE_SIZE,
+    VSWITCH_PAGE_SIZE,
+    IMAGE_PAGE_SIZE,
+    SECURITY_GROUP_PAGE_SIZE,
+    RegionalEcsClient,
+    _total_count,
+    _vpcs_request,
+    _vswitches_request,
+    _parse_regions,
+    _parse_zones,
+    _parse_vpcs,
+    _parse_vswitches,
+    _security_groups_request,
+    _parse_security_groups,
+    _parse_security_group_rules,
+    _images_request,
+    _parse_images,
+    _system_disk_request,
+    _parse_system_disk_categories,
+    _parse_instance_types,
+    _available_resource_request,
+    _parse_available_instance_types,
+    _price_request,
+    _parse_price,
+)
+
+
+class AsyncAliyunClient(BaseCloudClient):
+    """
+    阿里云 ECS 异步客户端：方法签名与 AliyunClient 一致，但都是协程，
+    底层调用 SDK 的 describe_*_async，不占用 starlette 线程池线程。
+    """
+
+    def __init__(self, access_key_id: str, access_key_secret: str, endpoint: str = "ecs.aliyuncs.com"):
+        self.client = RegionalEcsClient(access_key_id, access_key_secret, endpoint)
+
+    async def list_regions(self) -> List[dict]:
+        request = ecs_models.DescribeRegionsRequest()
+        return _parse_regions(await self.client.describe_regions_async(request))
+
+    async def list_zones(self, region_id: str) -> List[dict]:
+        request = ecs_models.DescribeZonesRequest(region_id=region_id)
+        return _parse_zones(await self.client.describe_zones_async(request))
+
+    async def list_vpcs(self, region_id: str) -> List[dict]:
+        return [v async for v in self.iter_vpcs(region_id)]
+
+    def iter_vpcs(self, region_id: str) -> AsyncIterator[dict]:
+        async def fetch(page: int, page_size: int):
+            resp = await self.client.describe_vpcs_async(_vpcs_request(region_id, page, page_size))
+            return _parse_vpcs(resp), _total_count(resp)
+
+        return paginate_async(fetch, VPC_PAGE_SIZE, settings.CLOUD_PAGE_CONCURRENCY)
+
+    async def list_vswitches(self, region_id: str, vpc_id: str) -> List[dict]:
+        return [v async for v in self.iter_vswitches(region_id, vpc_id)]
+
+    def iter_vswitches(self, region_id: str, vpc_id: str) -> AsyncIterator[dict]:
+        async def fetch(page: int, page_size: int):
+            resp = await self.client.describe_vswitches_async(_vswitches_request(region_id, vpc_id, page, page_size))
+            return _parse_vswitches(resp), _total_count(resp)
+
+        return paginate_async(fetch, VSWITCH_PAGE_SIZE, settings.CLOUD_PAGE_CONCURRENCY)
+
+    async def list_security_groups(self, region_id: Optional[str] = None, vpc_id: Optional[str] = None, page: int = 1, page_size: int = 50):
+        req = _security_groups_request(region_id, vpc_id, page, page_size)
+        return _parse_security_groups(await self.client.describe_security_groups_async(req))
+
+    def iter_security_groups(self, region_id: Optional[str] = None, vpc_id: Optional[str] = None, page_size: int = SECURITY_GROUP_PAGE_SIZE) -> AsyncIterator[dict]:
+        async def fetch(page: int, size: int):
+            resp = await self.list_security_groups(region_id, vpc_id, page, size)
+            return resp["items"], resp["total"]
+
+        return paginate_async(fetch, page_size, settings.CLOUD_PAGE_CONCURRENCY)
+
+    async def list_security_group_rules(self, region_id: str, security_group_id: str):
+        req = ecs_models.DescribeSecurityGroupAttributeRequest(
+            region_id=region_id,
+            security_group_id=security_group_id
+        )
+        return _parse_security_group_rules(await self.client.describe_security_group_attribute_async(req))
+
+    async def list_images(
+        self,
+        region_id: Optional[str] = None,
+        instance_type_id: str = None,
+        architecture: str = None,
+    ) -> List[dict]:
+        return [i async for i in self.iter_images(region_id, instance_type_id, architecture)]
+
+    def iter_images(self, region_id: Optional[str] = None, instance_type_id: str = None, architecture: str = None) -> AsyncIterator[dict]:
+        async def fetch(page: int, page_size: int):
+            resp = await self.client.describe_images_async(_images_request(region_id, instance_type_id, architecture, page, page_size))
+            return _parse_images(resp), _total_count(resp)
+
+        return paginate_async(fetch, IMAGE_PAGE_SIZE, settings.CLOUD_PAGE_CONCURRENCY)
+
+    async def list_system_disk_categories(
+            self,
+            region_id: Optional[str] = None,
+            zone_id: str = None,
+            instance_type_id: Optional[str] = None,
+            instance_charge_type: Optional[str] = None,
+    ) -> List[str]:
+        request = _system_disk_request(region_id, zone_id, instance_type_id, instance_charge_type)
+        return _parse_system_disk_categories(await self.client.describe_available_resource_async(request))
+
+    async def list_instance_types(self, provider_code: str, region_id: Optional[str] = None, min_cpu: int = 1, min_memory: int = 1, architecture: str = "x86_64", bare_metal: bool = False) -> List[dict]:
+        request = ecs_models.DescribeInstanceTypesRequest()
+        return _parse_instance_types(await self.client.describe_instance_types_async(request), provider_code)
+
+    async def list_available_instance_types(
+            self,
+            region_id: str = None,
+            zone_id: str = None,
+            instance_charge_type: str = None,
+            system_disk_category: str = None,
+    ) -> List[dict]:
+        request = _available_resource_request(region_id, zone_id, instance_charge_type, system_disk_category)
+        return _parse_available_instance_types(await self.client.describe_available_resource_async(request))
+
+    async def list_pricing_options(
+        self,
+        region_id: str,
+        instance_type: str,
+        instance_charge_type: str = None,
+        system_disk_category: str = None,
+        period: int = 1,
+    ):
+        req = _price_request(region_id, instance_type, instance_charge_type, system_disk_category, period)
+        return _parse_price(await self.client.describe_price_async(req))
+
+
+class AsyncAliyunClientFactory:
+    """阿里云异步客户端工厂"""
+
+    @staticmethod
+    def create_client(access_key_id: str, access_key_secret: str, endpoint: str = "ecs.aliyuncs.com") -> AsyncAliyunClient:
+        return AsyncAliyunClient(access_key_id, access_key_secret, endpoint)
@@ -1,11 +1,15 @@
 # app/clients/aliyun_client.py
-from typing import List, Optional, Any
+from typing import Iterator, List, Optional, Any
 import re
 
 from alibabacloud_ecs20140526.client import Client as EcsClient
 from alibabacloud_ecs20140526 import models as ecs_models
 from app.common.credentials_manager import CredentialsManager
 from app.clients.base import BaseCloudClient
+from app.clients.client_pool import cloud_client_pool
+from app.clients.instrumented import InstrumentedClient
+from app.clients.paginator import paginate
+from app.core.config import settings
 
 from app.core.logger import logger
 
@@ -138,13 +142,416 @@ def _extract_items_from_response(response) -> List[Any]:
             pass
     return []
 
+# ============================================================
+# 请求构造 / 响应解析（同步、异步客户端共用）
+# ============================================================
+# 各分页接口允许的最大 PageSize
+VPC_PAGE_SIZE = 50
+VSWITCH_PAGE_SIZE = 50
+IMAGE_PAGE_SIZE = 100
+SECURITY_GROUP_PAGE_SIZE = 50
+
+
+def _total_count(response) -> int:
+    return getattr(response.body, "total_count", None) or 0
+
+
+def _parse_regions(response) -> List[dict]:
+    return [
+        {"region_id": r.region_id, "region_name": r.local_name}
+        for r in response.body.regions.region
+    ]
+
+
+def _parse_zones(response) -> List[dict]:
+    return [
+        {"zone_id": z.zone_id, "zone_name": z.local_name}
+        for z in response.body.zones.zone
+    ]
+
+
+def _vpcs_request(region_id: str, page: int, page_size: int):
+    return ecs_models.DescribeVpcsRequest(region_id=region_id, page_number=page, page_size=page_size)
+
+
+def _parse_vpcs(response) -> List[dict]:
+    return [
+        {
+            "vpc_id": v.vpc_id,
+            "vpc_name": v.vpc_name,
+            "cidr_block": v.cidr_block,
+            "is_default": v.is_default,
+        }
+        for v in response.body.vpcs.vpc
+    ]
+
+
+def _vswitches_request(region_id: str, vpc_id: str, page: int, page_size: int):
+    return ecs_models.DescribeVSwitchesRequest(region_id=region_id, vpc_id=vpc_id, page_number=page, page_size=page_size)
+
+
+def _parse_vswitches(response) -> List[dict]:
+    vswitch_list = getattr(response.body.vswitches, "vswitch", []) or []
+    return [
+        {
+            "vswitch_id": v.vswitch_id,
+            "vswitch_name": v.vswitch_name,
+            "cidr_block": v.cidr_block,
+            "zone_id": v.zone_id,
+        }
+        for v in vswitch_list
+    ]
+
+
+def _security_groups_request(region_id: Optional[str], vpc_id: Optional[str], page: int, page_size: int):
+    # ---- 正确：构建阿里云 Request 对象 ----
+    return ecs_models.DescribeSecurityGroupsRequest(
+        region_id=region_id,
+        vpc_id=vpc_id,
+        page_number=page,
+        page_size=page_size,
+    )
+
+
+def _parse_security_groups(resp) -> dict:
+    # ---- 阿里云返回是 TeaModel，应转成 dict ----
+    resp_dict = resp.to_map() if hasattr(resp, "to_map") else resp
+
+    items = []
+    total = 0
+
+    try:
+        # 适配阿里云 ECS 返回结构
+        gs = (
+            resp_dict.get("body", {})
+            .get("SecurityGroups", {})
+            .get("SecurityGroup", [])
+        )
+
+        total = (
+            resp_dict.get("body", {}).get("TotalCount", len(gs))
+        )
+
+        for g in gs:
+            items.append({
+                "SecurityGroupId": g.get("SecurityGroupId"),
+                "SecurityGroupName": g.get("SecurityGroupName"),
+                "Description": g.get("Description"),
+                "VpcId": g.get("VpcId"),
+                "ResourceGroupId": g.get("ResourceGroupId"),
+            })
+
+    except Exception as e:
+        logger.warning("parse security groups failed: %s", e)
+
+    return {"total": total, "items": items}
+
+
+def _parse_security_group_rules(resp) -> List[dict]:
+    perms = resp.body.permissions.permission or []
+
+    rules = []
+    for p in perms:
+        rules.append({
+            "direction": p.direction,                  # inbound / outbound
+            "protocol_code": p.ip_protocol,            # TCP/UDP/ALL
+            "port_range": p.port_range,                # 80/80
+            "policy_code": p.policy,                   # accept/ drop
+            "source": p.source_cidr_ip or p.dest_cidr_ip,  # 可能在 Source 或 Dest
+            "description": p.description,
+            "cloud_rule_id": p.security_group_rule_id,
+        })
+
+    return rules
+
+
+def _images_request(
+        region_id: Optional[str],
+        instance_type_id: Optional[str],
+        architecture: Optional[str],
+        page: int = 1,
+        page_size: int = IMAGE_PAGE_SIZE,
+):
+    return ecs_models.DescribeImagesRequest(
+        region_id=region_id,
+        instance_type=instance_type_id,
+        architecture=architecture,
+        image_owner_alias="system",
+        status="Available",
+        page_number=page,
+        page_size=page_size,
+    )
+
+
+def _parse_images(response) -> List[dict]:
+    images = response.body.images.image or []
+    return [
+        {
+            "image_id": i.image_id,
+            "image_name": i.image_name,
+        }
+        for i in images
+    ]
+
+
+def _system_disk_request(
+        region_id: Optional[str],
+        zone_id: Optional[str],
+        instance_type_id: Optional[str],
+        instance_charge_type: Optional[str],
+):
+    # ECS 提供的接口是 DescribeAvailableResource 或者 DescribeDiskCategoriesRequest
+    return ecs_models.DescribeAvailableResourceRequest(
+        region_id=region_id,
+        zone_id=zone_id,
+        instance_type=instance_type_id,
+        instance_charge_type=instance_charge_type,
+        destination_resource="SystemDisk",
+    )
+
+
+def _parse_system_disk_categories(response) -> List[str]:
+    # 提取可用区数据
+    available_zones = getattr(response.body.available_zones, "available_zone", []) or []
+
+    # 由于我们只指定了 zone_id，一般只有一个元素
+    if not available_zones:
+        return []
+
+    supported_resources = (
+        available_zones[0]
+        .available_resources.available_resource[0]
+        .supported_resources.supported_resource
+    )
+
+    # 返回磁盘种类列表（Value 字段）
+    return [res.value for res in supported_resources if res.status == "Available"]
+
+
+def _parse_instance_types(response, provider_code: str) -> List[dict]:
+    items = response.body.instance_types.instance_type  # list
+
+    if not items:
+        logger.debug("DescribeInstanceTypes(%s) returned no instance types", provider_code)
+        return []
+
+    results: List[dict] = []
+    for it in items:
+        # 下面用 _get_attr_any 去兼容不同命名方式
+        it_id = _get_attr_any(it, "InstanceTypeId", "instance_type_id", "instanceTypeId")
+        instance_family = _get_attr_any(it, "InstanceTypeFamily", "instance_family", "instanceFamily")
+        # 代次尝试从 instance_family 提取，例如 ecs.g7 -> g7
+        generation = None
+        if instance_family:
+            try:
+                # instance_family 可能是 'ecs.g7' 或 'g7'
+                if "." in instance_family:
+                    generation = instance_family.split(".")[-1]
+                else:
+                    generation = instance_family
+            except Exception:
+                generation = None
+        # logger.info(f'看下这个都有哪些字段 {it}')
+        cpu = _get_attr_any(it, "CpuCoreCount", "cpu_core_count", "cpuCount", "vcpu")
+        mem = _get_attr_any(it, "MemorySize", "memory_size", "memorySize")
+        arch = _get_attr_any(it, "CpuArchitecture", "cpu_architecture", "architecture")
+
+        gpu_amount = _get_attr_any(it, "GPUAmount", "gpu_amount", "gpuAmount")
+        gpu_spec = _get_attr_any(it, "GPUSpec", "gpu_spec", "gpuSpec")
+        gpu_mem = _get_attr_any(it, "GPUMemorySize", "gpu_memory_size", "gpuMemorySize")
+
+        local_amount = _get_attr_any(it, "LocalStorageAmount", "local_storage_amount", 'localStorageAmount')
+        local_capacity = _get_attr_any(it, "LocalStorageCapacity", "local_storage_capacity", 'localStorageCapacity')
+
+        network_perf = _get_attr_any(it, "NetworkInfo", "NetworkPerformance", "network_performance", "networkPerformance")
+        # 如果 network_perf 是复杂对象，需要序列化成字符串
+        if network_perf and not isinstance(network_perf, (str, int, float)):
+            try:
+                # 如果它是 SDK 对象，尝试 to_map / to_dict
+                if hasattr(network_perf, "to_map"):
+                    network_perf = str(network_perf.to_map())
+                elif hasattr(network_perf, "to_dict"):
+                    network_perf = str(network_perf.to_dict())
+                else:
+                    network_perf = str(network_perf)
+            except Exception:
+                network_perf = str(network_perf)
+
+        results.append({
+            "instance_type_id": it_id,
+            "instance_family": instance_family,
+            "generation": generation,
+            "cpu_core_count": cpu,
+            "memory_size": mem,
+            "architecture": arch,
+            "gpu_amount": int(gpu_amount) if gpu_amount is not None else 0,
+            "gpu_spec": gpu_spec,
+            "gpu_memory": float(gpu_mem) if gpu_mem is not None else None,
+            "local_storage_amount": int(local_amount) if local_amount is not None else None,
+            "local_storage_capacity": int(local_capacity) if local_capacity is not None else None,
+            "network_performance": network_perf,
+            "is_io_optimized": True,
+            "price": None,
+            "cloud_provider_code": provider_code
+        })
+
+    return results
+
+
+def _available_resource_request(
+        region_id: Optional[str],
+        zone_id: Optional[str],
+        instance_charge_type: Optional[str],
+        system_disk_category: Optional[str],
+):
+    return ecs_models.DescribeAvailableResourceRequest(
+        region_id=region_id,
+        zone_id=zone_id,
+        destination_resource="InstanceType",
+        resource_type="instance",
+        instance_charge_type=instance_charge_type or "PrePaid",
+        system_disk_category=system_disk_category or "cloud_essd",
+    )
+
+
+def _parse_available_instance_types(response) -> List[dict]:
+    available_types = []
+
+    body = response.body
+    if body:
+        available_zones = body.available_zones.available_zone or []
+
+        # 遍历可用区列表
+        if not isinstance(available_zones, list):
+            available_zones = [available_zones]
+
+        for az in available_zones:
+            az_id = az.zone_id
+            resources = az.available_resources.available_resource or []
+            if not isinstance(resources, list):
+                resources = [resources]
+
+            for resource in resources:
+                supported_resources = resource.supported_resources.supported_resource or []
+                if not isinstance(supported_resources, list):
+                    supported_resources = [supported_resources]
+
+                for inst in supported_resources:
+                    # 是否售罄 (Sold out), 库存充足(WithStock”), 库存不算充足(ClosedWithStock),当前售罄，但“将来会补货”(WithoutStock),售罄且不会补货 / 资源彻底不可用(ClosedWithoutStock)
+
+                    available_types.append({
+                        "instance_type_id": inst.value,
+                        "status": inst.status,
+                        "status_category": inst.status_category,
+                        "zone_id": az_id,
+                        # "max_available": getattr(inst, "max", None),
+                        # "unit": getattr(inst, "unit", None),
+                    })
+
+    return available_types
+
+
+def _price_request(
+        region_id: str,
+        instance_type: str,
+        instance_charge_type: Optional[str],
+        system_disk_category: Optional[str],
+        period: int,
+):
+    req = ecs_models.DescribePriceRequest(
+        region_id=region_id,
+        instance_type=instance_type,
+        # system_disk_category=system_disk_category or "cloud_essd",
+    )
+
+    if instance_charge_type == "PostPaid":  # 按量
+        req.price_unit = "Hour"
+    elif instance_charge_type == "PrePaid":  # 包年包月
+        req.price_unit = "Month"
+        req.period = period
+        req.period_unit = "Month"
+    elif instance_charge_type == "Spot":  # 抢占式
+        req.price_unit = "Hour"
+        req.spot_strategy = "SpotAsPriceGo"
+
+    req.system_disk = ecs_models.DescribePriceRequestSystemDisk(
+        category=system_disk_category
+    )
+    return req
+
+
+def _parse_price(resp) -> dict:
+    detail_infos = resp.body.price_info.price.detail_infos.detail_info
+
+    # 只取实例 + 系统盘价格
+    prices = {item.resource: item.trade_price for item in detail_infos}
+    normalized = {k.lower(): v for k, v in prices.items()}
+    return normalized
+
+
+def build_ecs_client(access_key_id: str, access_key_secret: str, endpoint: str) -> InstrumentedClient:
+    cred_client = CredentialsManager.build_aliyun_client(access_key_id, access_key_secret)
+    # 客户端由 cloud_client_pool 长期复用，HTTP 连接（keep-alive）随之复用，不必每批请求重新握手
+    config = CredentialsManager.build_aliyun_product_config(
+        cred_client,
+        endpoint,
+        connect_timeout=settings.CLOUD_HTTP_CONNECT_TIMEOUT_MS,
+        read_timeout=settings.CLOUD_HTTP_READ_TIMEOUT_MS,
+        max_idle_conns=settings.CLOUD_HTTP_MAX_IDLE_CONNS,
+    )
+    return InstrumentedClient(EcsClient(config), "aliyun", access_key_id)
+
+
+# 中心 Endpoint：配置的是它时才按 region 路由；自定义 Endpoint（代理 / VPC 内网域名等）原样使用
+CENTRAL_ECS_ENDPOINTS = {"", "ecs.aliyuncs.com"}
+
+
+def regional_endpoint(region_id: str) -> str:
+    override = settings.ALIYUN_ECS_ENDPOINT_OVERRIDES.get(region_id)
+    return override or settings.ALIYUN_ECS_ENDPOINT_TEMPLATE.format(region_id=region_id)
+
+
+class RegionalEcsClient:
+    """
+    按请求里的 region_id 把 API 调用路由到 ecs.<region>.aliyuncs.com，
+    避免查询青岛、海外等 region 时都绕道中心 Endpoint。
+    各 region 的 SDK 客户端懒创建并放进 cloud_client_pool；没有 region_id 的请求（如 DescribeRegions）走默认 Endpoint。
+    """
+
+    def __init__(self, access_key_id: str, access_key_secret: str, endpoint: Optional[str] = "ecs.aliyuncs.com"):
+        self._access_key_id = access_key_id
+        self._access_key_secret = access_key_secret
+        self._endpoint = endpoint or "ecs.aliyuncs.com"
+        self.regional = settings.ALIYUN_REGIONAL_ENDPOINTS and (endpoint or "") in CENTRAL_ECS_ENDPOINTS
+
+    def endpoint_for(self, region_id: Optional[str]) -> str:
+        if self.regional and region_id:
+            return regional_endpoint(region_id)
+        return self._endpoint
+
+    def client_for(self, region_id: Optional[str]) -> InstrumentedClient:
+        endpoint = self.endpoint_for(region_id)
+        key = cloud_client_pool.key("ecs", "aliyun", self._access_key_id, self._access_key_secret, endpoint)
+        return cloud_client_pool.get(
+            key, lambda: build_ecs_client(self._access_key_id, self._access_key_secret, endpoint)
+        )
+
+    def __getattr__(self, name):
+        if not name.startswith(InstrumentedClient.API_PREFIXES):
+            return getattr(self.client_for(None), name)
+
+        # 协程方法同样适用：返回的是被路由客户端方法的协程
+        def _routed(request, *args, **kwargs):
+            return getattr(self.client_for(getattr(request, "region_id", None)), name)(request, *args, **kwargs)
+
+        return _routed
+
+
 class AliyunClient(BaseCloudClient):
     """阿里云 ECS 客户端封装"""
 
     def __init__(self, access_key_id: str, access_key_secret: str, endpoint: str = "ecs.aliyuncs.com"):
-        cred_client = CredentialsManager.build_aliyun_client(access_key_id, access_key_secret)
-        config = CredentialsManager.build_aliyun_product_config(cred_client, endpoint)
-        self.client = EcsClient(config)
+        self.client = RegionalEcsClient(access_key_id, access_key_secret, endpoint)
 
     # --------------------------
     # 区域
@@ -152,22 +559,14 @@ class AliyunClient(BaseCloudClient):
     def list_regions(self) -> List[dict]:
         """获取阿里云区域列表"""
         request = ecs_models.DescribeRegionsRequest()
-        response = self.client.describe_regions(request)
-        return [
-            {"region_id": r.region_id, "region_name": r.local_name}
-            for r in response.body.regions.region
-        ]
+        return _parse_regions(self.client.describe_regions(request))
 
     # --------------------------
     # 可用区
     # --------------------------
     def list_zones(self, region_id: str) -> List[dict]:
         request = ecs_models.DescribeZonesRequest(region_id=region_id)
-        response = self.client.describe_zones(request)
-        return [
-            {"zone_id": z.zone_id, "zone_name": z.local_name}
-            for z in response.body.zones.zone
-        ]
+        return _parse_zones(self.client.describe_zones(request))
 
 
     # --------------------------
@@ -175,21 +574,18 @@ class AliyunClient(BaseCloudClient):
     # --------------------------
     def list_vpcs(self, region_id: str) -> List[dict]:
         """
-        获取指定 Region 下的 VPC 列表
+        获取指定 Region 下的 VPC 列表（自动翻页）
         :param region_id: 云区域 ID
         :return: VPC 列表，每个 VPC 字典包含 vpc_id、vpc_name、cidr_block 等
         """
-        request = ecs_models.DescribeVpcsRequest(region_id=region_id)
-        response = self.client.describe_vpcs(request)
-        return [
-            {
-                "vpc_id": v.vpc_id,
-                "vpc_name": v.vpc_name,
-                "cidr_block": v.cidr_block,
-                "is_default": v.is_default,
-            }
-            for v in response.body.vpcs.vpc
-        ]
+        return list(self.iter_vpcs(region_id))
+
+    def iter_vpcs(self, region_id: str) -> Iterator[dict]:
+        def fetch(page: int, page_size: int):
+            resp = self.client.describe_vpcs(_vpcs_request(region_id, page, page_size))
+            return _parse_vpcs(resp), _total_count(resp)
+
+        return paginate(fetch, VPC_PAGE_SIZE, settings.CLOUD_PAGE_CONCURRENCY)
 
     # --------------------------
     # 获取指定 VPC 下的子网列表
@@ -201,64 +597,30 @@ class AliyunClient(BaseCloudClient):
         :param vpc_id: VPC ID
         :return: 子网列表，每个字典包含 vswitch_id、vswitch_name、cidr_block、zone_id
         """
-        request = ecs_models.DescribeVSwitchesRequest(region_id=region_id, vpc_id=vpc_id)
-        response = self.client.describe_vswitches(request)
-        vswitch_list = getattr(response.body.vswitches, "vswitch", []) or []
-        return [
-            {
-                "vswitch_id": v.vswitch_id,
-                "vswitch_name": v.vswitch_name,
-                "cidr_block": v.cidr_block,
-                "zone_id": v.zone_id,
-            }
-            for v in vswitch_list
-        ]
+        return list(self.iter_vswitches(region_id, vpc_id))
+
+    def iter_vswitches(self, region_id: str, vpc_id: str) -> Iterator[dict]:
+        def fetch(page: int, page_size: int):
+            resp = self.client.describe_vswitches(_vswitches_request(region_id, vpc_id, page, page_size))
+            return _parse_vswitches(resp), _total_count(resp)
+
+        return paginate(fetch, VSWITCH_PAGE_SIZE, settings.CLOUD_PAGE_CONCURRENCY)
 
     # -----------------------------------------------------------
     # 获取安全组列表（分页）
     # -----------------------------------------------------------
     def list_security_groups(self, region_id: Optional[str] = None, vpc_id: Optional[str] = None, page: int = 1, page_size: int = 50):
-        # ---- 正确：构建阿里云 Request 对象 ----
-        req = ecs_models.DescribeSecurityGroupsRequest(
-            region_id=region_id,
-            vpc_id=vpc_id,
-            page_number=page,
-            page_size=page_size,
-        )
+        req = _security_groups_request(region_id, vpc_id, page, page_size)
         # ---- 正确：不再传 dict ----
-        resp = self.client.describe_security_groups(req)
+        return _parse_security_groups(self.client.describe_security_groups(req))
 
-        # ---- 阿里云返回是 TeaModel，应转成 dict ----
-        resp_dict = resp.to_map() if hasattr(resp, "to_map") else resp
-
-        items = []
-        total = 0
-
-        try:
-            # 适配阿里云 ECS 返回结构
-            gs = (
-                resp_dict.get("body", {})
-                .get("SecurityGroups", {})
-                .get("SecurityGroup", [])
-            )
+    def iter_security_groups(self, region_id: Optional[str] = None, vpc_id: Optional[str] = None, page_size: int = SECURITY_GROUP_PAGE_SIZE) -> Iterator[dict]:
+        """逐条返回安全组，剩余页并发拉取"""
+        def fetch(page: int, size: int):
+            resp = self.list_security_groups(region_id, vpc_id, page, size)
+            return resp["items"], resp["total"]
 
-            total = (
-                resp_dict.get("body", {}).get("TotalCount", len(gs))
-            )
-
-            for g in gs:
-                items.append({
-                    "SecurityGroupId": g.get("SecurityGroupId"),
-                    "SecurityGroupName": g.get("SecurityGroupName"),
-                    "Description": g.get("Description"),
-                    "VpcId": g.get("VpcId"),
-                    "ResourceGroupId": g.get("ResourceGroupId"),
-                })
-
-        except Exception as e:
-            print("Parse SecurityGroup Error:", e)
-
-        return {"total": total, "items": items}
+        return paginate(fetch, page_size, settings.CLOUD_PAGE_CONCURRENCY)
 
 
     # --------------------------
@@ -269,22 +631,7 @@ class AliyunClient(BaseCloudClient):
             region_id=region_id,
             security_group_id=security_group_id
         )
-        resp = self.client.describe_security_group_attribute(req)
-        perms = resp.body.permissions.permission or []
-
-        rules = []
-        for p in perms:
-            rules.append({
-                "direction": p.direction,                  # inbound / outbound
-                "protocol_code": p.ip_protocol,            # TCP/UDP/ALL
-                "port_range": p.port_range,                # 80/80
-                "policy_code": p.policy,                   # accept/ drop
-                "source": p.source_cidr_ip or p.dest_cidr_ip,  # 可能在 Source 或 Dest
-                "description": p.description,
-                "cloud_rule_id": p.security_group_rule_id,
-            })
-
-        return rules
+        return _parse_security_group_rules(self.client.describe_security_group_attribute(req))
 
     # --------------------------
     # ECS 镜像
@@ -294,24 +641,14 @@ class AliyunClient(BaseCloudClient):
         instance_type_id: str = None,
         architecture: str = None,
         ) -> List[dict]:
-        request = ecs_models.DescribeImagesRequest(
-            region_id=region_id,
-            instance_type=instance_type_id,
-            architecture=architecture,
-            image_owner_alias="system",
-            status="Available"
-        )
-        response = self.client.describe_images(request)
-        images = response.body.images.image or []
-        return [
-            {
-                "image_id": i.image_id,
-                "image_name": i.image_name,
-            }
-            for i in images
-        ]
-
-    from typing import List, Optional
+        return list(self.iter_images(region_id, instance_type_id, architecture))
+
+    def iter_images(self, region_id: Optional[str] = None, instance_type_id: str = None, architecture: str = None) -> Iterator[dict]:
+        def fetch(page: int, page_size: int):
+            resp = self.client.describe_images(_images_request(region_id, instance_type_id, architecture, page, page_size))
+            return _parse_images(resp), _total_count(resp)
+
+        return paginate(fetch, IMAGE_PAGE_SIZE, settings.CLOUD_PAGE_CONCURRENCY)
 
     # --------------------------
     # 系统盘种类
@@ -326,32 +663,8 @@ class AliyunClient(BaseCloudClient):
         """
         查询某个规格可用的系统盘种类
         """
-        # ECS 提供的接口是 DescribeAvailableResource 或者 DescribeDiskCategoriesRequest
-        request = ecs_models.DescribeAvailableResourceRequest(
-            region_id=region_id,
-            zone_id=zone_id,
-            instance_type=instance_type_id,
-            instance_charge_type=instance_charge_type,
-            destination_resource="SystemDisk",
-        )
-
-        response = self.client.describe_available_resource(request)
-
-        # 提取可用区数据
-        available_zones = getattr(response.body.available_zones, "available_zone", []) or []
-
-        # 由于我们只指定了 zone_id，一般只有一个元素
-        if not available_zones:
-            return []
-
-        supported_resources = (
-            available_zones[0]
-            .available_resources.available_resource[0]
-            .supported_resources.supported_resource
-        )
-
-        # 返回磁盘种类列表（Value 字段）
-        return [res.value for res in supported_resources if res.status == "Available"]
+        request = _system_disk_request(region_id, zone_id, instance_type_id, instance_charge_type)
+        return _parse_system_disk_categories(self.client.describe_available_resource(request))
 
     # --------------------------
     # 实例规格（实例类型）     region_id: str, min_cpu: int = 1, min_memory: int = 1, architecture: str = "x86_64", bare_metal: bool = False
@@ -361,121 +674,7 @@ class AliyunClient(BaseCloudClient):
         # 1. 调用 DescribeInstanceTypes 获取全量规格详情
         # -------------------------------
         request = ecs_models.DescribeInstanceTypesRequest()
-        response = self.client.describe_instance_types(request)
-
-        items = response.body.instance_types.instance_type  # list
-
-        # 如果 items 为空，打印调试信息（可删除）
-        if not items:
-            # 帮助定位 SDK 返回结构
-            try:
-                print("DEBUG: response attrs:", dir(response)[:200])
-                if hasattr(response, "body"):
-                    print("DEBUG: body attrs:", dir(response.body)[:200])
-                    if hasattr(response.body, "instance_types"):
-                        print("DEBUG: instance_types attrs:", dir(response.body.instance_types)[:200])
-                # 如果有 to_map/to_dict，打印 keys
-                if hasattr(response, "to_map"):
-                    print("DEBUG: response.to_map() keys:", list(response.to_map().keys()))
-                if hasattr(response, "to_dict"):
-                    print("DEBUG: response.to_dict() keys:", list(response.to_dict().keys()))
-            except Exception as e:
-                print("DEBUG: failed to inspect response:", e)
-
-            return []
-
-        results: List[dict] = []
-        for it in items:
-            # 下面用 _get_attr_any 去兼容不同命名方式
-            it_id = _get_attr_any(it, "InstanceTypeId", "instance_type_id", "instanceTypeId")
-            instance_family = _get_attr_any(it, "InstanceTypeFamily", "instance_family", "instanceFamily")
-            # 代次尝试从 instance_family 提取，例如 ecs.g7 -> g7
-            generation = None
-            if instance_family:
-                try:
-                    # instance_family 可能是 'ecs.g7' 或 'g7'
-                    if "." in instance_family:
-                        generation = instance_family.split(".")[-1]
-                    else:
-                        generation = instance_family
-                except Exception:
-                    generation = None
-            # logger.info(f'看下这个都有哪些字段 {it}')
-            cpu = _get_attr_any(it, "CpuCoreCount", "cpu_core_count", "cpuCount", "vcpu")
-            mem = _get_attr_any(it, "MemorySize", "memory_size", "memorySize")
-            arch = _get_attr_any(it, "CpuArchitecture", "cpu_architecture", "architecture")
-
-            gpu_amount = _get_attr_any(it, "GPUAmount", "gpu_amount", "gpuAmount")
-            gpu_spec = _get_attr_any(it, "GPUSpec", "gpu_spec", "gpuSpec")
-            gpu_mem = _get_attr_any(it, "GPUMemorySize", "gpu_memory_size", "gpuMemorySize")
-
-            local_amount = _get_attr_any(it, "LocalStorageAmount", "local_storage_amount", 'localStorageAmount')
-            local_capacity = _get_attr_any(it, "LocalStorageCapacity", "local_storage_capacity", 'localStorageCapacity')
-
-            network_perf = _get_attr_any(it, "NetworkInfo", "NetworkPerformance", "network_performance", "networkPerformance")
-            # 如果 network_perf 是复杂对象，需要序列化成字符串
-            if network_perf and not isinstance(network_perf, (str, int, float)):
-                try:
-                    # 如果它是 SDK 对象，尝试 to_map / to_dict
-                    if hasattr(network_perf, "to_map"):
-                        network_perf = str(network_perf.to_map())
-                    elif hasattr(network_perf, "to_dict"):
-                        network_perf = str(network_perf.to_dict())
-                    else:
-                        network_perf = str(network_perf)
-                except Exception:
-                    network_perf = str(network_perf)
-
-            # 过滤条件：最低 cpu / memory / architecture / bare_metal（示例）
-            # try:
-            #     if cpu is None:
-            #         cpu_val = 0
-            #     else:
-            #         cpu_val = int(cpu)
-            # except Exception:
-            #     cpu_val = 0
-            #
-            # try:
-            #     mem_val = float(mem) if mem is not None else 0.0
-            # except Exception:
-            #     mem_val = 0.0
-            #
-            # if cpu_val < min_cpu:
-            #     continue
-            # if mem_val < min_memory:
-            #     continue
-            # # architecture 简单匹配（x86_64 -> x86）
-            # if architecture and arch:
-            #     if architecture.lower().startswith("x86") and not str(arch).lower().startswith("x86"):
-            #         continue
-            #     if architecture.lower().startswith("arm") and not str(arch).lower().startswith("arm"):
-            #         continue
-            # # bare_metal 判断：根据 instance_family 或 generation 中是否包含 'ebm' / 'bare' 等关键字
-            # if bare_metal:
-            #     fam = (instance_family or "").lower()
-            #     gen = (generation or "").lower()
-            #     if ("ebm" not in fam) and ("bare" not in fam) and ("ebm" not in gen) and ("bare" not in gen):
-            #         continue
-
-            results.append({
-                "instance_type_id": it_id,
-                "instance_family": instance_family,
-                "generation": generation,
-                "cpu_core_count": cpu,
-                "memory_size": mem,
-                "architecture": arch,
-                "gpu_amount": int(gpu_amount) if gpu_amount is not None else 0,
-                "gpu_spec": gpu_spec,
-                "gpu_memory": float(gpu_mem) if gpu_mem is not None else None,
-                "local_storage_amount": int(local_amount) if local_amount is not None else None,
-                "local_storage_capacity": int(local_capacity) if local_capacity is not None else None,
-                "network_performance": network_perf,
-                "is_io_optimized": True,
-                "price": None,
-                "cloud_provider_code": provider_code
-            })
-
-        return results
+        return _parse_instance_types(self.client.describe_instance_types(request), provider_code)
 
     # --------------------------
     # ecs 可用资源查询
@@ -491,49 +690,8 @@ class AliyunClient(BaseCloudClient):
             instance_charge_type: str = None,
             system_disk_category: str = None,
             ):
-        request = ecs_models.DescribeAvailableResourceRequest(
-            region_id=region_id,
-            zone_id=zone_id,
-            destination_resource="InstanceType",
-            resource_type="instance",
-            instance_charge_type=instance_charge_type or "PrePaid",
-            system_disk_category=system_disk_category or "cloud_essd",
-        )
-        available_types = []
-
-        response = self.client.describe_available_resource(request)
-        body = response.body
-        if body:
-            available_zones = body.available_zones.available_zone or []
-
-            # 遍历可用区列表
-            if not isinstance(available_zones, list):
-                available_zones = [available_zones]
-
-            for az in available_zones:
-                az_id = az.zone_id
-                resources = az.available_resources.available_resource or []
-                if not isinstance(resources, list):
-                    resources = [resources]
-
-                for resource in resources:
-                    supported_resources = resource.supported_resources.supported_resource or []
-                    if not isinstance(supported_resources, list):
-                        supported_resources = [supported_resources]
-
-                    for inst in supported_resources:
-                        # 是否售罄 (Sold out), 库存充足(WithStock”), 库存不算充足(ClosedWithStock),当前售罄，但“将来会补货”(WithoutStock),售罄且不会补货 / 资源彻底不可用(ClosedWithoutStock)
-
-                        available_types.append({
-                            "instance_type_id": inst.value,
-                            "status": inst.status,
-                            "status_category": inst.status_category,
-                            "zone_id": az_id,
-                            # "max_available": getattr(inst, "max", None),
-                            # "unit": getattr(inst, "unit", None),
-                        })
-
-        return available_types
+        request = _available_resource_request(region_id, zone_id, instance_charge_type, system_disk_category)
+        return _parse_available_instance_types(self.client.describe_available_resource(request))
 
     # --------------------------
     # 获取 ECS 可选计费方式
@@ -546,34 +704,8 @@ class AliyunClient(BaseCloudClient):
         system_disk_category: str = None,
         period: int = 1,
     ):
-        req = ecs_models.DescribePriceRequest(
-            region_id=region_id,
-            instance_type=instance_type,
-            # system_disk_category=system_disk_category or "cloud_essd",
-        )
-
-        if instance_charge_type == "PostPaid":  # 按量
-            req.price_unit = "Hour"
-        elif instance_charge_type == "PrePaid":  # 包年包月
-            req.price_unit = "Month"
-            req.period = period
-            req.period_unit = "Month"
-        elif instance_charge_type == "Spot":  # 抢占式
-            req.price_unit = "Hour"
-            req.spot_strategy = "SpotAsPriceGo"
-
-        req.system_disk = ecs_models.DescribePriceRequestSystemDisk(
-            category=system_disk_category
-        )
-
-        resp = self.client.describe_price(req)
-
-        detail_infos = resp.body.price_info.price.detail_infos.detail_info
-
-        # 只取实例 + 系统盘价格
-        prices = {item.resource: item.trade_price for item in detail_infos}
-        normalized = {k.lower(): v for k, v in prices.items()}
-        return normalized
+        req = _price_request(region_id, instance_type, instance_charge_type, system_disk_category, period)
+        return _parse_price(self.client.describe_price(req))
 
 
 class AliyunClientFactory:
@@ -1,4 +1,4 @@
-from typing import List, Dict, Optional
+from typing import Iterator, List, Dict, Optional
 
 
 class BaseCloudClient:
@@ -22,6 +22,10 @@ class BaseCloudClient:
     def list_security_groups(self, region_id: Optional[str] = None, vpc_id: Optional[str] = None, page: int = 1, page_size: int = 50):
         raise NotImplementedError
 
+    # 逐条获取安全组（自动翻页）
+    def iter_security_groups(self, region_id: Optional[str] = None, vpc_id: Optional[str] = None, page_size: int = 50) -> Iterator[Dict]:
+        raise NotImplementedError
+
     # 获取安全组配置
     def list_security_group_rules(self, region_id: str, security_group_id: str):
         raise NotImplementedError
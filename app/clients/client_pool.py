@@ -0,0 +1,72 @@
+# app/clients/client_pool.py
+import hashlib
+import threading
+from typing import Any, Callable, Dict, Optional
+
+from app.common.cache import LRUTTLCache
+from app.core.config import settings
+from app.core.logger import logger
+
+
+def _secret_digest(access_key_secret: str) -> str:
+    """key 里只放密钥摘要，轮换密钥后自然落到新 key 上"""
+    return hashlib.sha256((access_key_secret or "").encode()).hexdigest()[:16]
+
+
+class CloudClientPool:
+    """
+    云客户端池：按 (类别, provider, access_key_id, 密钥摘要, endpoint) 复用客户端。
+    - LRU + TTL 淘汰（LRUTTLCache），长期不用或过期的客户端会被重建
+    - 同一个 key 只构造一次：按 key 加锁，不同 key 可以并发构造
+    """
+
+    def __init__(self, max_entries: int, ttl: float):
+        self.ttl = ttl
+        self._clients = LRUTTLCache(max_entries)
+        self._build_locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(kind: str, provider_code: str, access_key_id: str, access_key_secret: str,
+            endpoint: Optional[str]) -> str:
+        return f"{kind}:{provider_code}:{access_key_id}:{_secret_digest(access_key_secret)}:{endpoint or ''}"
+
+    def get(self, key: str, build: Callable[[], Any]) -> Any:
+        client = self._clients.get(key)
+        if client is not None:
+            return client
+
+        with self._lock:
+            build_lock = self._build_locks.setdefault(key, threading.Lock())
+        with build_lock:
+            client = self._clients.get(key)
+            if client is None:
+                client = build()
+                self._clients.set(key, client, self.ttl)
+                kind, provider_code, _, _, endpoint = key.split(":", 4)
+                logger.info("cloud client created: %s %s %s", kind, provider_code, endpoint)
+        with self._lock:
+            self._build_locks.pop(key, None)
+        return client
+
+    def invalidate(self, provider_code: str, access_key_id: Optional[str] = None) -> int:
+        """凭证更新 / 删除后丢弃旧客户端；不传 access_key_id 时丢弃该厂商全部客户端"""
+        removed = 0
+        for kind in ("sync", "async", "ecs"):
+            prefix = f"{kind}:{provider_code}:"
+            if access_key_id is not None:
+                prefix += f"{access_key_id}:"
+            removed += self._clients.delete_prefix(prefix)
+        return removed
+
+    def clear(self) -> None:
+        self._clients.clear()
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+
+cloud_client_pool = CloudClientPool(
+    max_entries=settings.CLOUD_CLIENT_POOL_MAX_ENTRIES,
+    ttl=settings.CLOUD_CLIENT_POOL_TTL_SECONDS,
+)
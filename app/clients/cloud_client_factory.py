@@ -1,24 +1,31 @@
 # app/clients/cloud_client_factory.py
-from app.clients.aliyun_client import AliyunClientFactory, AliyunClient
-
 # from app.clients.tencent_client import TencentClientFactory
+from app.clients.client_pool import cloud_client_pool
 
-"""多云客户端工厂"""
+"""多云客户端工厂：客户端从 cloud_client_pool 复用，密钥或 endpoint 变化时自动换新客户端"""
 class CloudClientFactory:
-    _cache = {}
 
     @staticmethod
     def create_client(provider_code: str, access_key_id: str, access_key_secret: str, endpoint: str):
-        cache_key = f"{provider_code}:{access_key_id}"
-        if cache_key in CloudClientFactory._cache:
-            return CloudClientFactory._cache[cache_key]
+        def build():
+            if provider_code == "aliyun":
+                # SDK 体积大，真正创建客户端时才导入
+                from app.clients.aliyun_client import AliyunClientFactory
+                return AliyunClientFactory.create_client(access_key_id, access_key_secret, endpoint)
+            # elif provider_code == "tencentcloud":
+            #     return TencentClientFactory.create_client(access_key_id, access_key_secret, endpoint)
+            raise ValueError(f"Unsupported cloud provider: {provider_code}")
 
-        if provider_code == "aliyun":
-            client = AliyunClientFactory.create_client(access_key_id, access_key_secret, endpoint)
-        # elif provider_code == "tencentcloud":
-        #     client = TencentClientFactory.create_client(access_key_id, access_key_secret, endpoint)
-        else:
+        key = cloud_client_pool.key("sync", provider_code, access_key_id, access_key_secret, endpoint)
+        return cloud_client_pool.get(key, build)
+
+    @staticmethod
+    def create_async_client(provider_code: str, access_key_id: str, access_key_secret: str, endpoint: str):
+        def build():
+            if provider_code == "aliyun":
+                from app.clients.aliyun_async_client import AsyncAliyunClientFactory
+                return AsyncAliyunClientFactory.create_client(access_key_id, access_key_secret, endpoint)
             raise ValueError(f"Unsupported cloud provider: {provider_code}")
 
-        CloudClientFactory._cache[cache_key] = client
-        return client
\ No newline at end of file
+        key = cloud_client_pool.key("async", provider_code, access_key_id, access_key_secret, endpoint)
+        return cloud_client_pool.get(key, build)
@@ -0,0 +1,81 @@
+# app/clients/instrumented.py
+import asyncio
+import inspect
+import re
+import time
+from functools import wraps
+
+from app.clients.rate_limiter import cloud_rate_limiter, is_throttled, max_wait, throttle_backoff
+from app.core.config import settings
+from app.core.metrics import observe_cloud
+
+
+def _action_name(method: str) -> str:
+    """describe_available_resource(_async) -> DescribeAvailableResource"""
+    method = re.sub(r"(_with_options)?(_async)?$", "", method)
+    return "".join(p.capitalize() for p in method.split("_"))
+
+
+class InstrumentedClient:
+    """
+    SDK 客户端代理：对 describe_* / create_* 等 API 方法计时，按 (provider, action, outcome) 记录，
+    同步、异步（*_async）方法都支持；其余属性透传。
+    每次调用先经过 (provider, access_key_id, action) 的令牌桶 + AIMD 并发控制，
+    被云端限流时收缩并发并按退避重试 CLOUD_THROTTLE_RETRIES 次。
+    """
+
+    API_PREFIXES = ("describe_", "create_", "delete_", "modify_", "authorize_", "revoke_", "run_", "start_", "stop_")
+
+    def __init__(self, client, provider_code: str, access_key_id: str = ""):
+        self._client = client
+        self._provider_code = provider_code
+        self._access_key_id = access_key_id
+
+    def __getattr__(self, name):
+        attr = getattr(self._client, name)
+        if not callable(attr) or not name.startswith(self.API_PREFIXES):
+            return attr
+
+        action = _action_name(name)
+        provider_code = self._provider_code
+        limiter = cloud_rate_limiter.get(provider_code, self._access_key_id, action)
+        retries = settings.CLOUD_THROTTLE_RETRIES
+
+        if inspect.iscoroutinefunction(attr):
+            @wraps(attr)
+            async def _timed_async(*args, **kwargs):
+                for attempt in range(retries + 1):
+                    await limiter.acquire_async(max_wait())
+                    start = time.perf_counter()
+                    error = None
+                    try:
+                        return await attr(*args, **kwargs)
+                    except Exception as e:
+                        error = e
+                        if attempt == retries or not is_throttled(e):
+                            raise
+                    finally:
+                        observe_cloud(provider_code, action, time.perf_counter() - start, error is None)
+                        limiter.release(error)
+                    await asyncio.sleep(throttle_backoff(attempt))
+
+            return _timed_async
+
+        @wraps(attr)
+        def _timed(*args, **kwargs):
+            for attempt in range(retries + 1):
+                limiter.acquire(max_wait())
+                start = time.perf_counter()
+                error = None
+                try:
+                    return attr(*args, **kwargs)
+                except Exception as e:
+                    error = e
+                    if attempt == retries or not is_throttled(e):
+                        raise
+                finally:
+                    observe_cloud(provider_code, action, time.perf_counter() - start, error is None)
+                    limiter.release(error)
+                time.sleep(throttle_backoff(attempt))
+
+        return _timed
@@ -0,0 +1,90 @@
+# app/clients/paginator.py
+import asyncio
+import contextvars
+import math
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import AsyncIterator, Awaitable, Callable, Iterable, Iterator, List, Tuple, TypeVar
+
+T = TypeVar("T")
+
+# fetch_page(page_number, page_size) -> (当前页数据, TotalCount)
+PageFetcher = Callable[[int, int], Tuple[List[T], int]]
+AsyncPageFetcher = Callable[[int, int], Awaitable[Tuple[List[T], int]]]
+
+
+def _page_count(total: int, page_size: int) -> int:
+    return math.ceil(total / page_size) if total and page_size else 1
+
+
+def paginate(fetch_page: PageFetcher, page_size: int, max_workers: int = 4) -> Iterator[T]:
+    """
+    通用分页器：先取第 1 页拿到 TotalCount，剩余页用有界线程池并发拉取，
+    按页码顺序逐条 yield，调用方可以边取边写库。
+    同一时刻最多 max_workers 页在途，内存占用与总数无关。
+    """
+    items, total = fetch_page(1, page_size)
+    yield from items
+
+    pages = _page_count(total, page_size)
+    if pages <= 1 or not items:
+        return
+
+    next_pages = iter(range(2, pages + 1))
+    workers = max(1, min(max_workers, pages - 1))
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="page")
+    window = deque()
+
+    def submit(page: int):
+        # 每页各自复制一份调用方的 contextvars（同一个 Context 不能被多个线程同时 run）
+        return executor.submit(contextvars.copy_context().run, fetch_page, page, page_size)
+
+    try:
+        for page in islice(next_pages, workers):
+            window.append(submit(page))
+        while window:
+            page_items, _ = window.popleft().result()
+            # 窗口向前滑动一页，保持并发度
+            for page in islice(next_pages, 1):
+                window.append(submit(page))
+            yield from page_items
+    finally:
+        # 调用方提前停止迭代时，不再发起剩余页
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+async def paginate_async(fetch_page: AsyncPageFetcher, page_size: int, max_concurrency: int = 4) -> AsyncIterator[T]:
+    """paginate 的协程版本，并发度由在途任务数控制"""
+    items, total = await fetch_page(1, page_size)
+    for item in items:
+        yield item
+
+    pages = _page_count(total, page_size)
+    if pages <= 1 or not items:
+        return
+
+    next_pages = iter(range(2, pages + 1))
+    window = deque()
+    try:
+        for page in islice(next_pages, max(1, max_concurrency)):
+            window.append(asyncio.ensure_future(fetch_page(page, page_size)))
+        while window:
+            page_items, _ = await window.popleft()
+            for page in islice(next_pages, 1):
+                window.append(asyncio.ensure_future(fetch_page(page, page_size)))
+            for item in page_items:
+                yield item
+    finally:
+        for task in window:
+            task.cancel()
+
+
+def chunked(iterable: Iterable[T], size: int) -> Iterator[List[T]]:
+    """把生成器切成固定大小的批次，用于流式写库"""
+    it = iter(iterable)
+    while True:
+        batch = list(islice(it, size))
+        if not batch:
+            return
+        yield batch
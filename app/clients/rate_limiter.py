@@ -0,0 +1,211 @@
+# app/clients/rate_limiter.py
+import asyncio
+import random
+import threading
+import time
+from contextvars import ContextVar
+from typing import Dict, Optional, Tuple
+
+from app.core.config import settings
+from app.core.logger import logger
+from app.core.metrics import Counter, registry
+
+# (provider_code, access_key_id, action)
+LimiterKey = Tuple[str, str, str]
+
+CLOUD_API_THROTTLED = registry.register(Counter(
+    "cloud_api_throttled_total", "Cloud SDK calls rejected by provider throttling", ("provider", "action")))
+CLOUD_API_RATE_LIMITED = registry.register(Counter(
+    "cloud_api_rate_limited_total", "Cloud SDK calls rejected locally after waiting too long for a slot",
+    ("provider", "action")))
+
+
+class RateLimitExceeded(RuntimeError):
+    """本地限流：在 CLOUD_RATE_LIMIT_MAX_WAIT_SECONDS（或调用方截止时间）内拿不到令牌 / 并发名额"""
+
+
+# 调用方的截止时间（time.monotonic()）：本地排队不会等过它，调用方自己的超时先到时直接本地拒绝
+call_deadline: ContextVar[Optional[float]] = ContextVar("cloud_call_deadline", default=None)
+
+
+def max_wait() -> float:
+    """本次调用最多排队多久：CLOUD_RATE_LIMIT_MAX_WAIT_SECONDS 与调用方剩余时间取小"""
+    wait = settings.CLOUD_RATE_LIMIT_MAX_WAIT_SECONDS
+    deadline = call_deadline.get()
+    if deadline is not None:
+        wait = min(wait, deadline - time.monotonic())
+    return max(0.0, wait)
+
+
+def is_throttled(exc: BaseException) -> bool:
+    """阿里云限流错误码：Throttling / Throttling.User / Throttling.Api 等"""
+    code = getattr(exc, "code", None)
+    return isinstance(code, str) and code.startswith("Throttling")
+
+
+class TokenBucket:
+    """
+    令牌桶：按 rate 个/秒补充，最多 burst 个。
+    acquire 采用预约方式——令牌可以透支，返回调用方需要等待的秒数，同步 / 异步调用方各自 sleep。
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, max_wait: float) -> Optional[float]:
+        """预约一个令牌，返回需等待的秒数；超过 max_wait 时不预约并返回 None"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            wait = 0.0 if self._tokens >= 1 else (1 - self._tokens) / self.rate
+            if wait > max_wait:
+                return None
+            self._tokens -= 1
+            return wait
+
+
+class AimdLimiter:
+    """
+    AIMD 并发控制：每次成功把并发上限加 1/limit（约每一轮加 1），
+    遇到限流乘以 decrease；一个冷却期内多次限流只收缩一次，避免同一批请求把上限压到底。
+    """
+
+    def __init__(self, min_limit: int, max_limit: int, decrease: float = 0.5, cooldown: float = 1.0):
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.decrease = decrease
+        self.cooldown = cooldown
+        self.limit = float(max_limit)
+        self.inflight = 0
+        self._decreased_at = 0.0
+        self._cond = threading.Condition()
+
+    def try_acquire(self) -> bool:
+        with self._cond:
+            if self.inflight < int(self.limit):
+                self.inflight += 1
+                return True
+            return False
+
+    def acquire(self, timeout: float) -> bool:
+        with self._cond:
+            if not self._cond.wait_for(lambda: self.inflight < int(self.limit), timeout):
+                return False
+            self.inflight += 1
+            return True
+
+    def release(self, throttled: bool) -> None:
+        with self._cond:
+            self.inflight -= 1
+            if throttled:
+                now = time.monotonic()
+                if now - self._decreased_at >= self.cooldown:
+                    self._decreased_at = now
+                    self.limit = max(self.min_limit, self.limit * self.decrease)
+            else:
+                self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+            self._cond.notify_all()
+
+
+class ActionLimiter:
+    """单个 (provider, access_key_id, action) 的令牌桶 + 并发控制"""
+
+    def __init__(self, key: LimiterKey, rate: float, burst: int, min_concurrency: int, max_concurrency: int):
+        self.key = key
+        self.bucket = TokenBucket(rate, burst)
+        self.concurrency = AimdLimiter(min_concurrency, max_concurrency)
+
+    def _rejected(self, reason: str) -> RateLimitExceeded:
+        provider_code, _, action = self.key
+        CLOUD_API_RATE_LIMITED.inc(provider_code, action)
+        return RateLimitExceeded(f"{provider_code} {action}: {reason}")
+
+    def acquire(self, max_wait: float) -> None:
+        deadline = time.monotonic() + max_wait
+        wait = self.bucket.reserve(max_wait)
+        if wait is None:
+            raise self._rejected("rate limit")
+        if wait:
+            time.sleep(wait)
+        if not self.concurrency.acquire(max(0.0, deadline - time.monotonic())):
+            raise self._rejected("concurrency limit")
+
+    async def acquire_async(self, max_wait: float) -> None:
+        deadline = time.monotonic() + max_wait
+        wait = self.bucket.reserve(max_wait)
+        if wait is None:
+            raise self._rejected("rate limit")
+        if wait:
+            await asyncio.sleep(wait)
+        # Condition 会阻塞事件循环，协程侧轮询非阻塞的 try_acquire
+        while not self.concurrency.try_acquire():
+            if time.monotonic() >= deadline:
+                raise self._rejected("concurrency limit")
+            await asyncio.sleep(0.02)
+
+    def release(self, exc: Optional[BaseException]) -> bool:
+        """释放并发名额，返回本次调用是否被云端限流"""
+        throttled = exc is not None and is_throttled(exc)
+        self.concurrency.release(throttled)
+        if throttled:
+            provider_code, _, action = self.key
+            CLOUD_API_THROTTLED.inc(provider_code, action)
+            logger.warning("%s %s throttled, concurrency limit now %.1f",
+                           provider_code, action, self.concurrency.limit)
+        return throttled
+
+
+class CloudRateLimiter:
+    """所有云客户端共享的限流器注册表，按 (provider, access_key_id, action) 懒创建"""
+
+    def __init__(self):
+        self._limiters: Dict[LimiterKey, ActionLimiter] = {}
+        self._lock = threading.Lock()
+
+    def get(self, provider_code: str, access_key_id: str, action: str) -> ActionLimiter:
+        key = (provider_code, access_key_id, action)
+        limiter = self._limiters.get(key)
+        if limiter is not None:
+            return limiter
+        with self._lock:
+            limiter = self._limiters.get(key)
+            if limiter is None:
+                rate = settings.CLOUD_RATE_LIMIT_ACTION_QPS.get(action, settings.CLOUD_RATE_LIMIT_QPS)
+                limiter = self._limiters[key] = ActionLimiter(
+                    key,
+                    rate=rate,
+                    burst=max(1, int(rate)),
+                    min_concurrency=settings.CLOUD_CONCURRENCY_MIN,
+                    max_concurrency=settings.CLOUD_CONCURRENCY_MAX,
+                )
+            return limiter
+
+    def collect(self):
+        """/metrics 渲染时输出各 action 的并发上限与在途数（多个账号求和，不暴露 access_key_id）"""
+        totals: Dict[Tuple[str, str], list] = {}
+        for (provider_code, _, action), limiter in list(self._limiters.items()):
+            total = totals.setdefault((provider_code, action), [0.0, 0])
+            total[0] += limiter.concurrency.limit
+            total[1] += limiter.concurrency.inflight
+        lines = ["# TYPE cloud_api_concurrency_limit gauge"]
+        lines.extend(f'cloud_api_concurrency_limit{{provider="{p}",action="{a}"}} {t[0]:.2f}'
+                     for (p, a), t in totals.items())
+        lines.append("# TYPE cloud_api_in_flight gauge")
+        lines.extend(f'cloud_api_in_flight{{provider="{p}",action="{a}"}} {t[1]}'
+                     for (p, a), t in totals.items())
+        return lines
+
+
+def throttle_backoff(attempt: int) -> float:
+    """被限流后重试前的等待：指数退避 + 抖动"""
+    base = settings.CLOUD_THROTTLE_BACKOFF_SECONDS * (2 ** attempt)
+    return base + random.uniform(0, base)
+
+
+cloud_rate_limiter = CloudRateLimiter()
+registry.add_collector(cloud_rate_limiter.collect)
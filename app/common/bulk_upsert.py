@@ -0,0 +1,130 @@
+# app/common/bulk_upsert.py
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Type
+
+from sqlalchemy import tuple_
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.orm import Session
+
+DEFAULT_CHUNK_SIZE = 500
+
+
+@dataclass
+class UpsertResult:
+    """批量 upsert 的统计结果"""
+    inserted: int = 0
+    updated: int = 0
+    unchanged: int = 0
+
+    @property
+    def total(self) -> int:
+        return self.inserted + self.updated + self.unchanged
+
+
+def _chunks(items: Sequence[Any], size: int) -> Iterable[Sequence[Any]]:
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def _same_value(old: Any, new: Any) -> bool:
+    """比较库中值与云端值是否一致（DECIMAL / FLOAT 按数值比较）"""
+    if old is None or new is None:
+        return old is None and new is None
+    numeric = (int, float, Decimal)
+    if isinstance(old, numeric) and isinstance(new, numeric):
+        return float(old) == float(new)
+    return old == new
+
+
+def _prefetch_existing(
+    db: Session,
+    model: Type[Any],
+    key_fields: Sequence[str],
+    fetch_fields: Sequence[str],
+    keys: List[Tuple],
+    scope: Optional[Dict[str, Any]],
+    chunk_size: int,
+) -> Dict[Tuple, Dict[str, Any]]:
+    """按业务键一次性（按 chunk）取出已存在行，返回 {key: {field: value}}"""
+    key_cols = [getattr(model, f) for f in key_fields]
+    fetch_cols = [getattr(model, f) for f in fetch_fields]
+    existing: Dict[Tuple, Dict[str, Any]] = {}
+
+    for chunk in _chunks(keys, chunk_size):
+        query = db.query(*key_cols, *fetch_cols)
+        if scope:
+            query = query.filter_by(**scope)
+        if len(key_cols) == 1:
+            query = query.filter(key_cols[0].in_([k[0] for k in chunk]))
+        else:
+            query = query.filter(tuple_(*key_cols).in_(chunk))
+
+        for row in query.all():
+            values = tuple(row)
+            key = values[:len(key_fields)]
+            existing[key] = dict(zip(fetch_fields, values[len(key_fields):]))
+    return existing
+
+
+def bulk_upsert(
+    db: Session,
+    model: Type[Any],
+    rows: List[Dict[str, Any]],
+    key_fields: Sequence[str],
+    update_fields: Sequence[str],
+    scope: Optional[Dict[str, Any]] = None,
+    coalesce_fields: Sequence[str] = (),
+    touch_fields: Sequence[str] = ("updated_at",),
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> UpsertResult:
+    """
+    基于集合的批量插入或更新（MySQL INSERT ... ON DUPLICATE KEY UPDATE）
+    :param model: ORM 模型，key_fields 必须命中该表的唯一索引
+    :param rows: 待写入的行，所有行字段需一致（包含插入时需要的全部列）
+    :param key_fields: 业务唯一键，例如 ("provider_code", "region_id")
+    :param update_fields: 已存在时需要比较并更新的字段
+    :param scope: 预取已有数据时的附加过滤条件，例如 {"provider_code": "aliyun"}
+    :param coalesce_fields: 云端值为 None 时保留库中原值的字段
+    :param touch_fields: 行有变化时随之更新的字段（如 updated_at），不参与比较
+    :return: UpsertResult(inserted, updated, unchanged)
+    不提交事务，由调用方 commit。
+    """
+    result = UpsertResult()
+    if not rows:
+        return result
+
+    # 同一批数据内按业务键去重，后出现的覆盖先出现的
+    deduped: Dict[Tuple, Dict[str, Any]] = {}
+    for row in rows:
+        deduped[tuple(row[f] for f in key_fields)] = row
+
+    existing = _prefetch_existing(
+        db, model, key_fields, update_fields, list(deduped.keys()), scope, chunk_size
+    )
+
+    pending: List[Dict[str, Any]] = []
+    for key, row in deduped.items():
+        old = existing.get(key)
+        if old is None:
+            result.inserted += 1
+            pending.append(row)
+            continue
+
+        for field in coalesce_fields:
+            if row.get(field) is None:
+                row[field] = old.get(field)
+
+        if all(_same_value(old.get(f), row.get(f)) for f in update_fields):
+            result.unchanged += 1
+        else:
+            result.updated += 1
+            pending.append(row)
+
+    set_fields = [f for f in (*update_fields, *touch_fields) if f in pending[0]] if pending else []
+    for chunk in _chunks(pending, chunk_size):
+        stmt = mysql_insert(model.__table__).values(list(chunk))
+        stmt = stmt.on_duplicate_key_update({f: stmt.inserted[f] for f in set_fields})
+        db.execute(stmt)
+
+    return result
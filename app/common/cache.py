@@ -0,0 +1,284 @@
+# app/common/cache.py
+import dataclasses
+import json
+import threading
+import time
+from collections import OrderedDict
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from pydantic import BaseModel
+
+from app.core.logger import logger
+
+_MISSING = object()
+
+
+# ------------------------------------------------------------
+# L2 共享缓存的序列化：JSON + 类型标记，不用 pickle（能写 Redis 的人就能在 worker 里执行代码）。
+# Pydantic 模型 / dataclass 只按白名单还原，需先 register_cache_types 登记。
+# ------------------------------------------------------------
+_TYPE_TAG = "__type__"
+_CACHE_TYPES: Dict[str, type] = {}
+
+
+def _type_name(cls: type) -> str:
+    return f"{cls.__module__}.{cls.__qualname__}"
+
+
+def register_cache_types(*classes: type) -> None:
+    """登记允许写入 / 读出共享缓存的 Pydantic 模型与 dataclass"""
+    for cls in classes:
+        _CACHE_TYPES[_type_name(cls)] = cls
+
+
+def _encode(value: Any) -> Any:
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, list):
+        return [_encode(v) for v in value]
+    if isinstance(value, tuple):
+        return {_TYPE_TAG: "tuple", "v": [_encode(v) for v in value]}
+    if isinstance(value, dict):
+        if all(isinstance(k, str) for k in value) and _TYPE_TAG not in value:
+            return {k: _encode(v) for k, v in value.items()}
+        # 键里带类型标记或非字符串键时按键值对列表保存
+        return {_TYPE_TAG: "dict", "v": [[_encode(k), _encode(v)] for k, v in value.items()]}
+    if isinstance(value, datetime):
+        return {_TYPE_TAG: "datetime", "v": value.isoformat()}
+    if isinstance(value, date):
+        return {_TYPE_TAG: "date", "v": value.isoformat()}
+    if isinstance(value, Decimal):
+        return {_TYPE_TAG: "decimal", "v": str(value)}
+
+    name = _type_name(type(value))
+    if _CACHE_TYPES.get(name) is type(value):
+        if isinstance(value, BaseModel):
+            return {_TYPE_TAG: "model", "name": name, "v": _encode(value.model_dump())}
+        if dataclasses.is_dataclass(value):
+            fields = {f.name: _encode(getattr(value, f.name)) for f in dataclasses.fields(value) if f.init}
+            return {_TYPE_TAG: "dataclass", "name": name, "v": fields}
+    raise TypeError(f"{name} is not registered for the shared cache")
+
+
+def _decode_object(obj: Dict[str, Any]) -> Any:
+    tag = obj.get(_TYPE_TAG)
+    if tag is None:
+        return obj
+    v = obj["v"]
+    if tag == "tuple":
+        return tuple(v)
+    if tag == "dict":
+        return {(tuple(k) if isinstance(k, list) else k): item for k, item in v}
+    if tag == "datetime":
+        return datetime.fromisoformat(v)
+    if tag == "date":
+        return date.fromisoformat(v)
+    if tag == "decimal":
+        return Decimal(v)
+    cls = _CACHE_TYPES.get(obj.get("name"))
+    if cls is None:
+        raise ValueError(f"unregistered cache type {obj.get('name')!r}")
+    if tag == "model":
+        return cls.model_validate(v)
+    if tag == "dataclass":
+        return cls(**v)
+    raise ValueError(f"unknown cache type tag {tag!r}")
+
+
+def encode_value(value: Any) -> bytes:
+    return json.dumps(_encode(value), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def decode_value(raw: bytes) -> Any:
+    return json.loads(raw, object_hook=_decode_object)
+
+
+class LRUTTLCache:
+    """
+    进程内 LRU 缓存，每个条目单独设置过期时间（线程安全）。
+    - max_entries: 最大条目数，超出后淘汰最久未访问的条目
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._data: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return default
+            expires_at, value = item
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def delete_prefix(self, prefix: str) -> int:
+        with self._lock:
+            keys = [k for k in self._data if k.startswith(prefix)]
+            for k in keys:
+                del self._data[k]
+            return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class SharedCacheBackend:
+    """跨进程共享缓存（二级缓存）接口"""
+
+    def get(self, key: str) -> Optional[bytes]:
+        raise NotImplementedError
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        raise NotImplementedError
+
+    def delete_prefix(self, prefix: str) -> None:
+        raise NotImplementedError
+
+
+class RedisCacheBackend(SharedCacheBackend):
+    """基于 Redis 的二级缓存；仅在配置了 redis_url 时才导入 redis 包"""
+
+    def __init__(self, redis_url: str):
+        import redis  # 可选依赖
+
+        self.client = redis.Redis.from_url(redis_url)
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self.client.get(key)
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        self.client.set(key, value, ex=max(1, int(ttl)))
+
+    def delete_prefix(self, prefix: str) -> None:
+        for k in self.client.scan_iter(match=f"{prefix}*"):
+            self.client.delete(k)
+
+
+class TieredCache:
+    """
+    两级缓存：L1 进程内 LRU + 可选 L2 共享缓存。
+    L2 的读写失败只记录日志，不影响主流程。
+    """
+
+    def __init__(self, max_entries: int = 1024, shared: Optional[SharedCacheBackend] = None):
+        self.local = LRUTTLCache(max_entries)
+        self.shared = shared
+
+    def _get_shared(self, key: str) -> Any:
+        if self.shared is None:
+            return _MISSING
+        try:
+            raw = self.shared.get(key)
+        except Exception as e:
+            logger.warning("shared cache get failed for %s: %s", key, e)
+            return _MISSING
+        if raw is None:
+            return _MISSING
+        try:
+            return decode_value(raw)
+        except (ValueError, TypeError, KeyError) as e:
+            # 无法识别的内容按未命中处理，随后由 loader 重新加载并覆盖
+            logger.warning("shared cache decode failed for %s: %s", key, e)
+            return _MISSING
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        self.local.set(key, value, ttl)
+        if self.shared is None:
+            return
+        try:
+            self.shared.set(key, encode_value(value), ttl)
+        except Exception as e:
+            logger.warning("shared cache set failed for %s: %s", key, e)
+
+    def get(self, key: str, ttl: float, default: Any = None) -> Any:
+        """只读不加载；L2 命中时按 ttl 回填 L1"""
+        value = self.local.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+        value = self._get_shared(key)
+        if value is _MISSING:
+            return default
+        self.local.set(key, value, ttl)
+        return value
+
+    def get_or_load(self, key: str, ttl: float, loader: Callable[[], Any]) -> Any:
+        value = self.local.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        value = self._get_shared(key)
+        if value is not _MISSING:
+            # L2 命中时回填 L1
+            self.local.set(key, value, ttl)
+            return value
+
+        value = loader()
+        self.set(key, value, ttl)
+        return value
+
+    async def get_or_load_async(self, key: str, ttl: float, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """get_or_load 的协程版本，loader 为返回 awaitable 的函数"""
+        value = self.local.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        value = self._get_shared(key)
+        if value is not _MISSING:
+            self.local.set(key, value, ttl)
+            return value
+
+        value = await loader()
+        self.set(key, value, ttl)
+        return value
+
+    def invalidate_prefix(self, prefix: str) -> None:
+        self.local.delete_prefix(prefix)
+        if self.shared is None:
+            return
+        try:
+            self.shared.delete_prefix(prefix)
+        except Exception as e:
+            logger.warning("shared cache invalidate failed for %s: %s", prefix, e)
+
+    def clear(self) -> None:
+        self.local.clear()
+
+
+def build_key(*parts: Any) -> str:
+    """
+    把 (kind, provider_code, region_id, zone_id, ...) 拼成缓存 key，None 记为空串。
+    每段以 ":" 结尾，按前缀失效时不会误伤 cn-hangzhou / cn-hangzhou-finance 这类同前缀的 ID。
+    """
+    return "".join(("" if p is None else str(p)) + ":" for p in parts)
+
+
+def build_shared_backend(redis_url: Optional[str]) -> Optional[SharedCacheBackend]:
+    if not redis_url:
+        return None
+    try:
+        return RedisCacheBackend(redis_url)
+    except Exception as e:
+        logger.warning("shared cache disabled: %s", e)
+        return None
@@ -1,4 +1,6 @@
 # app/common/credentials_manager.py
+from typing import Optional
+
 from alibabacloud_credentials.client import Client as CredentialClient
 from alibabacloud_credentials.models import Config as CredConfig
 from alibabacloud_tea_openapi import models as open_api_models
@@ -21,6 +23,18 @@ class CredentialsManager:
         )
 
     @staticmethod
-    def build_aliyun_product_config(cred_client: CredentialClient, endpoint: str) -> open_api_models.Config:
-        """构建阿里云产品配置对象"""
-        return open_api_models.Config(credential=cred_client, endpoint=endpoint)
+    def build_aliyun_product_config(
+        cred_client: CredentialClient,
+        endpoint: str,
+        connect_timeout: Optional[int] = None,
+        read_timeout: Optional[int] = None,
+        max_idle_conns: Optional[int] = None,
+    ) -> open_api_models.Config:
+        """构建阿里云产品配置对象；超时（毫秒）与空闲连接数作为该客户端所有请求的默认 runtime 参数"""
+        return open_api_models.Config(
+            credential=cred_client,
+            endpoint=endpoint,
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
+            max_idle_conns=max_idle_conns,
+        )
@@ -5,6 +5,7 @@ class Message:
     SUCCESS = "操作成功"
     FAILED = "操作失败"
     PARAMS_ERROR="参数校验失败"
+    INVALID_CURSOR = "分页游标无效，请从第一页重新查询"
 
     # === 用户相关 ===
     USER_NOT_FOUND = "用户不存在"
@@ -14,6 +15,7 @@ class Message:
     PASSWORD_INCORRECT = "密码不正确"
     INVALID_TOKEN = "Token 无效或已过期"
     INVALID_TOKEN_TYPE = "必须使用 access token"
+    TOKEN_REVOKED = "登录已失效，请重新登录"
     UNAUTHORIZED = "未认证或未提供凭证"
 
     # === 云厂商相关 ===
@@ -42,3 +44,4 @@ class Message:
     SERVER_ERROR = "服务器内部错误"
     DATABASE_ERROR = "数据库操作失败"
     TIMEOUT_ERROR = "请求超时"
+    SERVER_BUSY = "服务繁忙，请稍后重试"
@@ -1,7 +1,189 @@
-from typing import Tuple
+import base64
+import hashlib
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Generic, List, NamedTuple, Optional, Sequence, Tuple, TypeVar
+
+from fastapi import Query as QueryParam
+from pydantic import BaseModel
+from sqlalchemy import and_, or_
 from sqlalchemy.orm import Query
 
-def paginate_query(query: Query, page: int, page_size: int) -> Tuple[int, list]:
-    total = query.order_by(None).count()
+from app.common.cache import LRUTTLCache
+from app.common.exceptions import BusinessException
+from app.common.messages import Message
+from app.common.status_code import ErrorCode
+from app.core.config import settings
+from app.core.logger import logger
+
+T = TypeVar("T")
+
+
+def paginate_query(query: Query, page: int, page_size: int, count: Optional["CountMode"] = None) -> Tuple[int, list]:
+    """OFFSET 分页；传 count 时总数走 count_total（可缓存 / 估算）"""
+    total = query.order_by(None).count() if count is None else count_total(query, count)
     items = query.offset((page - 1) * page_size).limit(page_size).all()
     return total, items
+
+
+# ============================================================
+# 游标（keyset）分页：按 (created_at, id) 或 id 定位，不随页深变慢
+# ============================================================
+class CountMode(str, Enum):
+    NONE = "none"       # 不返回总数
+    EXACT = "exact"     # COUNT(*)，按过滤条件缓存
+    APPROX = "approx"   # MySQL EXPLAIN 估算行数，失败时退回 EXACT
+
+
+class CursorResult(NamedTuple):
+    items: list
+    next_cursor: Optional[str]
+    total: Optional[int]
+
+
+class CursorPage(BaseModel, Generic[T]):
+    items: List[T]
+    next_cursor: Optional[str] = None
+    has_more: bool = False
+    total: Optional[int] = None
+
+    @classmethod
+    def of(cls, result: CursorResult) -> "CursorPage[T]":
+        return cls(
+            items=result.items,
+            next_cursor=result.next_cursor,
+            has_more=result.next_cursor is not None,
+            total=result.total,
+        )
+
+
+class CursorParams:
+    """列表接口的游标分页参数（Depends(CursorParams)）"""
+
+    def __init__(
+        self,
+        cursor: Optional[str] = QueryParam(None, description="上一页返回的 next_cursor，首页不传"),
+        page_size: int = QueryParam(20, ge=1, le=200, description="每页条数"),
+        count: CountMode = QueryParam(CountMode.NONE, description="总数模式：none / exact / approx"),
+    ):
+        self.cursor = cursor
+        self.page_size = page_size
+        self.count = count
+
+
+def _plain(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    return value
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    raw = json.dumps([_plain(v) for v in values], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str, keys: Sequence[Any]) -> List[Any]:
+    """按排序列的类型还原游标值；格式不对时按参数错误处理"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+        if not isinstance(values, list) or len(values) != len(keys):
+            raise ValueError("cursor length mismatch")
+        result = []
+        for key, value in zip(keys, values):
+            python_type = key.type.python_type
+            if value is not None and python_type is datetime:
+                value = datetime.fromisoformat(value)
+            elif value is not None and python_type is Decimal:
+                value = Decimal(value)
+            result.append(value)
+        return result
+    except (ValueError, TypeError) as e:
+        logger.info("invalid page cursor %r: %s", cursor, e)
+        raise BusinessException(code=ErrorCode.PARAMS_ERROR, message=Message.INVALID_CURSOR)
+
+
+def _after(keys: Sequence[Any], values: Sequence[Any], desc: bool):
+    """(k1, k2) < (v1, v2) 展开为 k1 < v1 OR (k1 = v1 AND k2 < v2)，MySQL 能按索引走 range"""
+    clauses = []
+    for i, (key, value) in enumerate(zip(keys, values)):
+        bound = key < value if desc else key > value
+        clauses.append(and_(*[keys[j] == values[j] for j in range(i)], bound))
+    return or_(*clauses)
+
+
+def keyset_paginate(
+    query: Query,
+    keys: Sequence[Any],
+    page_size: int,
+    cursor: Optional[str] = None,
+    desc: bool = True,
+    count: CountMode = CountMode.NONE,
+) -> CursorResult:
+    """
+    游标分页：keys 为排序列（最后一列须唯一，通常是 id），多取一条判断是否还有下一页。
+    总数按 count 模式计算，且只针对过滤条件、与游标位置无关。
+    """
+    total = count_total(query, count)
+    if cursor:
+        query = query.filter(_after(keys, decode_cursor(cursor, keys), desc))
+    order = [k.desc() if desc else k.asc() for k in keys]
+    rows = query.order_by(None).order_by(*order).limit(page_size + 1).all()
+
+    items = rows[:page_size]
+    next_cursor = None
+    if len(rows) > page_size:
+        last = items[-1]
+        next_cursor = encode_cursor([getattr(last, k.key) for k in keys])
+    return CursorResult(items, next_cursor, total)
+
+
+# ============================================================
+# 总数：按过滤条件缓存，可选估算
+# ============================================================
+_count_cache = LRUTTLCache(settings.PAGINATION_COUNT_CACHE_MAX_ENTRIES)
+
+
+def _count_key(query: Query, mode: CountMode) -> Tuple[str, Any]:
+    """同一条过滤 SQL + 参数视为同一过滤条件"""
+    stmt = query.order_by(None).statement
+    compiled = stmt.compile(dialect=query.session.get_bind().dialect, compile_kwargs={"render_postcompile": True})
+    digest = hashlib.sha1(f"{compiled}|{sorted(compiled.params.items(), key=str)!r}".encode()).hexdigest()
+    return f"{mode.value}:{digest}", compiled
+
+
+def _approximate_count(query: Query, compiled) -> Optional[int]:
+    """MySQL EXPLAIN 的 rows * filtered 估算值；非 MySQL 或失败时返回 None"""
+    if query.session.get_bind().dialect.name != "mysql":
+        return None
+    try:
+        result = query.session.connection().exec_driver_sql(f"EXPLAIN {compiled}", compiled.params)
+        row = result.mappings().first()
+    except Exception as e:
+        logger.warning("approximate count failed: %s", e)
+        return None
+    if row is None or row.get("rows") is None:
+        return None
+    filtered = float(row.get("filtered") or 100)
+    return int(row["rows"] * filtered / 100)
+
+
+def count_total(query: Query, mode: CountMode) -> Optional[int]:
+    if mode == CountMode.NONE:
+        return None
+
+    key, compiled = _count_key(query, mode)
+    cached = _count_cache.get(key)
+    if cached is not None:
+        return cached
+
+    total = _approximate_count(query, compiled) if mode == CountMode.APPROX else None
+    if total is None:
+        total = query.order_by(None).count()
+    if settings.PAGINATION_COUNT_TTL_SECONDS > 0:
+        _count_cache.set(key, total, settings.PAGINATION_COUNT_TTL_SECONDS)
+    return total
@@ -1,8 +1,10 @@
 # app/common/response.py
-from typing import Any, Generic
+import json
+from decimal import Decimal
+from typing import Any, Dict, Generic, List
 from fastapi.responses import JSONResponse
 from fastapi.encoders import jsonable_encoder
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 from pydantic.v1.fields import T
 from pydantic.v1.generics import GenericModel
 
@@ -10,6 +12,11 @@ from app.common.exceptions import BusinessException
 from app.common.status_code import ErrorCode
 from app.common.messages import Message
 
+try:
+    import orjson
+except ImportError:  # 未安装时退回标准库 json，输出字节完全一致
+    orjson = None
+
 class ResponseModel(GenericModel, Generic[T]):
     code: int = 200
     message: str = "success"
@@ -59,11 +66,95 @@ def _convert_payload(data: Any):
     return jsonable_encoder(data)
 
 
+# ============================================================
+# 快速序列化：与 _convert_payload + JSONResponse 输出字节一致
+#   - 不再递归走 jsonable_encoder：原生类型（及 datetime/date/Enum/UUID）交给编码器，
+#     编码器不认识的值（Decimal、set、嵌套 ORM/Pydantic 对象等）才回调 jsonable_encoder，
+#     与原实现对该值的处理完全相同
+#   - 同类型 Pydantic 列表用缓存的 TypeAdapter 一次性 dump
+#   - _convert_payload 保留为参考实现，scripts/bench_response.py 用它对比字节与耗时
+# ============================================================
+_list_adapters: Dict[type, TypeAdapter] = {}
+
+
+def _dump_models(items: list) -> List[Any]:
+    cls = type(items[0])
+    if all(type(i) is cls for i in items):
+        adapter = _list_adapters.get(cls)
+        if adapter is None:
+            adapter = _list_adapters[cls] = TypeAdapter(List[cls])
+        return adapter.dump_python(items)
+    return [i.model_dump() for i in items]
+
+
+def _to_plain(data: Any) -> Any:
+    """只做顶层与列表一层的转换（与 _convert_payload 的结构一致），其余交给编码器"""
+    if data is None:
+        return None
+
+    if isinstance(data, BaseModel):
+        return data.model_dump()
+
+    if isinstance(data, (list, tuple)):
+        if data and all(isinstance(d, BaseModel) for d in data):
+            return _dump_models(data)
+        items = []
+        for d in data:
+            if isinstance(d, BaseModel):
+                items.append(d.model_dump())
+            elif hasattr(d, "__dict__"):
+                items.append(_orm_to_dict(d))
+            else:
+                items.append(d)
+        return items
+
+    if hasattr(data, "__dict__"):
+        return _orm_to_dict(data)
+
+    return data
+
+
+def _default(obj: Any) -> Any:
+    # Decimal（如规格价格）最常见，直接按 fastapi decimal_encoder 的规则转换
+    if type(obj) is Decimal:
+        return int(obj) if obj.as_tuple().exponent >= 0 else float(obj)
+    # 其余与原实现一致：编码器无法直接处理的值交给 jsonable_encoder
+    return jsonable_encoder(obj)
+
+
+# orjson 与标准库 json 的已知差异（scripts/bench_response.py 会校验）：
+#   - 浮点数写法不同但数值相同：1e-7（标准库为 1e-07）、1e16（1e+16），客户端解析结果一致
+#   - NaN / Infinity：标准库（allow_nan=False）抛 ValueError 变成 500，orjson 输出 null
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+    def dumps(content: Any) -> bytes:
+        return orjson.dumps(content, default=_default, option=_ORJSON_OPTIONS)
+else:
+    def dumps(content: Any) -> bytes:
+        # 与 starlette JSONResponse.render 的参数保持一致
+        return json.dumps(
+            content,
+            ensure_ascii=False,
+            allow_nan=False,
+            indent=None,
+            separators=(",", ":"),
+            default=_default,
+        ).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """content 可以含 datetime / ORM 等非 JSON 原生值，由 dumps 负责编码"""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
 class Response:
     @staticmethod
     def success(data: Any = None, message: str = Message.SUCCESS):
-        payload = _convert_payload(data)
-        return JSONResponse(
+        payload = _to_plain(data)
+        return FastJSONResponse(
             status_code=200,
             content={
                 "code": ErrorCode.SUCCESS,
@@ -0,0 +1,116 @@
+# app/common/singleflight.py
+import asyncio
+import hashlib
+import threading
+from contextlib import contextmanager
+from typing import Any, Awaitable, Callable, Dict, Iterator
+
+from sqlalchemy import text
+
+from app.core.logger import logger
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException = None
+
+
+class SingleFlight:
+    """
+    合并相同 key 的并发调用：同一时刻只有第一个调用方真正执行，其余调用方等待并共享结果（或异常）。
+    do() 用于线程，do_async() 用于协程（按事件循环各自合并）。
+    """
+
+    def __init__(self):
+        self._calls: Dict[str, _Call] = {}
+        self._async_calls: Dict[str, "asyncio.Future"] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Any:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+
+    async def do_async(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        fut = self._async_calls.get(key)
+        if fut is not None:
+            # shield：某个等待方被取消时不影响正在执行的调用
+            return await asyncio.shield(fut)
+
+        fut = asyncio.get_running_loop().create_future()
+        self._async_calls[key] = fut
+        try:
+            result = await fn()
+            fut.set_result(result)
+            return result
+        except BaseException as e:
+            fut.set_exception(e)
+            # 没有等待方时避免 "exception was never retrieved"
+            fut.exception()
+            raise
+        finally:
+            self._async_calls.pop(key, None)
+
+    def in_flight(self) -> int:
+        return len(self._calls) + len(self._async_calls)
+
+
+@contextmanager
+def mysql_named_lock(engine, key: str, timeout: int) -> Iterator[bool]:
+    """
+    基于 MySQL GET_LOCK 的跨 worker 互斥（与调度器 leader 锁同一机制，不需要额外建表）。
+    yield 是否发生过等待（别的 worker 正持有同一把锁）；拿不到锁或数据库不可用时不阻塞业务，照常执行。
+    """
+    # MySQL 锁名最长 64 字符
+    name = "sf:" + hashlib.sha1(key.encode()).hexdigest()
+    try:
+        conn = engine.connect()
+    except Exception as e:
+        logger.warning("single-flight lock unavailable for %s: %s", key, e)
+        yield False
+        return
+
+    acquired = False
+    contended = False
+    try:
+        try:
+            acquired = conn.execute(text("SELECT GET_LOCK(:name, 0)"), {"name": name}).scalar() == 1
+            if not acquired:
+                contended = True
+                acquired = conn.execute(text("SELECT GET_LOCK(:name, :timeout)"),
+                                        {"name": name, "timeout": timeout}).scalar() == 1
+                if not acquired:
+                    logger.warning("single-flight lock timeout for %s, running anyway", key)
+        except Exception as e:
+            logger.warning("single-flight lock failed for %s: %s", key, e)
+        yield contended
+    finally:
+        if acquired:
+            try:
+                conn.execute(text("SELECT RELEASE_LOCK(:name)"), {"name": name})
+            except Exception:
+                pass
+        conn.close()
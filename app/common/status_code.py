@@ -43,3 +43,4 @@ class ErrorCode:
     SERVER_ERROR = 50000
     DATABASE_ERROR = 50001
     TIMEOUT_ERROR = 50002
+    SERVER_BUSY = 50003
@@ -0,0 +1,75 @@
+# app/common/streaming.py
+from enum import Enum
+from typing import Iterator, List
+
+from fastapi.responses import StreamingResponse
+from sqlalchemy import Select
+
+from app.common.response import dumps
+from app.core.database import SessionLocal
+from app.core.logger import logger
+
+# 每批从服务端游标取的行数，也是每个响应 chunk 的行数
+EXPORT_BATCH_SIZE = 1000
+
+
+class ExportFormat(str, Enum):
+    NDJSON = "ndjson"   # 每行一个 JSON 对象
+    JSON = "json"       # 分块输出的 JSON 数组
+
+
+MEDIA_TYPES = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.JSON: "application/json",
+}
+
+
+def iter_batches(db_name: str, stmt: Select, batch_size: int = EXPORT_BATCH_SIZE) -> Iterator[List[dict]]:
+    """
+    用服务端游标（yield_per -> stream_results）分批读取，内存只保留一批。
+    使用独立 session：StreamingResponse 迭代时请求依赖注入的 session 可能已关闭，
+    而且流式游标未读完前该连接不能执行其他语句。
+    """
+    db = SessionLocal[db_name]()
+    try:
+        result = db.execute(stmt.execution_options(yield_per=batch_size))
+        for partition in result.mappings().partitions():
+            yield [dict(row) for row in partition]
+    finally:
+        db.close()
+
+
+def encode_batches(batches: Iterator[List[dict]], fmt: ExportFormat) -> Iterator[bytes]:
+    """把每批行编码成一个 chunk"""
+    if fmt == ExportFormat.NDJSON:
+        for rows in batches:
+            yield b"".join(dumps(r) + b"\n" for r in rows)
+        return
+
+    yield b"["
+    first = True
+    for rows in batches:
+        if not rows:
+            continue
+        chunk = b",".join(dumps(r) for r in rows)
+        yield chunk if first else b"," + chunk
+        first = False
+    yield b"]"
+
+
+def stream_export(db_name: str, stmt: Select, fmt: ExportFormat = ExportFormat.NDJSON) -> Iterator[bytes]:
+    try:
+        yield from encode_batches(iter_batches(db_name, stmt), fmt)
+    except Exception as e:
+        # 响应头已发出，无法再改状态码，只能记录日志并截断输出
+        logger.error("export stream aborted: %s", e, exc_info=True)
+        raise
+
+
+def export_response(chunks: Iterator[bytes], fmt: ExportFormat, filename: str) -> StreamingResponse:
+    suffix = "ndjson" if fmt == ExportFormat.NDJSON else "json"
+    return StreamingResponse(
+        chunks,
+        media_type=MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{suffix}"'},
+    )
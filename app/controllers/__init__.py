@@ -8,6 +8,8 @@ from .public.cloud_zone_controller import router as cloud_zone_router
 from .public.cloud_certificate_controller import router as cloud_certificate_router
 from .public.resource_group_controller import router as resource_group_router
 from .public.resource_group_binding_controller import router as resource_group_binding_router
+from .public.audit_log_controller import router as audit_log_router
+from .public.monitor_controller import router as monitor_router, metrics_router
 
 # cmp
 from .cmp.dict_controller import router as dict_router
@@ -3,6 +3,7 @@ from typing import Optional, List
 from fastapi import APIRouter, Depends, Query
 
 from app.common.response import Response
+from app.common.pagination import CursorPage, CursorParams
 from app.schemas.cmp.dict_schema import DictItemCreate, DictItemUpdate, DictItemOut, DictItemListOut
 from app.services.cmp.dependencies import get_dict_service
 from app.services.cmp.dict_service import DictService
@@ -37,6 +38,21 @@ def list_dict_items(
     return Response.success(items)
 
 
+# -------------------------
+# 游标分页查询字典项
+# -------------------------
+@router.get("/cursor_list", response_model=CursorPage[DictItemOut])
+def cursor_dict_items(
+    type_code: Optional[str] = Query(None, description="字典类型"),
+    keyword: Optional[str] = Query(None, description="模糊查询关键字"),
+    params: CursorParams = Depends(),
+    service: DictService = Depends(get_dict_service)
+):
+    result = service.list_cursor(type_code=type_code, keyword=keyword, cursor=params.cursor,
+                                 page_size=params.page_size, count=params.count)
+    return Response.success(CursorPage[DictItemOut].of(result))
+
+
 # -------------------------
 # 创建字典项
 # -------------------------
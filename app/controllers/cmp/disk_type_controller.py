@@ -21,4 +21,17 @@ def images_list(
     instance_charge_type: InstanceChargeType = Query(InstanceChargeType.POSTPAID, description="计费方式"),
     service: DiskTypeService = Depends(get_disk_type_service)) -> List[dict]:
     items = service.disk_type_list(provider_code, region_id, zone_id, instance_type_id, instance_charge_type)
-    return Response.success(items)
\ No newline at end of file
+    return Response.success(items)
+
+
+# 协程版本：云 API 走异步客户端，不占用线程池
+@router.get("/list_async", response_model=List[dict])
+async def disk_type_list_async(
+    provider_code: str = Query('aliyun', description="云厂商 code"),
+    region_id: str = Query('cn-beijing', description="区域 id"),
+    zone_id: str = Query('cn-beijing-g', description="可用区 id"),
+    instance_type_id: str = Query('ecs.c2.medium', description="规格实例id"),
+    instance_charge_type: InstanceChargeType = Query(InstanceChargeType.POSTPAID, description="计费方式"),
+    service: DiskTypeService = Depends(get_disk_type_service)) -> List[dict]:
+    items = await service.disk_type_list_async(provider_code, region_id, zone_id, instance_type_id, instance_charge_type)
+    return Response.success(items)
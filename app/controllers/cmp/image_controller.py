@@ -16,4 +16,16 @@ def images_list(
     architecture: str = Query('x86_64', description="CPU 架构：x86 或 arm"),
     service: ImageService = Depends(get_image_service)) -> List[dict]:
     items = service.list(provider_code, region_id, instance_type_id, architecture)
-    return Response.success(items)
\ No newline at end of file
+    return Response.success(items)
+
+
+# 协程版本：云 API 走异步客户端，不占用线程池
+@router.get("/list_async", response_model=List[dict])
+async def images_list_async(
+    provider_code: str = Query('aliyun', description="云厂商 code"),
+    region_id: str = Query('cn-beijing', description="区域 id"),
+    instance_type_id: str = Query('ecs.c2.medium', description="规格实例id"),
+    architecture: str = Query('x86_64', description="CPU 架构：x86 或 arm"),
+    service: ImageService = Depends(get_image_service)) -> List[dict]:
+    items = await service.list_async(provider_code, region_id, instance_type_id, architecture)
+    return Response.success(items)
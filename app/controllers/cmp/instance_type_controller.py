@@ -1,13 +1,14 @@
-from typing import List, Optional
+from typing import List
 
 from fastapi import APIRouter, Query, Depends
 from app.common.response import Response
+from app.common.streaming import ExportFormat, export_response
 
 from app.services.cmp.dependencies import get_instance_type_service
 
 from app.services.cmp.instance_type_service import InstanceTypeService
 
-from app.schemas.cmp.instance_type_schema import InstanceTypeSearch
+from app.schemas.cmp.instance_type_schema import InstanceTypeSearch, InstanceTypeRegionSearch
 
 router = APIRouter(prefix="/instance_type", tags=["实例规则及计费"])
 
@@ -19,9 +20,48 @@ def instance_type_list(
     return Response.success(items)
 
 
+# 协程版本：云 API 走异步客户端，不占用线程池
+@router.get('/list_async', response_model=List[dict])
+async def instance_type_list_async(
+    provider_code: str = Query('aliyun', description="云厂商 code"),
+    service: InstanceTypeService = Depends(get_instance_type_service)) -> List[dict]:
+    items = await service.list_instance_types_async(provider_code)
+    return Response.success(items)
+
+
 @router.get('/available_type', response_model=List[dict])
 def available_type_list(
     search: InstanceTypeSearch = Depends(),
     service: InstanceTypeService = Depends(get_instance_type_service)) -> List[dict]:
     items = service.list_available_instance_types(search)
-    return Response.success(items)
\ No newline at end of file
+    return Response.success(items)
+
+
+# region 级：各规格有货的可用区 + 价格，一次返回整个 region
+@router.get('/available_region', response_model=dict)
+def available_region_list(
+    search: InstanceTypeRegionSearch = Depends(),
+    service: InstanceTypeService = Depends(get_instance_type_service)):
+    items = service.list_region_available_instance_types(search)
+    return Response.success(items)
+
+
+# 库存快照的最近状态变化
+@router.get('/stock_changes', response_model=dict)
+def stock_changes(
+    provider_code: str = Query('aliyun', description="云厂商 code"),
+    region_id: str = Query(..., description="区域 id"),
+    zone_id: str = Query(..., description="可用区 id"),
+    instance_charge_type: str = Query('PostPaid', description="付费方式"),
+    only_soldout: bool = Query(False, description="只看有货 -> 售罄的变化"),
+    service: InstanceTypeService = Depends(get_instance_type_service)):
+    return Response.success(service.stock_changes(provider_code, region_id, zone_id, instance_charge_type, only_soldout))
+
+
+# 流式导出：分批读库、分块输出，不一次性加载全表
+@router.get('/export')
+def instance_type_export(
+    provider_code: str = Query('aliyun', description="云厂商 code"),
+    fmt: ExportFormat = Query(ExportFormat.NDJSON, description="导出格式：ndjson / json"),
+    service: InstanceTypeService = Depends(get_instance_type_service)):
+    return export_response(service.export(provider_code, fmt), fmt, f"instance_types_{provider_code}")
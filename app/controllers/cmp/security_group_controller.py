@@ -5,6 +5,8 @@ from app.schemas.cmp.security_group_schema import SecurityGroupSearch, SecurityG
 from app.services.cmp.security_group_service import SecurityGroupService
 from app.services.cmp.dependencies import get_security_service
 from app.common.response import Response
+from app.common.pagination import CursorPage, CursorParams
+from app.common.streaming import ExportFormat, export_response
 
 router = APIRouter(prefix="/security_groups", tags=["安全组"])
 
@@ -29,6 +31,26 @@ def list_security_groups(
     items =  service.list_page(filters)
     return Response.success(items)
 
+
+@router.get("/cursor_list", response_model=CursorPage[SecurityGroupOut])
+def cursor_security_groups(
+    provider_code: str = Query('aliyun', description="云厂商 code"),
+    region_id: str = Query('cn-qingdao', description="区域 id"),
+    resource_group_id: Optional[int] = Query(None),
+    name: Optional[str] = Query(None),
+    params: CursorParams = Depends(),
+    service: SecurityGroupService = Depends(get_security_service),
+):
+    filters = SecurityGroupSearch(
+        cloud_provider_code=provider_code,
+        region_id=region_id,
+        resource_group_id=resource_group_id,
+        security_name=name,
+        page_size=params.page_size
+    )
+    result = service.list_cursor(filters, params.cursor, params.count)
+    return Response.success(CursorPage[SecurityGroupOut].of(result))
+
 @router.post("/create", response_model=SecurityGroupOut)
 def create_security_group(
     body: SecurityGroupCreate,
@@ -58,3 +80,14 @@ def list_security_groups(
 
     items =  service.list_security_groups(provider_code, region_id, vpc_id)
     return Response.success(items)
+
+
+# 流式导出安全组
+@router.get("/export")
+def export_security_groups(
+    provider_code: str = Query('aliyun', description="云厂商 code"),
+    region_id: Optional[str] = Query(None, description="区域 id，不传导出全部区域"),
+    fmt: ExportFormat = Query(ExportFormat.NDJSON, description="导出格式：ndjson / json"),
+    service: SecurityGroupService = Depends(get_security_service),
+):
+    return export_response(service.export(provider_code, region_id, fmt), fmt, "security_groups")
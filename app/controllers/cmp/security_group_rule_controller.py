@@ -1,10 +1,12 @@
-from fastapi import APIRouter, Depends
+from typing import Optional
+from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
 
 from app.services.cmp.dependencies import get_security_rule_service
 from app.services.cmp.security_group_rule_service import SecurityGroupRuleService
 from app.schemas.cmp.security_group_rule_schema import SecurityGroupRuleUpdate, SecurityGroupRuleOut
 from app.common.response import Response
+from app.common.streaming import ExportFormat, export_response
 
 router = APIRouter(prefix="/security_group_rule", tags=["安全组规则配置"])
 
@@ -33,3 +35,13 @@ def delete_rules(
 ):
     deleted_id = service.delete_rules(rule_id)
     return Response.success(deleted_id)
+
+
+# 流式导出安全组规则
+@router.get("/export")
+def export_rules(
+    security_group_id: Optional[str] = Query(None, description="安全组 id，不传导出全部"),
+    fmt: ExportFormat = Query(ExportFormat.NDJSON, description="导出格式：ndjson / json"),
+    service: SecurityGroupRuleService = Depends(get_security_rule_service)
+):
+    return export_response(service.export(security_group_id, fmt), fmt, "security_group_rules")
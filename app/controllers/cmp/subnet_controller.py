@@ -5,6 +5,8 @@ from typing import List, Optional
 from app.services.cmp.dependencies import get_subnet_service
 from app.schemas.cmp.subnet_schema import SubnetCreate, SubnetOut, SubnetPage
 from app.common.response import Response
+from app.common.pagination import CursorPage, CursorParams
+from app.common.streaming import ExportFormat, export_response
 
 router = APIRouter(prefix="/subnet", tags=["子网管理"])
 
@@ -58,6 +60,30 @@ def page_subnets(
         )
     )
 
+
+@router.get("/cursor_list", response_model=CursorPage[SubnetOut])
+def cursor_subnets(
+    cloud_provider_code: Optional[str] = Query(None),
+    region_id: Optional[str] = Query(None),
+    zone_id: Optional[str] = Query(None),
+    vpc_id: Optional[str] = Query(None),
+    resource_group_id: Optional[int] = Query(None),
+    params: CursorParams = Depends(),
+    service = Depends(get_subnet_service)
+):
+    """游标分页查询子网"""
+    result = service.cursor_subnets(
+        cloud_provider_code=cloud_provider_code,
+        region_id=region_id,
+        zone_id=zone_id,
+        vpc_id=vpc_id,
+        resource_group_id=resource_group_id,
+        cursor=params.cursor,
+        page_size=params.page_size,
+        count=params.count,
+    )
+    return Response.success(CursorPage[SubnetOut].of(result))
+
 @router.get("/list", response_model=SubnetOut)
 def list_subnets(
     cloud_provider_code: str,
@@ -68,3 +94,14 @@ def list_subnets(
     result = service.sync_subnets(cloud_provider_code, region_id, vpc_id)
     return Response.success(result)
 
+
+# 流式导出子网
+@router.get("/export")
+def export_subnets(
+    provider_code: str = Query('aliyun', description="云厂商code"),
+    region_id: Optional[str] = Query(None, description="区域id"),
+    vpc_id: Optional[int] = Query(None, description="所属VPC ID"),
+    fmt: ExportFormat = Query(ExportFormat.NDJSON, description="导出格式：ndjson / json"),
+    service = Depends(get_subnet_service)
+):
+    return export_response(service.export(provider_code, region_id, vpc_id, fmt), fmt, "subnets")
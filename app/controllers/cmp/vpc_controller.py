@@ -1,6 +1,9 @@
+from typing import Optional
 from fastapi import APIRouter, Depends, Query
 
 from app.common.response import Response
+from app.common.pagination import CursorPage, CursorParams
+from app.common.streaming import ExportFormat, export_response
 from app.schemas.cmp.vpc_schema import (VpcOut, VpcPage, VpcCreate)
 
 from app.services.cmp.dependencies import get_vpc_service
@@ -32,6 +35,18 @@ def list_page(
     return Response.success(VpcPage(page=page, pageSize=page_size, total=total, items=items))
 
 
+# 游标分页：翻页带上返回的 next_cursor，深页不变慢
+@router.get('/cursor_list', response_model=CursorPage[VpcOut])
+def list_cursor(
+        provider_code: str = Query('aliyun', description="云厂商code"),
+        region_id: str = Query('cn-qingdao', description="区域id"),
+        params: CursorParams = Depends(),
+        service: VPCService = Depends(get_vpc_service)
+):
+    result = service.list_cursor(provider_code, region_id, params.cursor, params.page_size, params.count)
+    return Response.success(CursorPage[VpcOut].of(result))
+
+
 @router.post("/create", response_model=VpcOut)
 def create_vpc(
     data: VpcCreate,
@@ -48,3 +63,14 @@ def release_vpc(
 ):
     result = service.release(vpc_id)
     return Response.success(result)
+
+
+# 流式导出 VPC
+@router.get("/export")
+def export_vpcs(
+    provider_code: str = Query('aliyun', description="云厂商code"),
+    region_id: Optional[str] = Query(None, description="区域id，不传导出全部区域"),
+    fmt: ExportFormat = Query(ExportFormat.NDJSON, description="导出格式：ndjson / json"),
+    service: VPCService = Depends(get_vpc_service)
+):
+    return export_response(service.export(provider_code, region_id, fmt), fmt, "vpcs")
@@ -0,0 +1,45 @@
+# app/controllers/public/audit_log_controller.py
+from datetime import datetime
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query
+
+from app.common.pagination import CursorPage, CursorParams
+from app.common.response import Response
+from app.common.streaming import ExportFormat, export_response
+from app.schemas.public.audit_log_schema import AuditLogOut
+from app.services.public.dependencies import get_audit_log_service
+from app.services.public.audit_log_service import AuditLogService
+
+router = APIRouter(prefix="/audit_log", tags=["操作审计日志"])
+
+
+# 按时间范围游标分页查询（默认最近 7 天，按时间倒序）
+@router.get("/cursor_list", response_model=CursorPage[AuditLogOut])
+def list_audit_logs_cursor(
+    start_time: Optional[datetime] = Query(None, description="开始时间（含），默认结束时间前 7 天"),
+    end_time: Optional[datetime] = Query(None, description="结束时间（不含），默认当前时间"),
+    module: Optional[str] = Query(None, description="操作模块"),
+    action: Optional[str] = Query(None, description="操作动作"),
+    user_id: Optional[str] = Query(None, description="操作用户ID"),
+    status: Optional[str] = Query(None, description="操作状态：success / failed"),
+    params: CursorParams = Depends(),
+    service: AuditLogService = Depends(get_audit_log_service),
+):
+    result = service.list_cursor(start_time, end_time, module, action, user_id, status,
+                                 params.cursor, params.page_size, params.count)
+    return Response.success(CursorPage[AuditLogOut].of(result))
+
+
+# 流式导出审计日志
+@router.get("/export")
+def export_audit_logs(
+    module: Optional[str] = Query(None, description="操作模块"),
+    user_id: Optional[str] = Query(None, description="操作用户ID"),
+    start_time: Optional[datetime] = Query(None, description="开始时间（含）"),
+    end_time: Optional[datetime] = Query(None, description="结束时间（不含）"),
+    fmt: ExportFormat = Query(ExportFormat.NDJSON, description="导出格式：ndjson / json"),
+    service: AuditLogService = Depends(get_audit_log_service),
+):
+    chunks = service.export(module, user_id, start_time, end_time, fmt)
+    return export_response(chunks, fmt, "audit_logs")
@@ -1,5 +1,6 @@
 from fastapi import APIRouter, Depends, Path, Query
 from app.common.response import Response
+from app.common.pagination import CursorPage, CursorParams
 from app.schemas.public.cloud_certificate_schema import (
     CloudCertificateCreate, CloudCertificateUpdate, CloudCertificateOut, CloudCertificatePage
 )
@@ -19,6 +20,12 @@ def list_certificates(page: int = Query(1, ge=1), page_size: int = Query(10, ge=
     total, items = service.list_certificates(page, page_size)
     return Response.success(CloudCertificatePage(page=page, pageSize=page_size, total=total, items=items))
 
+@router.get("/cursor_list", response_model=CursorPage[CloudCertificateOut])
+def list_certificates_cursor(params: CursorParams = Depends(),
+                             service: CloudCertificateService = Depends(get_cloud_certificate_service)):
+    result = service.list_certificates_cursor(params.cursor, params.page_size, params.count)
+    return Response.success(CursorPage[CloudCertificateOut].of(result))
+
 @router.put("/update/{record_id}", response_model=CloudCertificateOut)
 def update_certificate(record_id: int = Path(..., ge=1), data: CloudCertificateUpdate = ...,
                        service: CloudCertificateService = Depends(get_cloud_certificate_service)):
@@ -13,6 +13,7 @@ from app.schemas.public.cloud_provider_schema import (
 from app.services.public.cloud_provider_service import CloudProviderService
 from app.services.public.dependencies import get_cloud_provider_service
 from app.common.response import Response
+from app.common.pagination import CursorPage, CursorParams
 
 #   dependencies=[Depends(require_user)]。注入token
 router = APIRouter(prefix="/cloud_providers", tags=["云厂商配置"], dependencies=[Depends(require_user)])
@@ -58,3 +59,13 @@ def list_providers(
     total, items = service.list_providers(page, page_size)
     page_data = CloudProviderPage(page=page, pageSize=page_size, total=total, items=items)
     return Response.success(page_data)
+
+
+# 游标分页
+@router.get("/cursor_list", response_model=CursorPage[CloudProviderOut])
+def list_providers_cursor(
+    params: CursorParams = Depends(),
+    service: CloudProviderService = Depends(get_cloud_provider_service)
+):
+    result = service.list_providers_cursor(params.cursor, params.page_size, params.count)
+    return Response.success(CursorPage[CloudProviderOut].of(result))
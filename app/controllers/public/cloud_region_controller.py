@@ -14,3 +14,13 @@ def list_regions(
 ):
     items = service.sync_regions(provider_code)
     return Response.success(items)
+
+
+# 获取云区域（协程版本）
+@router.get("/list_async", response_model=CloudRegionOut)
+async def list_regions_async(
+    provider_code: str = Query(),
+    service: CloudRegionService = Depends(get_cloud_region_service)
+):
+    items = await service.sync_regions_async(provider_code)
+    return Response.success(items)
@@ -17,3 +17,15 @@ def list_zones(
 ):
     items = service.sync_zones(provider_code, region_id)
     return Response.success(items)
+
+
+# 协程版本：云 API 走异步客户端
+@router.get("/list_async", response_model=CloudZoneOut)
+async def list_zones_async(
+    provider_code: str = Query('aliyun'),
+    region_id: str = Query('cn-qingdao'),
+    service: CloudZoneService = Depends(get_cloud_zone_service)
+):
+    items = await service.sync_zones_async(provider_code, region_id)
+    return Response.success(items)
+
@@ -0,0 +1,21 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from app.core.database import pool_stats
+from app.core.metrics import registry
+from app.common.response import Response
+
+router = APIRouter(prefix="/monitor", tags=["运行监控"])
+# Prometheus 抓取地址固定为 /metrics，不加 API_PREFIX
+metrics_router = APIRouter()
+
+# 各库连接池：借出数、溢出数、等待中的请求数、等待 / 借出耗时
+@router.get("/db_pools")
+def db_pools():
+    return Response.success(pool_stats())
+
+
+# Prometheus 文本格式指标：请求延迟 / 状态码 / DB 与云 API 耗时 / 连接池
+@metrics_router.get("/metrics", include_in_schema=False)
+def metrics():
+    return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
@@ -1,5 +1,6 @@
 from fastapi import APIRouter, Depends, Path, Query
 from app.common.response import Response
+from app.common.pagination import CursorPage, CursorParams
 from app.schemas.public.resource_group_binding_schema import (
     ResourceGroupBindingCreate,
     ResourceGroupBindingOut, ResourceGroupBindingPage
@@ -43,3 +44,14 @@ def list_bindings_page(
         ResourceGroupBindingPage(page=page, pageSize=page_size, total=total, items=items)
     )
 
+
+# 获取某个组的资源绑定列表（游标分页）
+@router.get("/group/{group_id}/cursor", response_model=CursorPage[ResourceGroupBindingOut])
+def list_bindings_cursor(
+    group_id: int,
+    params: CursorParams = Depends(),
+    service: ResourceGroupBindingService = Depends(get_resource_group_binding_service),
+):
+    result = service.list_bindings_cursor(group_id, params.cursor, params.page_size, params.count)
+    return Response.success(CursorPage[ResourceGroupBindingOut].of(result))
+
@@ -5,6 +5,7 @@ from app.schemas.public.resource_group_schema import (
 from app.services.public.resource_group_service import ResourceGroupService
 from app.services.public.dependencies import get_resource_group_service
 from app.common.response import Response
+from app.common.pagination import CursorPage, CursorParams
 
 router = APIRouter(prefix="/resource_groups", tags=["资源组管理"])
 
@@ -45,3 +46,12 @@ def list_groups(
 ):
     total, items = service.list_groups(page, page_size)
     return Response.success(ResourceGroupPage(page=page, pageSize=page_size, total=total, items=items))
+
+
+@router.get("/cursor_list", response_model=CursorPage[ResourceGroupOut])
+def list_groups_cursor(
+    params: CursorParams = Depends(),
+    service: ResourceGroupService = Depends(get_resource_group_service),
+):
+    result = service.list_groups_cursor(params.cursor, params.page_size, params.count)
+    return Response.success(CursorPage[ResourceGroupOut].of(result))
@@ -1,5 +1,6 @@
 # app/core/config.py
 import os
+from typing import Any, Dict, List, Optional
 from pydantic_settings import BaseSettings
 from functools import lru_cache
 
@@ -23,6 +24,114 @@ class Settings(BaseSettings):
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60
     REFRESH_TOKEN_EXPIRE_DAYS: int = 30
+    # 过期会话清理（随后台调度器运行）：间隔（分钟）与单批删除条数
+    SESSION_PURGE_ENABLED: bool = True
+    SESSION_PURGE_MINUTES: int = 60
+    SESSION_PURGE_BATCH_SIZE: int = 1000
+    # access token 验签结果缓存（条目上限、最长缓存秒数，且不超过 token 的 exp）；吊销记录跨 worker 同步间隔（秒），
+    # 以及每次同步在水位线之前多回看的秒数（覆盖其他 worker 晚提交、各节点时钟偏差）
+    TOKEN_VERIFY_CACHE_MAX_ENTRIES: int = 10000
+    TOKEN_VERIFY_CACHE_TTL_SECONDS: int = 300
+    TOKEN_REVOCATION_SYNC_SECONDS: int = 5
+    TOKEN_REVOCATION_SYNC_OVERLAP_SECONDS: int = 30
+    # 密码哈希：bcrypt cost（rounds）；专用执行器的 worker 数、是否改用进程池（绕开 GIL）、
+    # 排队 + 执行中的上限（超出直接返回服务繁忙）与等待结果的最长秒数
+    PASSWORD_BCRYPT_ROUNDS: int = 12
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_USE_PROCESSES: bool = False
+    PASSWORD_HASH_MAX_PENDING: int = 32
+    PASSWORD_HASH_TIMEOUT_SECONDS: float = 10
+
+    # 数据库连接池（四个库的默认值；DB_POOL_OVERRIDES 按库名覆盖，
+    # 例如 {"audit_center": {"pool_size": 20, "max_overflow": 40}}）
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT: int = 30
+    # 连接存活策略：回收时间需小于 MySQL wait_timeout；开启 pre_ping 则每次借出连接多一次往返
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = False
+    DB_POOL_OVERRIDES: Dict[str, Dict[str, Any]] = {}
+
+    # 云资源目录缓存（L1 进程内条目上限；L2 共享缓存地址，为空则不启用）
+    CATALOG_CACHE_MAX_ENTRIES: int = 2048
+    CATALOG_CACHE_REDIS_URL: Optional[str] = None
+
+    # DescribePrice 价格缓存时长（秒）与价格查询线程数
+    PRICE_CACHE_TTL_SECONDS: int = 3600
+    PRICE_RESOLVER_WORKERS: int = 16
+
+    # 规格目录内存索引：多久比对一次同步时间（秒），其他 worker 同步后据此重建
+    INSTANCE_TYPE_INDEX_CHECK_SECONDS: int = 30
+
+    # 可用区库存快照：超过 STALE 秒读旧快照并后台刷新；超过 TTL 秒快照失效、请求同步拉取；保留的状态变化条数
+    STOCK_SNAPSHOT_STALE_SECONDS: int = 300
+    STOCK_SNAPSHOT_TTL_SECONDS: int = 3600
+    STOCK_CHANGE_HISTORY: int = 200
+
+    # 相同云调用去重：进程内总是开启；开启 DB_LOCK 时再用 public 库的 MySQL 命名锁跨 worker 互斥，等锁最长秒数
+    SINGLE_FLIGHT_DB_LOCK: bool = False
+    SINGLE_FLIGHT_LOCK_TIMEOUT_SECONDS: int = 30
+
+    # 目录表过软 TTL 后后台刷新使用的线程数
+    CATALOG_REFRESH_WORKERS: int = 4
+
+    # 游标分页的总数缓存：同一过滤条件的 COUNT 结果复用时长（秒，0 为不缓存）与条目上限
+    PAGINATION_COUNT_TTL_SECONDS: int = 30
+    PAGINATION_COUNT_CACHE_MAX_ENTRIES: int = 1024
+
+    # 云 API 分页接口并发拉取的页数
+    CLOUD_PAGE_CONCURRENCY: int = 4
+
+    # 云客户端池：最多缓存的客户端数、客户端最长复用时间（秒）；SDK HTTP 连接 / 读超时（毫秒）与空闲连接数
+    CLOUD_CLIENT_POOL_MAX_ENTRIES: int = 64
+    CLOUD_CLIENT_POOL_TTL_SECONDS: int = 6 * 3600
+    CLOUD_HTTP_CONNECT_TIMEOUT_MS: int = 5000
+    CLOUD_HTTP_READ_TIMEOUT_MS: int = 10000
+    CLOUD_HTTP_MAX_IDLE_CONNS: int = 50
+
+    # 阿里云 ECS 按 region 路由 Endpoint（仅当厂商配置的是中心 Endpoint ecs.aliyuncs.com 时生效），可按 region 覆盖
+    ALIYUN_REGIONAL_ENDPOINTS: bool = True
+    ALIYUN_ECS_ENDPOINT_TEMPLATE: str = "ecs.{region_id}.aliyuncs.com"
+    ALIYUN_ECS_ENDPOINT_OVERRIDES: Dict[str, str] = {}
+
+    # 云 API 限流：按 (厂商, AccessKey, API) 的令牌桶 QPS（可按 API 覆盖）、AIMD 并发上下限、
+    # 本地最长排队时间（秒），以及被云端限流（Throttling.*）后的重试次数与初始退避（秒）
+    CLOUD_RATE_LIMIT_QPS: float = 20
+    CLOUD_RATE_LIMIT_ACTION_QPS: Dict[str, float] = {"DescribePrice": 10, "DescribeAvailableResource": 5}
+    CLOUD_CONCURRENCY_MIN: int = 1
+    CLOUD_CONCURRENCY_MAX: int = 10
+    CLOUD_RATE_LIMIT_MAX_WAIT_SECONDS: float = 10
+    CLOUD_THROTTLE_RETRIES: int = 2
+    CLOUD_THROTTLE_BACKOFF_SECONDS: float = 0.5
+
+    # 操作审计：中间件记录这些方法的请求，内存队列上限；后台线程按批（条数 / 最长等待秒数）多行 INSERT 到 audit_center 库，
+    # 写库失败或单批超过 SLOW 秒时，RETRY 秒内改写到 SPILL_DIR 下的本地文件，之后回放
+    AUDIT_LOG_ENABLED: bool = True
+    AUDIT_LOG_METHODS: List[str] = ["POST", "PUT", "PATCH", "DELETE"]
+    AUDIT_LOG_QUEUE_SIZE: int = 10000
+    AUDIT_LOG_BATCH_SIZE: int = 200
+    AUDIT_LOG_FLUSH_SECONDS: float = 1.0
+    AUDIT_LOG_SLOW_SECONDS: float = 2.0
+    AUDIT_LOG_RETRY_SECONDS: int = 30
+    AUDIT_LOG_SPILL_DIR: str = "logs/audit_spill"
+    # 审计日志按月分区维护（随后台调度器运行）：提前建好的月份数、保留月数（更早的分区先归档再整体删除）、
+    # 归档目录（为空则不归档直接删除）、检查间隔（分钟）
+    AUDIT_LOG_MAINTENANCE_ENABLED: bool = True
+    AUDIT_LOG_PARTITION_AHEAD_MONTHS: int = 3
+    AUDIT_LOG_RETENTION_MONTHS: int = 12
+    AUDIT_LOG_ARCHIVE_DIR: str = "logs/audit_archive"
+    AUDIT_LOG_MAINTENANCE_MINUTES: int = 24 * 60
+
+    # 云资源目录后台同步（APScheduler），间隔单位：分钟
+    CATALOG_SYNC_ENABLED: bool = True
+    CATALOG_SYNC_LOCK_NAME: str = "yt_core:catalog_sync"
+    CATALOG_SYNC_REGION_MINUTES: int = 24 * 60
+    CATALOG_SYNC_INSTANCE_TYPE_MINUTES: int = 6 * 60
+    CATALOG_SYNC_STOCK_MINUTES: int = 5
+    CATALOG_SYNC_NETWORK_MINUTES: int = 10
+    CATALOG_SYNC_JITTER_SECONDS: int = 30
+    # 只同步这些 region；为空时同步库中该厂商的全部 region
+    CATALOG_SYNC_REGIONS: List[str] = []
 
     class Config:
         env_file = f".env.{os.getenv('ENV', 'development')}"
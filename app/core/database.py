@@ -1,11 +1,126 @@
 # app/core/database.py
+import threading
+import time
+from collections.abc import Mapping
+from typing import Any, Dict
+
 from sqlalchemy import create_engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from sqlalchemy.orm import sessionmaker, declarative_base, declared_attr
+from sqlalchemy.pool import QueuePool
 from app.core.config import settings
-from typing import Dict
+from app.core.metrics import instrument_engine, registry
+
+
+# ============================================================
+# 连接池指标
+# ============================================================
+class PoolMetrics:
+    """
+    单个 engine 的连接池指标：
+    - wait：在池上等待空闲连接（含超额新建连接）的耗时
+    - checkout：借出连接的总耗时（wait + pre_ping 等 checkout 处理）
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.waiting = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self.checkout_total = 0.0
+        self.checkout_max = 0.0
+
+    def begin_wait(self) -> None:
+        with self._lock:
+            self.waiting += 1
+
+    def end_wait(self, seconds: float, timed_out: bool = False) -> None:
+        with self._lock:
+            self.waiting -= 1
+            if timed_out:
+                self.timeouts += 1
+                return
+            self.wait_total += seconds
+            self.wait_max = max(self.wait_max, seconds)
+
+    def observe_checkout(self, seconds: float) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.checkout_total += seconds
+            self.checkout_max = max(self.checkout_max, seconds)
+
+    def snapshot(self, pool: QueuePool) -> Dict[str, Any]:
+        with self._lock:
+            n = self.checkouts or 1
+            return {
+                "pool_size": pool.size(),
+                "checked_out": pool.checkedout(),
+                "checked_in": pool.checkedin(),
+                "overflow": max(pool.overflow(), 0),
+                "waiting": self.waiting,
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "wait_avg_ms": round(self.wait_total / n * 1000, 3),
+                "wait_max_ms": round(self.wait_max * 1000, 3),
+                "checkout_avg_ms": round(self.checkout_total / n * 1000, 3),
+                "checkout_max_ms": round(self.checkout_max * 1000, 3),
+            }
+
+
+class InstrumentedQueuePool(QueuePool):
+    """
+    记录等待 / 借出耗时的 QueuePool。
+    metrics 挂在（按 engine 生成的）子类上，engine.dispose() 重建连接池后仍然沿用。
+    """
+
+    metrics: PoolMetrics = None
+
+    def _do_get(self):
+        self.metrics.begin_wait()
+        start = time.perf_counter()
+        try:
+            conn = super()._do_get()
+        except PoolTimeoutError:
+            self.metrics.end_wait(time.perf_counter() - start, timed_out=True)
+            raise
+        except BaseException:
+            self.metrics.end_wait(0.0, timed_out=False)
+            raise
+        self.metrics.end_wait(time.perf_counter() - start)
+        return conn
+
+    def connect(self):
+        start = time.perf_counter()
+        conn = super().connect()
+        self.metrics.observe_checkout(time.perf_counter() - start)
+        return conn
+
+
+def pool_options(name: str) -> Dict[str, Any]:
+    """全局默认值叠加 DB_POOL_OVERRIDES[name]"""
+    options = {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+    options.update(settings.DB_POOL_OVERRIDES.get(name, {}))
+    return options
+
 
-def create_db_engine(database_url: str):
-    return create_engine(database_url, echo=(settings.ENV == "development"), pool_pre_ping=True)
+def create_db_engine(database_url: str, name: str = "default"):
+    pool_class = type(f"InstrumentedQueuePool_{name}", (InstrumentedQueuePool,), {"metrics": PoolMetrics()})
+    engine = create_engine(
+        database_url,
+        echo=(settings.ENV == "development"),
+        poolclass=pool_class,
+        **pool_options(name),
+    )
+    instrument_engine(engine, name)
+    return engine
 
 def create_session_factory(engine):
     return sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -13,19 +128,86 @@ def create_session_factory(engine):
 def create_base():
     return declarative_base()
 
-# === Engines & Sessions for each DB ===
-engines: Dict[str, any] = {
-    "sso": create_db_engine(settings.DB_SSO_AUTH),
-    "public": create_db_engine(settings.DB_PUBLIC),
-    "audit_center": create_db_engine(settings.DB_AUDIT_CENTER),
-    "cmp": create_db_engine(settings.DB_CMP),
-}
 
-SessionLocal = {
-    name: create_session_factory(engine)
-    for name, engine in engines.items()
+class _LazyRegistry(Mapping):
+    """
+    按库名惰性创建对象的只读映射：第一次 registry[name] 时才调用 factory(name)。
+    只连一个库的进程（alembic、脚本、单库任务）不会为其余三个库建 engine。
+    """
+
+    def __init__(self, names, factory):
+        self._names = tuple(names)
+        self._factory = factory
+        self._items: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def __getitem__(self, name: str):
+        item = self._items.get(name)
+        if item is not None:
+            return item
+        if name not in self._names:
+            raise KeyError(name)
+        with self._lock:
+            if name not in self._items:
+                self._items[name] = self._factory(name)
+            return self._items[name]
+
+    def __iter__(self):
+        return iter(self._names)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def created(self) -> Dict[str, Any]:
+        """已经创建过的对象（不会触发创建）"""
+        return dict(self._items)
+
+
+# 库名 -> Settings 中的连接串字段
+DATABASE_URLS = {
+    "sso": "DB_SSO_AUTH",
+    "public": "DB_PUBLIC",
+    "audit_center": "DB_AUDIT_CENTER",
+    "cmp": "DB_CMP",
 }
 
+# === Engines & Sessions for each DB（首次使用时创建）===
+engines = _LazyRegistry(
+    DATABASE_URLS,
+    lambda name: create_db_engine(getattr(settings, DATABASE_URLS[name]), name),
+)
+
+SessionLocal = _LazyRegistry(
+    DATABASE_URLS,
+    lambda name: create_session_factory(engines[name]),
+)
+
+
+def pool_stats() -> Dict[str, Dict[str, Any]]:
+    """各库连接池当前状态与累计借出指标（尚未创建的 engine 不统计）"""
+    return {
+        name: engine.pool.metrics.snapshot(engine.pool)
+        for name, engine in engines.created().items()
+    }
+
+
+def _pool_metrics():
+    """/metrics 渲染时输出各库连接池状态"""
+    gauges = ("pool_size", "checked_out", "checked_in", "overflow", "waiting")
+    counters = ("checkouts", "timeouts")
+    stats = pool_stats()
+    lines = []
+    for key in gauges:
+        lines.append(f"# TYPE db_pool_{key} gauge")
+        lines.extend(f'db_pool_{key}{{database="{name}"}} {s[key]}' for name, s in stats.items())
+    for key in counters:
+        lines.append(f"# TYPE db_pool_{key}_total counter")
+        lines.extend(f'db_pool_{key}_total{{database="{name}"}} {s[key]}' for name, s in stats.items())
+    return lines
+
+
+registry.add_collector(_pool_metrics)
+
 # Distinct Base metadata objects (one per DB) - used by Alembic target_metadata
 SsoBase = create_base()
 PublicBase = create_base()
@@ -8,7 +8,8 @@ from app.common.exceptions import BusinessException
 from app.common.messages import Message
 from app.common.status_code import ErrorCode
 from app.core.logger import logger
-from app.core.security import decode_token
+from app.core.security import verify_token
+from app.services.sso.token_revocation import token_revocations
 
 bearer_scheme = HTTPBearer(auto_error=False)
 
@@ -22,14 +23,15 @@ def get_bearer_token(request: Request):
 内部复用函数：尝试解码 access token。
 - 成功返回 payload(dict)
 - token 不存在返回 None
-- token 无效或不是 access 类型抛 BusinessException
+- token 无效、已吊销或不是 access 类型抛 BusinessException
+验签结果按 token 缓存，吊销检查只查进程内集合，请求路径上不查库。
 """
 def _decode_access_token_or_none(token: Optional[str]) -> Optional[Dict]:
     if not token:
         return None
 
     try:
-        payload = decode_token(token)
+        payload = verify_token(token)
     except Exception:
         # token 无效或过期
         raise BusinessException(
@@ -44,6 +46,13 @@ def _decode_access_token_or_none(token: Optional[str]) -> Optional[Dict]:
             message=Message.INVALID_TOKEN_TYPE if hasattr(Message, "INVALID_TOKEN_TYPE") else "Access token required"
         )
 
+    # 注销 / 单点登录后，旧 access token 立即失效
+    if token_revocations.is_revoked(payload):
+        raise BusinessException(
+            code=ErrorCode.INVALID_OR_EXPIRED_TOKEN,
+            message=Message.TOKEN_REVOKED
+        )
+
     return payload
 
 """
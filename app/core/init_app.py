@@ -12,6 +12,10 @@ validation_exception_handler
 )
 from app.core.config import settings
 from app.core.logger import logger
+from app.core.scheduler import start_scheduler, shutdown_scheduler
+from app.core.password_hasher import password_hasher
+from app.core.middleware import AuditLogMiddleware, MetricsMiddleware
+from app.services.public.audit_log_writer import audit_log_writer
 
 from app.controllers import (
 auth_router,
@@ -29,15 +33,24 @@ security_group_router,
 security_group_rule_router,
 image_router,
 instance_type_router,
-disk_type_router
+disk_type_router,
+audit_log_router,
+monitor_router,
+metrics_router
 )
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # 启动前逻辑
     logger.info("🚀 Application starting up...")
+    start_scheduler()
+    if settings.AUDIT_LOG_ENABLED:
+        audit_log_writer.start()
     yield
     # 关闭时逻辑
+    shutdown_scheduler()
+    password_hasher.shutdown()
+    audit_log_writer.stop()
     logger.info("🛑 Application shutting down...")
 
 def create_app() -> FastAPI:
@@ -57,6 +70,13 @@ def create_app() -> FastAPI:
         allow_headers=["*"],  # 允许所有自定义头
     )
 
+    # 写操作审计：请求结束后只入队，由后台线程批量落库
+    if settings.AUDIT_LOG_ENABLED:
+        app.add_middleware(AuditLogMiddleware, writer=audit_log_writer, methods=settings.AUDIT_LOG_METHODS)
+
+    # 请求延迟 / 状态码 / DB 与云 API 耗时指标，放在最外层以覆盖 CORS 等中间件耗时
+    app.add_middleware(MetricsMiddleware)
+
     # include routers
     routers = [
         auth_router,
@@ -74,10 +94,13 @@ def create_app() -> FastAPI:
         security_group_rule_router,
         image_router,
         instance_type_router,
-        disk_type_router
+        disk_type_router,
+        audit_log_router,
+        monitor_router
     ]
     for r in routers:
         app.include_router(r, prefix=settings.API_PREFIX)
+    app.include_router(metrics_router)
 
     # 注册全局异常处理
     app.add_exception_handler(BusinessException, business_exception_handler)
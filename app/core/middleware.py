@@ -0,0 +1,122 @@
+# app/core/middleware.py
+import time
+from datetime import datetime, timezone
+
+from app.core.metrics import (
+    HTTP_CLOUD_TIME,
+    HTTP_DB_TIME,
+    HTTP_IN_FLIGHT,
+    HTTP_LATENCY,
+    HTTP_REQUESTS,
+    RequestTimings,
+    request_timings,
+)
+
+# 不记录的路径（抓取指标本身）
+SKIP_PATHS = {"/metrics"}
+
+
+class MetricsMiddleware:
+    """
+    纯 ASGI 中间件：按路由模板（而不是原始 path，避免标签基数爆炸）记录
+    延迟直方图、在途请求数、状态码计数，以及请求内 DB / 云 API 耗时。
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] in SKIP_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        # 路由匹配前还不知道路由模板，在途数只按 method 统计
+        HTTP_IN_FLIGHT.inc(method)
+        status = {"code": 500}
+
+        async def _send(message):
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+            await send(message)
+
+        timings = RequestTimings()
+        token = request_timings.set(timings)
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, _send)
+        finally:
+            elapsed = time.perf_counter() - start
+            request_timings.reset(token)
+            HTTP_IN_FLIGHT.dec(method)
+
+            route = scope.get("route")
+            route_path = getattr(route, "path", None) or "unmatched"
+            HTTP_REQUESTS.inc(method, route_path, str(status["code"]))
+            HTTP_LATENCY.observe(elapsed, method, route_path)
+            HTTP_DB_TIME.observe(timings.db, method, route_path)
+            HTTP_CLOUD_TIME.observe(timings.cloud, method, route_path)
+
+
+# 审计时最多保留的响应体字节数（只用来读业务码 / 错误信息，业务异常响应很小）
+AUDIT_BODY_LIMIT = 4096
+
+
+def _header(headers, name: bytes) -> str:
+    for key, value in headers:
+        if key == name:
+            return value.decode("latin-1")
+    return ""
+
+
+class AuditLogMiddleware:
+    """
+    纯 ASGI 中间件：写操作结束后把路由、状态码、来源 IP、token 等原始信息交给审计写入器。
+    这里只做一次非阻塞入队，模块 / 动作 / 用户的解析和落库都在写入器的后台线程里完成。
+    """
+
+    def __init__(self, app, writer, methods):
+        self.app = app
+        self.writer = writer
+        self.methods = set(methods)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] not in self.methods:
+            await self.app(scope, receive, send)
+            return
+
+        created_at = datetime.now(timezone.utc)
+        status = {"code": 500, "json": False}
+        body = bytearray()
+
+        async def _send(message):
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+                status["json"] = b"json" in _header(message.get("headers", []), b"content-type").encode()
+            elif status["json"] and len(body) < AUDIT_BODY_LIMIT:
+                body.extend(message.get("body", b"")[:AUDIT_BODY_LIMIT - len(body)])
+            await send(message)
+
+        try:
+            await self.app(scope, receive, _send)
+        finally:
+            route = scope.get("route")
+            # 未匹配到路由（404 / 405）不记审计
+            if route is not None:
+                headers = scope.get("headers", [])
+                authorization = _header(headers, b"authorization")
+                forwarded = _header(headers, b"x-forwarded-for").split(",")[0].strip()
+                client = scope.get("client")
+                self.writer.submit({
+                    "method": scope["method"],
+                    "path": scope["path"],
+                    "route_path": getattr(route, "path", scope["path"]),
+                    "endpoint": getattr(route, "name", None),
+                    "path_params": dict(scope.get("path_params") or {}),
+                    "query": scope.get("query_string", b"").decode("latin-1"),
+                    "status_code": status["code"],
+                    "body": bytes(body),
+                    "token": authorization[7:] if authorization.lower().startswith("bearer ") else None,
+                    "ip": forwarded or (client[0] if client else None),
+                    "created_at": created_at,
+                })
@@ -0,0 +1,146 @@
+# app/core/password_hasher.py
+import multiprocessing
+import threading
+import time
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeout
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional, Tuple
+
+import bcrypt
+
+from app.common.exceptions import BusinessException
+from app.common.messages import Message
+from app.common.status_code import ErrorCode
+from app.core.config import settings
+from app.core.logger import logger
+from app.core.metrics import Counter, Gauge, Histogram, registry
+
+# bcrypt 只取前 72 字节（与原 passlib 行为一致；bcrypt>=4.1 对超长密码直接报错，这里先截断）
+_BCRYPT_MAX_BYTES = 72
+
+_HASH_BUCKETS = (0.025, 0.05, 0.1, 0.2, 0.3, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+PASSWORD_HASH_LATENCY = registry.register(Histogram(
+    "password_hash_duration_seconds", "bcrypt hash / verify CPU time on the password executor", ("op",),
+    buckets=_HASH_BUCKETS))
+PASSWORD_HASH_WAIT = registry.register(Histogram(
+    "password_hash_wait_seconds", "Time a password hash / verify spent queued before running", ("op",),
+    buckets=_HASH_BUCKETS))
+PASSWORD_HASH_PENDING = registry.register(Gauge(
+    "password_hash_pending", "Password hash / verify calls queued or running on the password executor"))
+PASSWORD_HASH_REJECTED = registry.register(Counter(
+    "password_hash_rejected_total", "Password hash / verify calls rejected (queue full or timed out)",
+    ("op", "reason")))
+
+
+# ------------------------------------------------------------
+# 在执行器里运行的函数：必须是模块级函数，进程池才能 pickle；返回 (结果, 实际计算耗时)
+# ------------------------------------------------------------
+def _secret(password: str) -> bytes:
+    return password.encode("utf-8")[:_BCRYPT_MAX_BYTES]
+
+
+def _hash(password: str, rounds: int) -> Tuple[str, float]:
+    start = time.perf_counter()
+    hashed = bcrypt.hashpw(_secret(password), bcrypt.gensalt(rounds)).decode("ascii")
+    return hashed, time.perf_counter() - start
+
+
+def _verify(password: str, hashed_password: str) -> Tuple[bool, float]:
+    """cost 写在哈希串里：调整 rounds 后旧哈希照常校验，新哈希按新 cost 生成"""
+    start = time.perf_counter()
+    ok = bcrypt.checkpw(_secret(password), hashed_password.encode("ascii"))
+    return ok, time.perf_counter() - start
+
+
+class PasswordHasher:
+    """
+    bcrypt 专用执行器：哈希 / 校验不占用 starlette 的请求线程池去跑 CPU。
+    - 线程池或进程池（use_processes，spawn 启动，彻底绕开 GIL），首次使用时创建
+    - 排队 + 执行中的调用数超过 max_pending 时直接拒绝（服务繁忙），不再无限堆积
+    - 等待结果超过 timeout 秒返回超时；名额在任务真正结束时才归还
+    """
+
+    def __init__(self, rounds: int, workers: int, use_processes: bool, max_pending: int, timeout: float):
+        self.rounds = rounds
+        self.workers = max(1, workers)
+        self.use_processes = use_processes
+        self.timeout = timeout
+        self._slots = threading.BoundedSemaphore(max(1, max_pending))
+        self._executor: Optional[Executor] = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> Executor:
+        with self._lock:
+            if self._executor is None:
+                if self.use_processes:
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.workers, mp_context=multiprocessing.get_context("spawn"))
+                else:
+                    self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="password-hash")
+            return self._executor
+
+    def _reset_executor(self, broken: Executor) -> None:
+        with self._lock:
+            if self._executor is broken:
+                self._executor = None
+        broken.shutdown(wait=False)
+
+    def _release(self, _future: Future) -> None:
+        PASSWORD_HASH_PENDING.dec()
+        self._slots.release()
+
+    def _run(self, op: str, fn: Callable[..., Tuple[Any, float]], *args) -> Any:
+        if not self._slots.acquire(blocking=False):
+            PASSWORD_HASH_REJECTED.inc(op, "full")
+            logger.warning("password %s rejected: executor queue full", op)
+            raise BusinessException(code=ErrorCode.SERVER_BUSY, message=Message.SERVER_BUSY)
+
+        PASSWORD_HASH_PENDING.inc()
+        start = time.perf_counter()
+        executor = self._get_executor()
+        try:
+            future = executor.submit(fn, *args)
+        except BaseException:
+            self._release(None)
+            raise
+        future.add_done_callback(self._release)
+
+        try:
+            result, elapsed = future.result(timeout=self.timeout)
+        except FutureTimeout:
+            future.cancel()
+            PASSWORD_HASH_REJECTED.inc(op, "timeout")
+            logger.warning("password %s timed out after %ss", op, self.timeout)
+            raise BusinessException(code=ErrorCode.TIMEOUT_ERROR, message=Message.TIMEOUT_ERROR)
+        except BrokenProcessPool:
+            # 子进程异常退出后进程池不可再用，丢弃后下次调用重建
+            logger.error("password executor broken, recreating")
+            self._reset_executor(executor)
+            raise
+
+        PASSWORD_HASH_LATENCY.observe(elapsed, op)
+        PASSWORD_HASH_WAIT.observe(max(0.0, time.perf_counter() - start - elapsed), op)
+        return result
+
+    def hash(self, password: str) -> str:
+        return self._run("hash", _hash, password, self.rounds)
+
+    def verify(self, password: str, hashed_password: str) -> bool:
+        return self._run("verify", _verify, password, hashed_password)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+
+password_hasher = PasswordHasher(
+    rounds=settings.PASSWORD_BCRYPT_ROUNDS,
+    workers=settings.PASSWORD_HASH_WORKERS,
+    use_processes=settings.PASSWORD_HASH_USE_PROCESSES,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING,
+    timeout=settings.PASSWORD_HASH_TIMEOUT_SECONDS,
+)
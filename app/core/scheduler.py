@@ -0,0 +1,199 @@
+# app/core/scheduler.py
+import threading
+from datetime import datetime, timezone
+from typing import Any, Optional
+
+from sqlalchemy import text
+
+from app.core.config import settings
+from app.core.database import engines, SessionLocal
+from app.core.logger import logger
+
+
+class LeaderLock:
+    """
+    基于 MySQL GET_LOCK 的单 leader 锁：多个 uvicorn worker 中只有持锁的进程执行后台任务。
+    锁绑定在一个常驻连接上，进程退出或连接断开时 MySQL 自动释放，其他 worker 下一轮接管。
+    """
+
+    def __init__(self, db: str, name: str):
+        self.db = db
+        self.name = name
+        self._conn = None
+        self._lock = threading.Lock()
+
+    def is_leader(self) -> bool:
+        with self._lock:
+            if self._conn is not None:
+                try:
+                    held = self._conn.execute(
+                        text("SELECT IS_USED_LOCK(:name) = CONNECTION_ID()"), {"name": self.name}
+                    ).scalar()
+                    if held:
+                        return True
+                except Exception as e:
+                    logger.warning("leader lock check failed: %s", e)
+                self._close()
+
+            conn = engines[self.db].connect()
+            try:
+                acquired = conn.execute(text("SELECT GET_LOCK(:name, 0)"), {"name": self.name}).scalar()
+            except Exception as e:
+                conn.close()
+                logger.warning("leader lock acquire failed: %s", e)
+                return False
+            if acquired == 1:
+                self._conn = conn
+                logger.info("acquired scheduler leader lock %s", self.name)
+                return True
+            conn.close()
+            return False
+
+    def release(self) -> None:
+        with self._lock:
+            if self._conn is None:
+                return
+            try:
+                self._conn.execute(text("SELECT RELEASE_LOCK(:name)"), {"name": self.name})
+            except Exception:
+                pass
+            self._close()
+
+    def _close(self) -> None:
+        try:
+            self._conn.close()
+        except Exception:
+            pass
+        self._conn = None
+
+
+leader_lock = LeaderLock("public", settings.CATALOG_SYNC_LOCK_NAME)
+scheduler: Optional[Any] = None
+
+
+def _run_catalog_task(task: str) -> None:
+    """每次执行都先确认 leader 身份，再逐个云厂商执行同步"""
+    if not leader_lock.is_leader():
+        return
+
+    # 延迟导入，避免 core 层在 import 时依赖 services
+    from app.services.public.catalog_sync_service import CatalogSyncService
+
+    public_db = SessionLocal["public"]()
+    cmp_db = SessionLocal["cmp"]()
+    try:
+        service = CatalogSyncService(public_db, cmp_db)
+        for provider in service.providers():
+            try:
+                getattr(service, task)(provider)
+            except Exception as e:
+                public_db.rollback()
+                cmp_db.rollback()
+                logger.error("catalog task %s failed for %s: %s", task, provider.provider_code, e, exc_info=True)
+    finally:
+        public_db.close()
+        cmp_db.close()
+
+
+def _purge_expired_sessions() -> None:
+    """清理过期会话，控制 ss_sessions 的表规模；同样只由 leader 执行"""
+    if not leader_lock.is_leader():
+        return
+
+    from app.services.sso.session_service import SessionService
+
+    db = SessionLocal["sso"]()
+    try:
+        removed = SessionService(db).purge_expired()
+        if removed:
+            logger.info("purged %s expired sessions", removed)
+    except Exception as e:
+        db.rollback()
+        logger.error("purge expired sessions failed: %s", e, exc_info=True)
+    finally:
+        db.close()
+
+
+def _maintain_audit_partitions() -> None:
+    """审计日志分区维护：补建未来月份分区，归档并删除过期分区；只由 leader 执行"""
+    if not leader_lock.is_leader():
+        return
+
+    from app.services.public.audit_log_service import AuditLogService
+
+    db = SessionLocal["audit_center"]()
+    try:
+        AuditLogService(db).maintain_partitions()
+    except Exception as e:
+        db.rollback()
+        logger.error("maintain audit partitions failed: %s", e, exc_info=True)
+    finally:
+        db.close()
+
+
+# (任务方法, 间隔分钟)
+CATALOG_JOBS = (
+    ("sync_regions_and_zones", settings.CATALOG_SYNC_REGION_MINUTES),
+    ("sync_instance_types", settings.CATALOG_SYNC_INSTANCE_TYPE_MINUTES),
+    ("sync_stock", settings.CATALOG_SYNC_STOCK_MINUTES),
+    ("sync_network", settings.CATALOG_SYNC_NETWORK_MINUTES),
+)
+
+
+def start_scheduler() -> None:
+    global scheduler
+    if scheduler is not None or not (
+            settings.CATALOG_SYNC_ENABLED or settings.SESSION_PURGE_ENABLED or settings.AUDIT_LOG_MAINTENANCE_ENABLED):
+        return
+
+    # 没有任何后台任务时不加载 APScheduler
+    from apscheduler.schedulers.background import BackgroundScheduler
+
+    scheduler = BackgroundScheduler(timezone="UTC")
+    if settings.CATALOG_SYNC_ENABLED:
+        for task, minutes in CATALOG_JOBS:
+            scheduler.add_job(
+                _run_catalog_task,
+                "interval",
+                args=[task],
+                id=f"catalog:{task}",
+                minutes=minutes,
+                jitter=settings.CATALOG_SYNC_JITTER_SECONDS,
+                max_instances=1,
+                coalesce=True,
+                # 启动后立即跑一轮，尽快把表预热
+                next_run_time=datetime.now(timezone.utc),
+            )
+    if settings.SESSION_PURGE_ENABLED:
+        scheduler.add_job(
+            _purge_expired_sessions,
+            "interval",
+            id="sso:purge_expired_sessions",
+            minutes=settings.SESSION_PURGE_MINUTES,
+            jitter=settings.CATALOG_SYNC_JITTER_SECONDS,
+            max_instances=1,
+            coalesce=True,
+        )
+    if settings.AUDIT_LOG_MAINTENANCE_ENABLED:
+        scheduler.add_job(
+            _maintain_audit_partitions,
+            "interval",
+            id="audit:maintain_partitions",
+            minutes=settings.AUDIT_LOG_MAINTENANCE_MINUTES,
+            jitter=settings.CATALOG_SYNC_JITTER_SECONDS,
+            max_instances=1,
+            coalesce=True,
+            # 启动时先检查一次，避免跨月时缺少当月分区
+            next_run_time=datetime.now(timezone.utc),
+        )
+    scheduler.start()
+    logger.info("⏰ Background scheduler started")
+
+
+def shutdown_scheduler() -> None:
+    global scheduler
+    if scheduler is None:
+        return
+    scheduler.shutdown(wait=False)
+    scheduler = None
+    leader_lock.release()
@@ -1,37 +1,67 @@
+import hashlib
+import time
+import uuid
 from datetime import datetime, timedelta, timezone
 
-from passlib.context import CryptContext
 from jose import jwt
 from typing import Dict
+from app.common.cache import LRUTTLCache
 from app.core.config import settings
 from app.core.logger import logger
+from app.core.password_hasher import password_hasher
 
 JWT_SECRET = settings.SECRET_KEY
 JWT_ALGORITHM = settings.ALGORITHM
 ACCESS_TOKEN_EXPIRE_MINUTES = settings.ACCESS_TOKEN_EXPIRE_MINUTES
 REFRESH_EXPIRE_DAYS=settings.REFRESH_TOKEN_EXPIRE_DAYS
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
+# bcrypt 在专用执行器上运行（见 app/core/password_hasher.py），不占用请求线程池的 CPU
 def hash_password(password: str) -> str:
-    return pwd_context.hash(password)
+    return password_hasher.hash(password)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+    return password_hasher.verify(plain_password, hashed_password)
 
 
 def create_access_token(subject: Dict, expires_minutes: int = ACCESS_TOKEN_EXPIRE_MINUTES) -> str:
     to_encode = subject.copy()
-    expire = datetime.now(timezone.utc) + timedelta(minutes=expires_minutes)
-    to_encode.update({"exp": expire, "type": "access"})
+    now = datetime.now(timezone.utc)
+    expire = now + timedelta(minutes=expires_minutes)
+    to_encode.update({"exp": expire, "iat": now, "type": "access"})
     return jwt.encode(to_encode, JWT_SECRET, algorithm=JWT_ALGORITHM)
 
 def create_refresh_token(subject: Dict, expires_days: int = REFRESH_EXPIRE_DAYS) -> str:
     to_encode = subject.copy()
-    expire = datetime.now(timezone.utc) + timedelta(days=expires_days)
-    to_encode.update({"exp": expire, "type": "refresh"})
+    now = datetime.now(timezone.utc)
+    expire = now + timedelta(days=expires_days)
+    # jti 保证同一用户同一秒内签发的 refresh token 也各不相同，token_hash 唯一索引不会冲突
+    to_encode.update({"exp": expire, "iat": now, "type": "refresh", "jti": uuid.uuid4().hex})
     return jwt.encode(to_encode, JWT_SECRET, algorithm=JWT_ALGORITHM)
 
+def hash_refresh_token(token: str) -> str:
+    """refresh token 入库 / 查询都用 SHA-256 摘要（定长 64 位 hex，可建唯一索引）"""
+    return hashlib.sha256(token.encode()).hexdigest()
+
 def decode_token(token: str) -> Dict:
     return jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALGORITHM])
+
+
+# 验签结果缓存：key 为 token 的 sha256，过期时间不晚于 token 的 exp；只缓存验签通过的 token
+_verified_tokens = LRUTTLCache(settings.TOKEN_VERIFY_CACHE_MAX_ENTRIES)
+
+
+def verify_token(token: str) -> Dict:
+    """decode_token 的缓存版本：同一个 token 重复请求时跳过签名校验；无效 / 过期时照常抛异常"""
+    key = hashlib.sha256(token.encode()).hexdigest()
+    payload = _verified_tokens.get(key)
+    if payload is not None:
+        if payload.get("exp", 0) > time.time():
+            return dict(payload)
+        _verified_tokens.delete(key)
+
+    payload = decode_token(token)
+    ttl = min(payload.get("exp", 0) - time.time(), settings.TOKEN_VERIFY_CACHE_TTL_SECONDS)
+    if ttl > 0:
+        _verified_tokens.set(key, payload, ttl)
+    return dict(payload)
@@ -4,6 +4,7 @@ from .public.audit_log import AuditLog
 from .public.cloud_zone import CloudZone
 from .public.cloud_certificate import CloudCertificate
 from .public.resource_group import ResourceGroup, ResourceGroupBinding
+from .public.catalog_sync_state import CatalogSyncState
 
 from .cmp.dict_item import DictItem
 from .cmp.vpc import Vpc
@@ -17,3 +18,4 @@ from .sso.user import User
 from .sso.role import Role
 from .sso.user_role_association import user_role_association
 from .sso.session import UserSession
+from .sso.token_revocation import TokenRevocation
@@ -1,13 +1,23 @@
 from datetime import datetime, timezone
-from sqlalchemy import Column, String, Text, Integer, DateTime
+from sqlalchemy import BigInteger, Column, String, Text, DateTime, Index
 from app.core.config import settings
-from app.core.database import PublicBase
+from app.core.database import AuditBase
 
-class AuditLog(PublicBase):
-    __tablename__ = f"{settings.PUBLIC_TABLE_PREFIX}audit_log"
-    __table_args__ = {'comment': '操作审计日志表'}
+class AuditLog(AuditBase):
+    """
+    审计日志存放在 audit_center 库，按 created_at 月度 RANGE 分区（见 alembic/audit_center 迁移）：
+    MySQL 要求分区列出现在每个唯一键里，所以主键为 (id, created_at)。
+    """
+    __tablename__ = f"{settings.AUDIT_TABLE_PREFIX}audit_log"
+    __table_args__ = (
+        # 按用户 / 按模块动作的时间范围查询；InnoDB 二级索引隐含主键，(created_at, id) 游标排序可直接走索引
+        Index(f"ix_{settings.AUDIT_TABLE_PREFIX}audit_log_user_created", "user_id", "created_at"),
+        Index(f"ix_{settings.AUDIT_TABLE_PREFIX}audit_log_module_action_created", "module", "action", "created_at"),
+        Index(f"ix_{settings.AUDIT_TABLE_PREFIX}audit_log_created_at", "created_at"),
+        {'comment': '操作审计日志表（按月分区）'},
+    )
 
-    id = Column(Integer, primary_key=True, index=True, autoincrement=True)
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
     user_id = Column(String(50), nullable=True, comment="操作用户ID")
     username = Column(String(100), nullable=True, comment="操作用户名")
     module = Column(String(100), nullable=False, comment="操作模块，例如 cloud、asset、user")
@@ -21,7 +31,8 @@ class AuditLog(PublicBase):
     ip_address = Column(String(50), nullable=True, comment="请求来源IP")
     created_at = Column(
         DateTime(timezone=True),
+        primary_key=True,
         default=lambda: datetime.now(timezone.utc),
         nullable=False,
-        comment="创建时间 (UTC)"
+        comment="创建时间 (UTC)，分区键"
     )
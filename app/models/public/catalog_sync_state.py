@@ -0,0 +1,22 @@
+from datetime import datetime, timezone
+from sqlalchemy import Column, String, DateTime, Integer, UniqueConstraint
+from app.core.config import settings
+from app.core.database import PublicBase
+
+class CatalogSyncState(PublicBase):
+    __tablename__ = f"{settings.PUBLIC_TABLE_PREFIX}catalog_sync_state"
+    __table_args__ = (
+        UniqueConstraint('provider_code', 'kind', 'scope', name='uq_provider_kind_scope'),
+        {'comment': '云资源目录同步时间'}
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    provider_code = Column(String(50), nullable=False, comment="云厂商编码，例如 aliyun")
+    kind = Column(String(50), nullable=False, comment="目录类型，例如 zones、vpcs")
+    scope = Column(String(200), nullable=False, default="", comment="同步范围：region_id 或 region_id/vpc_id，厂商级为空串")
+    synced_at = Column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        nullable=False,
+        comment="最近一次成功同步时间 (UTC)"
+    )
@@ -9,8 +9,8 @@ class UserSession(SsoBase):
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey(f"{settings.SSO_TABLE_PREFIX}users.id"), nullable=False, index=True, comment="用户ID")
-    refresh_token = Column(String(512), nullable=False, comment="刷新 token（hash 或原文）")
-    expires_at = Column(DateTime, nullable=False, comment="刷新 token 到期时间")
+    token_hash = Column(String(64), nullable=False, unique=True, index=True, comment="刷新 token 的 SHA-256（hex），不存原文")
+    expires_at = Column(DateTime, nullable=False, index=True, comment="刷新 token 到期时间")
     ip = Column(String(64), nullable=True, comment="登录IP")
     user_agent = Column(String(512), nullable=True, comment="客户端 UA")
     created_at = Column(DateTime, server_default=func.now(), comment="创建时间")
@@ -0,0 +1,10 @@
+from sqlalchemy import Column, Integer, DateTime
+from app.core.database import SsoBase
+from app.core.config import settings
+
+class TokenRevocation(SsoBase):
+    __tablename__ = f"{settings.SSO_TABLE_PREFIX}token_revocations"
+    __table_args__ = {"comment": "access token 吊销记录：签发时间早于 revoked_before 的 token 一律失效"}
+
+    user_id = Column(Integer, primary_key=True, autoincrement=False, comment="用户ID")
+    revoked_before = Column(DateTime(timezone=True), nullable=False, index=True, comment="吊销时间点 (UTC)，各 worker 按此增量同步")
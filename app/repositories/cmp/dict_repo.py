@@ -2,6 +2,7 @@ from sqlalchemy.orm import Session
 from sqlalchemy import select, func
 from typing import List, Optional, Any
 
+from app.common.pagination import CountMode, CursorResult, keyset_paginate
 from app.models.cmp.dict_item import DictItem
 from app.schemas.cmp.dict_schema import DictItemCreate, DictItemUpdate, DictItemListOut, DictItemOut
 
@@ -77,6 +78,27 @@ class DictRepository:
         page: int = 1,
         size: int = 10
     ) -> DictItemListOut:
+        query = self._list_query(type_code, keyword)
+        total = query.count()
+        db_items = query.order_by(DictItem.id.asc()).offset((page - 1) * size).limit(size).all()
+        items = [DictItemOut.model_validate(obj) for obj in db_items]
+        return DictItemListOut(total=total, items=items)
+
+    # -----------------------------
+    # 游标分页查询（id 正序，与 list 一致）
+    # -----------------------------
+    def list_cursor(
+        self,
+        type_code: Optional[str] = None,
+        keyword: Optional[str] = None,
+        cursor: Optional[str] = None,
+        page_size: int = 20,
+        count: CountMode = CountMode.NONE,
+    ) -> CursorResult:
+        query = self._list_query(type_code, keyword)
+        return keyset_paginate(query, [DictItem.id], page_size, cursor, desc=False, count=count)
+
+    def _list_query(self, type_code: Optional[str], keyword: Optional[str]):
         query = self.db.query(DictItem)
         if type_code:
             query = query.filter_by(type_code = type_code)
@@ -85,7 +107,4 @@ class DictRepository:
             query = query.filter(
                 (DictItem.item_name.ilike(like_keyword)) | (DictItem.item_code.ilike(like_keyword))
             )
-        total = query.count()
-        db_items = query.order_by(DictItem.id.asc()).offset((page - 1) * size).limit(size).all()
-        items = [DictItemOut.model_validate(obj) for obj in db_items]
-        return DictItemListOut(total=total, items=items)
+        return query
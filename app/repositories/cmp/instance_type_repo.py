@@ -1,9 +1,10 @@
 # app/repositories/cmp/instance_type_repo.py
-from sqlalchemy import not_, func
+from sqlalchemy import not_, func, select, Select
 from sqlalchemy.orm import Session
 from typing import List, Optional, Dict, Any, Union
 from datetime import datetime
 from app.models.cmp.instance_type import InstanceType
+from app.common.bulk_upsert import bulk_upsert, UpsertResult
 
 
 class InstanceTypeRepo:
@@ -11,7 +12,7 @@ class InstanceTypeRepo:
         self.db = db
 
     #   批量插入或更新可用区数据
-    def bulk_upsert(self, provider_code: str, instances: List[dict]):
+    def bulk_upsert(self, provider_code: str, instances: List[dict]) -> UpsertResult:
 
         now = datetime.now()
 
@@ -31,23 +32,25 @@ class InstanceTypeRepo:
             "price",
         ]
 
+        columns = {"instance_type_id", "cloud_provider_code", "created_at", "updated_at", *updatable_fields}
+        rows = []
         for i in instances:
-            existing = (
-                self.db.query(InstanceType)
-                .filter(
-                    InstanceType.cloud_provider_code == provider_code,
-                    InstanceType.instance_type_id == i["instance_type_id"],
-                )
-                .first()
-            )
-            if existing:
-                for field in updatable_fields:
-                    setattr(existing, field, i.get(field))
-                existing.updated_at = now
-            else:
-                i["cloud_provider_code"] = provider_code
-                self.db.add(InstanceType(**i))
+            row = {field: i.get(field) for field in columns}
+            row["cloud_provider_code"] = provider_code
+            row["created_at"] = now
+            row["updated_at"] = now
+            rows.append(row)
+
+        result = bulk_upsert(
+            self.db,
+            InstanceType,
+            rows,
+            key_fields=("instance_type_id",),
+            update_fields=updatable_fields,
+            scope={"cloud_provider_code": provider_code},
+        )
         self.db.commit()
+        return result
 
 
     def get_by_instance_type(self, provider_code: str) -> list[type[InstanceType]]:
@@ -76,4 +79,31 @@ class InstanceTypeRepo:
             .filter(InstanceType.instance_type_id.in_(instance_type_ids))
             .all()
         )
-        return {r.instance_type_id: r for r in rows}
\ No newline at end of file
+        return {r.instance_type_id: r for r in rows}
+
+    #   规格目录索引所需的列（只取元组，不构造 ORM 对象）
+    def index_rows(self, provider_code: str) -> List[tuple]:
+        return (
+            self.db.query(
+                InstanceType.instance_type_id,
+                InstanceType.instance_family,
+                InstanceType.cpu_core_count,
+                InstanceType.memory_size,
+                InstanceType.architecture,
+                InstanceType.gpu_amount,
+                InstanceType.gpu_spec,
+                InstanceType.gpu_memory,
+            )
+            .filter(InstanceType.cloud_provider_code == provider_code)
+            .order_by(InstanceType.id)
+            .all()
+        )
+
+    #   导出语句（按主键顺序，配合 yield_per 流式读取）
+    @staticmethod
+    def export_stmt(provider_code: str) -> Select:
+        return (
+            select(InstanceType.__table__)
+            .where(InstanceType.cloud_provider_code == provider_code)
+            .order_by(InstanceType.id)
+        )
@@ -1,4 +1,5 @@
 from typing import List, Optional
+from sqlalchemy import select, Select
 from sqlalchemy.orm import Session
 from nanoid import generate
 
@@ -8,6 +9,9 @@ from app.models.cmp.vpc import Vpc  # 假设你有 vpc 模型
 from datetime import datetime, timezone
 
 from app.schemas.cmp.security_group_schema import SecurityGroupSearch, SecurityGroupCreate, SecurityGroupOut
+from app.common.bulk_upsert import bulk_upsert, UpsertResult
+from app.common.pagination import CountMode, CursorResult, keyset_paginate
+from app.core.logger import logger
 
 
 class SecurityGroupRepository:
@@ -27,60 +31,63 @@ class SecurityGroupRepository:
         q = q.order_by(SecurityGroup.created_at.desc())
         return q
 
-    def bulk_upsert_from_cloud(self, provider_code: str, region_id: str, items: List[dict]):
+    #   游标分页：id 为 uuid 不单调，按 (created_at, id) 倒序定位
+    def search_cursor(self, filters: SecurityGroupSearch, cursor: Optional[str] = None,
+                      count: CountMode = CountMode.NONE) -> CursorResult:
+        keys = [SecurityGroup.created_at, SecurityGroup.id]
+        return keyset_paginate(self.search(filters), keys, filters.page_size, cursor, count=count)
+
+    def bulk_upsert_from_cloud(self, provider_code: str, region_id: str, items: List[dict]) -> UpsertResult:
         now = datetime.now(timezone.utc)
-        upserted = []
+
+        # 一次性把云端 VpcId 映射为本地 Vpc.id（避免逐行查询）
+        cloud_vpc_ids = {v.get("VpcId") for v in items if v.get("VpcId")}
+        vpc_map = {}
+        if cloud_vpc_ids:
+            vpc_map = dict(
+                self.db.query(Vpc.vpc_id, Vpc.id)
+                .filter(Vpc.vpc_id.in_(cloud_vpc_ids))
+                .all()
+            )
+
+        rows = []
         for v in items:
-            cloud_group_id = v.get("SecurityGroupId") or v.get("SecurityGroupId")
+            cloud_group_id = v.get("SecurityGroupId")
             if not cloud_group_id:
                 continue
 
-            existing: Optional[SecurityGroup] = (
-                self.db.query(SecurityGroup)
-                .filter(SecurityGroup.cloud_group_id == cloud_group_id)
-                .first()
-            )
-
-            # Determine local_vpc_id by matching cloud VpcId to local Vpc.cloud_vpc_id (your vpc table)
-            cloud_vpc_id = v.get("VpcId")
-            local_vpc = None
-            if cloud_vpc_id:
-                local_vpc = (
-                    self.db.query(Vpc)
-                    .filter(Vpc.vpc_id == cloud_vpc_id)
-                    .first()
-                )
-
-            if existing:
-                existing.security_name = v.get("SecurityGroupName") or existing.security_name
-                existing.description = v.get("Description") or existing.description
-                existing.resource_group_id = v.get("ResourceGroupId") or existing.resource_group_id
-                existing.cloud_vpc_id = cloud_vpc_id or existing.cloud_vpc_id
-                existing.vpc_id = local_vpc.id if local_vpc else existing.vpc_id
-                existing.updated_at = now
-                upserted.append(existing)
-            else:
-                new_obj = SecurityGroup(
-                    id=None,  # if your model expects UUID, let DB / app generate; else remove
-                    cloud_group_id=cloud_group_id,
-                    cloud_provider_code=provider_code,
-                    provider_code=provider_code,
-                    credential_id=0,  # you may want to fill credential id from context
-                    region_id=region_id,
-                    security_name=v.get("SecurityGroupName") or "",
-                    description=v.get("Description"),
-                    resource_group_id=v.get("ResourceGroupId"),
-                    cloud_vpc_id=cloud_vpc_id,
-                    vpc_id=local_vpc.id if local_vpc else None,
-                    created_at=now,
-                    updated_at=now,
-                )
-                self.db.add(new_obj)
-                upserted.append(new_obj)
+            local_vpc_id = vpc_map.get(v.get("VpcId"))
+            if local_vpc_id is None:
+                # vpc_id 为非空外键，本地尚未同步对应 VPC 时跳过
+                logger.warning("skip security group %s: vpc %s not synced", cloud_group_id, v.get("VpcId"))
+                continue
 
+            rows.append({
+                "id": generate(size=12),
+                "cloud_group_id": cloud_group_id,
+                "cloud_provider_code": provider_code,
+                "cloud_certificate_id": 0,  # you may want to fill credential id from context
+                "region_id": region_id,
+                "security_name": v.get("SecurityGroupName") or "",
+                "description": v.get("Description"),
+                "resource_group_id": v.get("ResourceGroupId"),
+                "vpc_id": local_vpc_id,
+                "sync_status": 1,
+                "is_released": False,
+                "created_at": now,
+                "updated_at": now,
+            })
+
+        result = bulk_upsert(
+            self.db,
+            SecurityGroup,
+            rows,
+            key_fields=("cloud_group_id",),
+            update_fields=("security_name", "description", "resource_group_id", "vpc_id"),
+            coalesce_fields=("description", "resource_group_id"),
+        )
         self.db.commit()
-        # refresh appended objects if needed
-        return upserted
+        return result
 
     # --------------------------
     # 创建安全组（仅主表）
@@ -151,3 +158,13 @@ class SecurityGroupRepository:
             SecurityGroup.vpc_id==vpc_id
         ).all()
 
+    #   导出语句（未释放的安全组，按主键顺序）
+    @staticmethod
+    def export_stmt(provider_code: str, region_id: Optional[str] = None) -> Select:
+        stmt = select(SecurityGroup.__table__).where(
+            SecurityGroup.cloud_provider_code == provider_code,
+            SecurityGroup.is_released == 0,
+        )
+        if region_id:
+            stmt = stmt.where(SecurityGroup.region_id == region_id)
+        return stmt.order_by(SecurityGroup.id)
@@ -1,4 +1,5 @@
 from typing import List, Optional
+from sqlalchemy import select, Select
 from sqlalchemy.orm import Session
 from nanoid import generate
 
@@ -97,3 +98,11 @@ class SecurityGroupRuleRepository:
     @staticmethod
     def _gen_uuid():
         return generate(size=12)
+
+    #   导出语句（未释放的规则，可按安全组过滤）
+    @staticmethod
+    def export_stmt(security_group_id: Optional[str] = None) -> Select:
+        stmt = select(SecurityGroupRule.__table__).where(SecurityGroupRule.is_released == 0)
+        if security_group_id:
+            stmt = stmt.where(SecurityGroupRule.security_group_id == security_group_id)
+        return stmt.order_by(SecurityGroupRule.id)
@@ -2,8 +2,10 @@
 from datetime import datetime, timezone
 from typing import Optional, List
 
-from sqlalchemy import and_
+from sqlalchemy import and_, select, Select
 from sqlalchemy.orm import Session
+from app.common.bulk_upsert import bulk_upsert, UpsertResult
+from app.common.pagination import CountMode, CursorResult, keyset_paginate
 from app.models.cmp.subnet import Subnet
 from app.schemas.cmp.subnet_schema import SubnetOut, SubnetBase
 
@@ -12,47 +14,42 @@ class SubnetRepository:
     def __init__(self, db: Session):
         self.db = db
 
-    def bulk_upsert(self, provider_code: str, region_id: str, vpc_id: str, subnets: List[SubnetBase]):
+    def bulk_upsert(self, provider_code: str, region_id: str, vpc_id: int, subnets: List[SubnetBase]) -> UpsertResult:
         """
         批量插入或更新子网
         :param provider_code: 云厂商
         :param region_id: 区域ID
-        :param vpc_id: VPC ID
+        :param vpc_id: 本地 VPC 主键（Vpc.id）
         :param subnets: 子网列表，每个字典包含 vswitch_id, vswitch_name, cidr_block, zone_id
+        :return: UpsertResult(inserted, updated, unchanged)
         """
         now = datetime.now(timezone.utc)
-        for s in subnets:
-            subnet_id = s.get("vswitch_id")
-            existing = (
-                self.db.query(Subnet)
-                .filter(
-                    Subnet.cloud_provider_code == provider_code,
-                    Subnet.region_id == region_id,
-                    Subnet.vpc_id == vpc_id,
-                    Subnet.subnet_id == subnet_id,
-                )
-                .first()
-            )
-            if existing:
-                existing.subnet_name = s.get("vswitch_name")
-                existing.cidr_block = s.get("cidr_block")
-                existing.zone_id = s.get("zone_id")
-                existing.updated_at = now
-            else:
-                new_subnet = Subnet(
-                    subnet_id=subnet_id,
-                    subnet_name=s.get("vswitch_name"),
-                    vpc_id=vpc_id,
-                    cloud_provider_code=provider_code,
-                    cloud_certificate_id=s.get("cloud_certificate_id"),
-                    region_id=region_id,
-                    zone_id=s.get("zone_id"),
-                    cidr_block=s.get("cidr_block"),
-                    created_at=now,
-                    updated_at=now,
-                )
-                self.db.add(new_subnet)
+        rows = [
+            {
+                "subnet_id": s.get("vswitch_id"),
+                "subnet_name": s.get("vswitch_name"),
+                "vpc_id": vpc_id,
+                "cloud_provider_code": provider_code,
+                "cloud_certificate_id": s.get("cloud_certificate_id", 0),
+                "region_id": region_id,
+                "zone_id": s.get("zone_id"),
+                "cidr_block": s.get("cidr_block"),
+                "created_at": now,
+                "updated_at": now,
+            }
+            for s in subnets
+            if s.get("vswitch_id")
+        ]
+        result = bulk_upsert(
+            self.db,
+            Subnet,
+            rows,
+            key_fields=("cloud_provider_code", "subnet_id"),
+            update_fields=("subnet_name", "cidr_block", "zone_id"),
+            scope={"cloud_provider_code": provider_code},
+        )
         self.db.commit()
+        return result
 
     def create(self, data: dict) -> Subnet:
         obj = Subnet(**data)
@@ -68,7 +65,7 @@ class SubnetRepository:
             .first()
         )
 
-    def list_by_subnet(self, vpc_id: str) -> List[SubnetOut]:
+    def list_by_subnet(self, vpc_id: int) -> List[SubnetOut]:
         return self.db.query(Subnet).filter(Subnet.vpc_id==vpc_id).order_by(Subnet.id.desc()).all()
 
     def release(self, obj: Subnet):
@@ -93,6 +90,27 @@ class SubnetRepository:
         分页查询子网
         :return: 返回子网列表及总数
         """
+        query = self._page_query(cloud_provider_code, region_id, zone_id, vpc_id, resource_group_id)
+        total = query.count()
+        items = query.offset((page - 1) * page_size).limit(page_size).all()
+        return items, total
+
+    # 游标分页查询（id 倒序）
+    def list_cursor(
+            self,
+            cloud_provider_code: str = None,
+            region_id: str = None,
+            zone_id: str = None,
+            vpc_id: str = None,
+            resource_group_id: int = None,
+            cursor: Optional[str] = None,
+            page_size: int = 20,
+            count: CountMode = CountMode.NONE,
+    ) -> CursorResult:
+        query = self._page_query(cloud_provider_code, region_id, zone_id, vpc_id, resource_group_id)
+        return keyset_paginate(query, [Subnet.id], page_size, cursor, count=count)
+
+    def _page_query(self, cloud_provider_code, region_id, zone_id, vpc_id, resource_group_id):
         query = self.db.query(Subnet)
         filters = []
 
@@ -109,7 +127,17 @@ class SubnetRepository:
 
         if filters:
             query = query.filter(and_(*filters))
+        return query
 
-        total = query.count()
-        items = query.offset((page - 1) * page_size).limit(page_size).all()
-        return items, total
+    #   导出语句（未释放的子网，按主键顺序）
+    @staticmethod
+    def export_stmt(provider_code: str, region_id: Optional[str] = None, vpc_id: Optional[int] = None) -> Select:
+        stmt = select(Subnet.__table__).where(
+            Subnet.cloud_provider_code == provider_code,
+            Subnet.is_released == 0,
+        )
+        if region_id:
+            stmt = stmt.where(Subnet.region_id == region_id)
+        if vpc_id:
+            stmt = stmt.where(Subnet.vpc_id == vpc_id)
+        return stmt.order_by(Subnet.id)
@@ -1,7 +1,10 @@
 from datetime import datetime, timezone
-from typing import List
+from typing import List, Optional
 
+from sqlalchemy import select, Select
 from sqlalchemy.orm import Session
+from app.common.bulk_upsert import bulk_upsert, UpsertResult
+from app.common.pagination import CountMode, CursorResult, keyset_paginate
 from app.models.cmp.vpc import Vpc
 from app.schemas.cmp.vpc_schema import VpcOut
 
@@ -11,38 +14,36 @@ class VpcRepository:
         self.db = db
 
     #   批量插入
-    def bulk_upsert(self, provider_code: str, region_id: str, vpcs: List[dict]):
+    def bulk_upsert(self, provider_code: str, region_id: str, vpcs: List[dict]) -> UpsertResult:
         now = datetime.now(timezone.utc)
+        rows = []
         for v in vpcs:
-            vpc_id = v.get("VpcId")
-            existing = (
-                self.db.query(Vpc)
-                .filter(
-                    Vpc.cloud_provider_code == provider_code,
-                    Vpc.region_id == region_id,
-                    Vpc.id == v["id"],
-                )
-                .first()
-            )
-            if existing:
-                existing.vpc_name = v.get("VpcName")
-                existing.description = v.get("Description")
-                existing.resource_group_id = v.get("ResourceGroupId")
-                existing.updated_at = now
-            else:
-                new_vpc = Vpc(
-                    vpc=vpc_id,
-                    cloud_provider_code=provider_code,
-                    region_id=region_id,
-                    vpc_name=v.get("VpcName"),
-                    description=v.get("Description"),
-                    resource_group_id=v.get("ResourceGroupId"),
-                    network_type=v.get("NetworkType", "VPC"),  # 阿里云一般是 VPC
-                    created_at=now,
-                    updated_at=now,
-                )
-                self.db.add(new_vpc)
+            # 兼容 client 返回的下划线字段与阿里云原始大驼峰字段
+            vpc_id = v.get("vpc_id") or v.get("VpcId")
+            if not vpc_id:
+                continue
+            rows.append({
+                "vpc_id": vpc_id,
+                "cloud_provider_code": provider_code,
+                "cloud_certificate_id": v.get("cloud_certificate_id", 0),
+                "region_id": region_id,
+                "vpc_name": v.get("vpc_name") or v.get("VpcName") or "",
+                "description": v.get("description") or v.get("Description"),
+                "resource_group_id": v.get("resource_group_id") or v.get("ResourceGroupId"),
+                "network_type": v.get("NetworkType", "VPC"),  # 阿里云一般是 VPC
+                "created_at": now,
+                "updated_at": now,
+            })
+        result = bulk_upsert(
+            self.db,
+            Vpc,
+            rows,
+            key_fields=("cloud_provider_code", "vpc_id"),
+            update_fields=("vpc_name", "description", "resource_group_id"),
+            scope={"cloud_provider_code": provider_code, "region_id": region_id},
+        )
         self.db.commit()
+        return result
 
     # --------------------------------
     # 创建单个 VPC
@@ -66,16 +67,25 @@ class VpcRepository:
             .all()
         )
 
-    #   分页vpc列表数据
-    def list_page(self, provider_code: str, region_id: str, page: int, page_size: int):
-        query = self.db.query(Vpc).filter(
+    def _page_query(self, provider_code: str, region_id: str):
+        return self.db.query(Vpc).filter(
             Vpc.cloud_provider_code == provider_code,
             Vpc.region_id == region_id,
-        ).order_by(Vpc.id.desc())
+        )
+
+    #   分页vpc列表数据
+    def list_page(self, provider_code: str, region_id: str, page: int, page_size: int):
+        query = self._page_query(provider_code, region_id).order_by(Vpc.id.desc())
         total = query.count()
         items = query.offset((page - 1) * page_size).limit(page_size).all()
         return total, items
 
+    #   游标分页vpc列表数据（id 倒序，与 list_page 一致）
+    def list_cursor(self, provider_code: str, region_id: str, cursor: Optional[str] = None,
+                    page_size: int = 20, count: CountMode = CountMode.NONE) -> CursorResult:
+        query = self._page_query(provider_code, region_id)
+        return keyset_paginate(query, [Vpc.id], page_size, cursor, count=count)
+
     # 释放（逻辑删除）
     def release(self, vpc: Vpc) -> VpcOut:
         vpc.is_released = True
@@ -87,4 +97,19 @@ class VpcRepository:
 
 
     def get(self, vpc_id: int) -> Vpc:
-        return self.db.query(Vpc).get(vpc_id)
\ No newline at end of file
+        return self.db.query(Vpc).get(vpc_id)
+
+    #   按云厂商 VPC ID（vpc-xxx）查本地记录
+    def get_by_cloud_id(self, provider_code: str, vpc_id: str) -> Optional[Vpc]:
+        return self.db.query(Vpc).filter_by(cloud_provider_code=provider_code, vpc_id=vpc_id).first()
+
+    #   导出语句（未释放的 vpc，按主键顺序）
+    @staticmethod
+    def export_stmt(provider_code: str, region_id: Optional[str] = None) -> Select:
+        stmt = select(Vpc.__table__).where(
+            Vpc.cloud_provider_code == provider_code,
+            Vpc.is_released == 0,
+        )
+        if region_id:
+            stmt = stmt.where(Vpc.region_id == region_id)
+        return stmt.order_by(Vpc.id)
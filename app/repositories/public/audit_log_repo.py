@@ -0,0 +1,116 @@
+# app/repositories/public/audit_log_repo.py
+from datetime import date, datetime
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import insert, select, Select, text
+from sqlalchemy.orm import Session
+
+from app.common.pagination import CountMode, CursorResult, keyset_paginate
+from app.models.public.audit_log import AuditLog
+
+# 审计日志所在的库
+AUDIT_DB = "audit_center"
+# 兜底分区：存放超出已建月份范围的数据
+MAX_PARTITION = "pmax"
+
+
+class AuditLogRepository:
+    """操作审计日志数据操作"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    #   导出语句（按主键顺序，可按模块 / 用户 / 时间范围过滤）
+    @staticmethod
+    def export_stmt(
+            module: Optional[str] = None,
+            user_id: Optional[str] = None,
+            start_time: Optional[datetime] = None,
+            end_time: Optional[datetime] = None,
+    ) -> Select:
+        stmt = select(AuditLog.__table__)
+        if module:
+            stmt = stmt.where(AuditLog.module == module)
+        if user_id:
+            stmt = stmt.where(AuditLog.user_id == user_id)
+        if start_time:
+            stmt = stmt.where(AuditLog.created_at >= start_time)
+        if end_time:
+            stmt = stmt.where(AuditLog.created_at < end_time)
+        return stmt.order_by(AuditLog.id)
+
+    #   时间范围内的游标分页：按 (created_at, id) 倒序，时间条件让 MySQL 只扫命中的月份分区
+    def list_cursor(
+            self,
+            start_time: datetime,
+            end_time: datetime,
+            module: Optional[str] = None,
+            action: Optional[str] = None,
+            user_id: Optional[str] = None,
+            status: Optional[str] = None,
+            cursor: Optional[str] = None,
+            page_size: int = 20,
+            count: CountMode = CountMode.NONE,
+    ) -> CursorResult:
+        query = self.db.query(AuditLog).filter(AuditLog.created_at >= start_time, AuditLog.created_at < end_time)
+        if module:
+            query = query.filter(AuditLog.module == module)
+        if action:
+            query = query.filter(AuditLog.action == action)
+        if user_id:
+            query = query.filter(AuditLog.user_id == user_id)
+        if status:
+            query = query.filter(AuditLog.status == status)
+        return keyset_paginate(query, [AuditLog.created_at, AuditLog.id], page_size, cursor, count=count)
+
+    #   批量写入：一条多行 INSERT ... VALUES (...), (...)
+    def bulk_insert(self, rows: List[Dict]) -> None:
+        if not rows:
+            return
+        self.db.execute(insert(AuditLog).values(rows))
+        self.db.commit()
+
+    # ============================================================
+    # 分区维护（MySQL RANGE COLUMNS(created_at)，每月一个分区 pYYYYMM）
+    # ============================================================
+    #   已有分区名（按顺序）；非 MySQL 或表未分区时返回空列表
+    def list_partitions(self) -> List[str]:
+        if self.db.get_bind().dialect.name != "mysql":
+            return []
+        rows = self.db.execute(
+            text(
+                "SELECT PARTITION_NAME FROM information_schema.PARTITIONS "
+                "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table AND PARTITION_NAME IS NOT NULL "
+                "ORDER BY PARTITION_ORDINAL_POSITION"
+            ),
+            {"table": AuditLog.__tablename__},
+        ).all()
+        return [row[0] for row in rows]
+
+    #   从兜底分区里拆出新的月份分区（兜底分区通常为空，拆分很快）
+    def add_partitions(self, partitions: Sequence[Tuple[str, date]]) -> None:
+        if not partitions:
+            return
+        defs = ", ".join(f"PARTITION {name} VALUES LESS THAN ('{bound.isoformat()}')" for name, bound in partitions)
+        self.db.execute(text(
+            f"ALTER TABLE {AuditLog.__tablename__} REORGANIZE PARTITION {MAX_PARTITION} "
+            f"INTO ({defs}, PARTITION {MAX_PARTITION} VALUES LESS THAN (MAXVALUE))"
+        ))
+        self.db.commit()
+
+    #   整个分区删除（秒级，不产生逐行删除的 undo / binlog）
+    def drop_partition(self, name: str) -> None:
+        self.db.execute(text(f"ALTER TABLE {AuditLog.__tablename__} DROP PARTITION {name}"))
+        self.db.commit()
+
+    #   未分区时的兜底清理：按 created_at 索引分批删除早于 before 的记录
+    def delete_before(self, before: datetime, limit: int) -> int:
+        ids = [
+            row.id for row in
+            self.db.query(AuditLog.id).filter(AuditLog.created_at < before).limit(limit).all()
+        ]
+        if not ids:
+            return 0
+        self.db.query(AuditLog).filter(AuditLog.id.in_(ids)).delete(synchronize_session=False)
+        self.db.commit()
+        return len(ids)
@@ -0,0 +1,42 @@
+# app/repositories/public/catalog_sync_state_repo.py
+from datetime import datetime, timezone
+from typing import Optional
+
+from sqlalchemy.dialects.mysql import insert
+from sqlalchemy.orm import Session
+
+from app.models.public.catalog_sync_state import CatalogSyncState
+
+
+class CatalogSyncStateRepository:
+    """目录同步时间表数据操作"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    #   获取最近一次同步时间（统一返回带时区的 UTC 时间）
+    def get_synced_at(self, provider_code: str, kind: str, scope: str) -> Optional[datetime]:
+        synced_at = (
+            self.db.query(CatalogSyncState.synced_at)
+            .filter(
+                CatalogSyncState.provider_code == provider_code,
+                CatalogSyncState.kind == kind,
+                CatalogSyncState.scope == scope,
+            )
+            .scalar()
+        )
+        if synced_at is not None and synced_at.tzinfo is None:
+            synced_at = synced_at.replace(tzinfo=timezone.utc)
+        return synced_at
+
+    #   记录同步时间
+    def mark_synced(self, provider_code: str, kind: str, scope: str, synced_at: Optional[datetime] = None) -> None:
+        synced_at = synced_at or datetime.now(timezone.utc)
+        stmt = insert(CatalogSyncState).values(
+            provider_code=provider_code,
+            kind=kind,
+            scope=scope,
+            synced_at=synced_at,
+        )
+        self.db.execute(stmt.on_duplicate_key_update(synced_at=stmt.inserted.synced_at))
+        self.db.commit()
@@ -1,5 +1,6 @@
 from typing import Optional, Tuple, List, Any
 from sqlalchemy.orm import Session
+from app.common.pagination import CountMode, CursorResult, keyset_paginate
 from app.models.public.cloud_certificate import CloudCertificate
 
 class CloudCertificateRepository:
@@ -25,6 +26,11 @@ class CloudCertificateRepository:
         items = q.offset((page - 1) * page_size).limit(page_size).all()
         return total, items
 
+    def list_cursor(self, cursor: Optional[str] = None, page_size: int = 20,
+                    count: CountMode = CountMode.NONE) -> CursorResult:
+        q = self.db.query(CloudCertificate)
+        return keyset_paginate(q, [CloudCertificate.id], page_size, cursor, count=count)
+
     def update(self, record_id: int, **kwargs) -> Optional[CloudCertificate]:
         obj = self.get_by_id(record_id)
         if not obj:
@@ -1,7 +1,8 @@
 # app/repositories/public/cloud_provider_repo.py
-from typing import Optional
+from typing import List, Optional
 from sqlalchemy.orm import Session
 
+from app.common.pagination import CountMode, CursorResult, keyset_paginate
 from app.models.public.cloud_provider import CloudCredentialsPlatform
 
 
@@ -23,12 +24,20 @@ class CloudProviderRepository:
     def get_by_code(self, provider_code: str) -> Optional[CloudCredentialsPlatform]:
         return self.db.query(CloudCredentialsPlatform).filter_by(provider_code=provider_code).first()
 
+    def list_all(self) -> List[CloudCredentialsPlatform]:
+        return self.db.query(CloudCredentialsPlatform).order_by(CloudCredentialsPlatform.id).all()
+
     def list_page(self, page: int, page_size: int):
         query = self.db.query(CloudCredentialsPlatform).order_by(CloudCredentialsPlatform.id.desc())
         total = query.count()
         items = query.offset((page - 1) * page_size).limit(page_size).all()
         return total, items
 
+    def list_cursor(self, cursor: Optional[str] = None, page_size: int = 20,
+                    count: CountMode = CountMode.NONE) -> CursorResult:
+        query = self.db.query(CloudCredentialsPlatform)
+        return keyset_paginate(query, [CloudCredentialsPlatform.id], page_size, cursor, count=count)
+
     def update(self, record_id: int, **kwargs):
         obj = self.get_by_id(record_id)
         if not obj:
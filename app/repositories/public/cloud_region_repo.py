@@ -3,6 +3,7 @@ from sqlalchemy.orm import Session
 from typing import List
 from app.models.public.cloud_region import CloudRegion
 from datetime import datetime
+from app.common.bulk_upsert import bulk_upsert, UpsertResult
 
 class CloudRegionRepository:
     """区域表数据操作"""
@@ -15,33 +16,29 @@ class CloudRegionRepository:
     :param provider_code: 云厂商编码
     :param regions: [{'region_id': 'cn-hangzhou', 'region_name': '华东1（杭州）'}, ...]
     """
-    def bulk_upsert(self, provider_code: str, regions: List[dict]):
+    def bulk_upsert(self, provider_code: str, regions: List[dict]) -> UpsertResult:
 
         now = datetime.now()
-
-        for r in regions:
-            existing = (
-                self.db.query(CloudRegion)
-                .filter(
-                    CloudRegion.provider_code == provider_code, # type: ignore
-                    CloudRegion.region_id == r["region_id"],    # type: ignore
-                )
-                .first()
-            )
-            if existing:
-                existing.region_name = r["region_name"]
-                existing.updated_at = now
-            else:
-                self.db.add(
-                    CloudRegion(
-                        provider_code=provider_code,
-                        region_id=r["region_id"],
-                        region_name=r["region_name"],
-                        created_at=now,
-                        updated_at=now,
-                    )
-                )
+        rows = [
+            {
+                "provider_code": provider_code,
+                "region_id": r["region_id"],
+                "region_name": r["region_name"],
+                "created_at": now,
+                "updated_at": now,
+            }
+            for r in regions
+        ]
+        result = bulk_upsert(
+            self.db,
+            CloudRegion,
+            rows,
+            key_fields=("provider_code", "region_id"),
+            update_fields=("region_name",),
+            scope={"provider_code": provider_code},
+        )
         self.db.commit()
+        return result
 
     """获取指定云厂商的所有区域"""
     def region_list(self, provider_code: str) -> List[CloudRegion]:
@@ -3,6 +3,7 @@ from sqlalchemy.orm import Session
 from typing import List
 from datetime import datetime
 from app.models.public.cloud_zone import CloudZone
+from app.common.bulk_upsert import bulk_upsert, UpsertResult
 
 class CloudZoneRepository:
     """可用区表数据操作"""
@@ -11,35 +12,30 @@ class CloudZoneRepository:
         self.db = db
 
     #   批量插入或更新可用区数据
-    def bulk_upsert(self, provider_code: str, region_id: str, zones: List[dict]):
+    def bulk_upsert(self, provider_code: str, region_id: str, zones: List[dict]) -> UpsertResult:
 
         now = datetime.now()
-
-        for z in zones:
-            existing = (
-                self.db.query(CloudZone)
-                .filter(
-                    CloudZone.provider_code == provider_code,
-                    CloudZone.region_id == region_id,
-                    CloudZone.zone_id == z["zone_id"],
-                )
-                .first()
-            )
-            if existing:
-                existing.zone_name = z["zone_name"]
-                existing.updated_at = now
-            else:
-                self.db.add(
-                    CloudZone(
-                        provider_code=provider_code,
-                        region_id=region_id,
-                        zone_id=z["zone_id"],
-                        zone_name=z["zone_name"],
-                        created_at=now,
-                        updated_at=now,
-                    )
-                )
+        rows = [
+            {
+                "provider_code": provider_code,
+                "region_id": region_id,
+                "zone_id": z["zone_id"],
+                "zone_name": z["zone_name"],
+                "created_at": now,
+                "updated_at": now,
+            }
+            for z in zones
+        ]
+        result = bulk_upsert(
+            self.db,
+            CloudZone,
+            rows,
+            key_fields=("provider_code", "region_id", "zone_id"),
+            update_fields=("zone_name",),
+            scope={"provider_code": provider_code, "region_id": region_id},
+        )
         self.db.commit()
+        return result
 
     #   获取指定云厂商和区域的所有可用区
     def get_by_zones(self, provider_code: str, region_id: str) -> List[CloudZone]:
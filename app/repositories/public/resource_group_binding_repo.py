@@ -1,5 +1,6 @@
 from sqlalchemy.orm import Session
 from typing import List, Optional
+from app.common.pagination import CountMode, CursorResult, keyset_paginate
 from app.models.public.resource_group import ResourceGroupBinding
 
 
@@ -48,3 +49,9 @@ class ResourceGroupBindingRepository:
 
         return total, items
 
+    # 获取某组下的绑定（游标分页，id 倒序）
+    def list_by_group_cursor(self, group_id: int, cursor: Optional[str] = None, page_size: int = 20,
+                             count: CountMode = CountMode.NONE) -> CursorResult:
+        query = self.db.query(ResourceGroupBinding).filter_by(resource_group_id=group_id)
+        return keyset_paginate(query, [ResourceGroupBinding.id], page_size, cursor, count=count)
+
@@ -1,5 +1,6 @@
 from typing import Optional, List, Tuple, Any
 from sqlalchemy.orm import Session
+from app.common.pagination import CountMode, CursorResult, keyset_paginate
 from app.models.public.resource_group import ResourceGroup
 
 class ResourceGroupRepository:
@@ -27,6 +28,11 @@ class ResourceGroupRepository:
         items = query.offset((page - 1) * page_size).limit(page_size).all()
         return total, items
 
+    def list_cursor(self, cursor: Optional[str] = None, page_size: int = 20,
+                    count: CountMode = CountMode.NONE) -> CursorResult:
+        query = self.db.query(ResourceGroup)
+        return keyset_paginate(query, [ResourceGroup.id], page_size, cursor, count=count)
+
     def update(self, record_id: int, data: dict) -> Optional[ResourceGroup]:
         obj = self.get_by_id(record_id)
         if not obj:
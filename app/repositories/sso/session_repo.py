@@ -1,5 +1,7 @@
 # app/repositories/session_repository.py
+from datetime import datetime
 from sqlalchemy.orm import Session
+from app.core.security import hash_refresh_token
 from app.models.sso.session import UserSession
 
 class SessionRepository:
@@ -21,7 +23,8 @@ class SessionRepository:
         self.db.commit()
 
     def get_by_refresh_token(self, refresh_token: str):
-        return self.db.query(UserSession).filter_by(refresh_token = refresh_token).first()
+        """按 token 摘要走唯一索引查询"""
+        return self.db.query(UserSession).filter_by(token_hash = hash_refresh_token(refresh_token)).first()
 
     def delete(self, session_id: int):
         self.db.query(UserSession).filter_by(id = session_id).delete()
@@ -29,3 +32,15 @@ class SessionRepository:
 
     def delete_by_user(self, user_id: int):
         self.clear_user_sessions(user_id)
+
+    def delete_expired(self, now: datetime, limit: int) -> int:
+        """删除一批过期会话（按 expires_at 索引取 id，避免长事务锁全表）"""
+        ids = [
+            row.id for row in
+            self.db.query(UserSession.id).filter(UserSession.expires_at < now).limit(limit).all()
+        ]
+        if not ids:
+            return 0
+        self.db.query(UserSession).filter(UserSession.id.in_(ids)).delete(synchronize_session=False)
+        self.db.commit()
+        return len(ids)
@@ -0,0 +1,34 @@
+# app/repositories/sso/token_revocation_repo.py
+from datetime import datetime, timezone
+from typing import List, Tuple
+
+from sqlalchemy.dialects.mysql import insert
+from sqlalchemy.orm import Session
+
+from app.models.sso.token_revocation import TokenRevocation
+
+
+class TokenRevocationRepository:
+    """access token 吊销记录数据操作"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    #   记录吊销时间点（同一用户只保留最新一次）
+    def upsert(self, user_id: int, revoked_before: datetime) -> None:
+        stmt = insert(TokenRevocation).values(user_id=user_id, revoked_before=revoked_before)
+        self.db.execute(stmt.on_duplicate_key_update(revoked_before=stmt.inserted.revoked_before))
+        self.db.commit()
+
+    #   增量读取：revoked_before 不早于 since 的记录，统一返回带时区的 UTC 时间
+    #   用 >= 保证同一秒内的多条都能拿到，重复读取无副作用
+    def list_since(self, since: datetime) -> List[Tuple[int, datetime]]:
+        rows = (
+            self.db.query(TokenRevocation.user_id, TokenRevocation.revoked_before)
+            .filter(TokenRevocation.revoked_before >= since)
+            .all()
+        )
+        return [
+            (user_id, at if at.tzinfo is not None else at.replace(tzinfo=timezone.utc))
+            for user_id, at in rows
+        ]
@@ -43,11 +43,30 @@ class InstanceTypeSearch(BaseModel):
     provider_code: str
     region_id: str
     zone_id: str
-    instance_charge_type: Optional[str] = None
+    # 不传时按 PostPaid，命中定时预热的库存快照
+    instance_charge_type: str = "PostPaid"
     cpu_number: Optional[int] = None
     memory_number: Optional[int] = None
     gpu_spec: Optional[str] = None
     gpu_name: Optional[str] = None
     hide_soldout: bool = False
+    # 跳过库存快照，直接调用 DescribeAvailableResource（同时刷新快照）
+    force_live: bool = False
     page: int = 1
-    page_size: int = 20
\ No newline at end of file
+    page_size: int = 20
+
+#   region 级可用规格查询：一次返回各规格有货的可用区，不指定 zone_id
+class InstanceTypeRegionSearch(BaseModel):
+    provider_code: str
+    region_id: str
+    # 不传时按 PostPaid，命中定时预热的库存快照
+    instance_charge_type: str = "PostPaid"
+    cpu_number: Optional[int] = None
+    memory_number: Optional[int] = None
+    gpu_spec: Optional[str] = None
+    gpu_name: Optional[str] = None
+    # 隐藏所有可用区都无货的规格
+    hide_soldout: bool = False
+    force_live: bool = False
+    page: int = 1
+    page_size: int = 20
@@ -0,0 +1,24 @@
+# app/schemas/public/audit_log_schema.py
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class AuditLogOut(BaseModel):
+    id: int
+    user_id: Optional[str]
+    username: Optional[str]
+    module: str
+    action: str
+    target_type: Optional[str]
+    target_id: Optional[str]
+    request_data: Optional[str]
+    description: Optional[str]
+    status: str
+    error_message: Optional[str]
+    ip_address: Optional[str]
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
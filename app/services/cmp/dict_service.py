@@ -2,6 +2,7 @@ from typing import List, Optional
 from sqlalchemy.orm import Session
 
 from app.common.exceptions import BusinessException
+from app.common.pagination import CountMode, CursorResult
 from app.repositories.cmp.dict_repo import DictRepository
 from app.schemas.cmp.dict_schema import (
     DictItemCreate,
@@ -61,3 +62,17 @@ class DictService:
         size: int = 10
     ) -> DictItemListOut:
         return self.repo.list(type_code=type_code, keyword=keyword, page=page, size=size)
+
+    # -------------------------
+    # 游标分页查询
+    # -------------------------
+    def list_cursor(
+        self,
+        type_code: Optional[str] = None,
+        keyword: Optional[str] = None,
+        cursor: Optional[str] = None,
+        page_size: int = 20,
+        count: CountMode = CountMode.NONE,
+    ) -> CursorResult:
+        return self.repo.list_cursor(type_code=type_code, keyword=keyword, cursor=cursor,
+                                     page_size=page_size, count=count)
@@ -1,8 +1,14 @@
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.common.exceptions import BusinessException
+from app.common.status_code import ErrorCode
+from app.common.messages import Message
 
 from app.repositories.public.cloud_provider_repo import CloudProviderRepository
 
 from app.services.public.cloud_service import CloudService
+from app.services.public.async_cloud_service import AsyncCloudService
 
 class DiskTypeService:
     def __init__(self, db: Session):
@@ -28,3 +34,20 @@ class DiskTypeService:
 
         images = client.list_disk_types(region_id, zone_id, instance_type_id, instance_charge_type.value)
         return images
+
+    async def disk_type_list_async(self, provider_code: str, region_id: str, zone_id: str, instance_type_id: str, instance_charge_type: str):
+        provider = await run_in_threadpool(self.provider_repo.get_by_code, provider_code)
+        if not provider:
+            raise BusinessException(
+                code=ErrorCode.DATA_NOT_FOUND,
+                message=Message.DATA_NOT_FOUND
+            )
+
+        client = AsyncCloudService(
+            self.db,
+            provider_code,
+            provider.access_key_id,
+            provider.access_key_secret,
+            provider.endpoint,
+        )
+        return await client.list_disk_types(region_id, zone_id, instance_type_id, instance_charge_type.value)
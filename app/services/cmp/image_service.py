@@ -1,8 +1,14 @@
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.common.exceptions import BusinessException
+from app.common.status_code import ErrorCode
+from app.common.messages import Message
 
 from app.repositories.public.cloud_provider_repo import CloudProviderRepository
 
 from app.services.public.cloud_service import CloudService
+from app.services.public.async_cloud_service import AsyncCloudService
 class ImageService:
     def __init__(self, db: Session):
         self.db = db
@@ -27,3 +33,20 @@ class ImageService:
 
         images = client_region.list_images(region_id, instance_type_id, architecture)
         return images
+
+    async def list_async(self, provider_code: str, region_id: str, instance_type_id: str, architecture: str = None):
+        provider = await run_in_threadpool(self.provider_repo.get_by_code, provider_code)
+        if not provider:
+            raise BusinessException(
+                code=ErrorCode.DATA_NOT_FOUND,
+                message=Message.DATA_NOT_FOUND
+            )
+
+        client_region = AsyncCloudService(
+            self.db,
+            provider_code,
+            provider.access_key_id,
+            provider.access_key_secret,
+            provider.endpoint,
+        )
+        return await client_region.list_images(region_id, instance_type_id, architecture)
@@ -0,0 +1,214 @@
+# app/services/cmp/instance_type_catalog.py
+import math
+import sys
+import threading
+import time
+from array import array
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence
+
+from app.core.config import settings
+from app.core.logger import logger
+from app.services.public.catalog_freshness import catalog_freshness, scope_of
+
+# 整数 / 浮点列里表示 NULL 的哨兵值
+_NULL_INT = -1
+_NULL_FLOAT = math.nan
+_MISSING = object()
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    return sys.intern(value) if value else value
+
+
+def _add(index: Dict[Any, int], key: Any, row: int) -> None:
+    index[key] = index.get(key, 0) | (1 << row)
+
+
+class InstanceTypeCatalog:
+    """
+    单个厂商的规格目录快照（只读）：
+    - 列式存储：cpu / gpu_amount 为 array('i')，memory / gpu_memory 为 array('d')，字符串列做 intern
+    - 二级索引：cpu、memory、gpu_spec -> 行号位图（Python int），组合过滤只做几次按位与
+    """
+
+    def __init__(self, rows: Iterable[Sequence[Any]], built_at: float):
+        self.built_at = built_at
+        self.ids: List[str] = []
+        self.row_of: Dict[str, int] = {}
+        self.cpu = array("i")
+        self.memory = array("d")
+        self.gpu_amount = array("i")
+        self.gpu_memory = array("d")
+        self.family: List[Optional[str]] = []
+        self.gpu_spec: List[Optional[str]] = []
+        self.architecture: List[Optional[str]] = []
+
+        self.by_cpu: Dict[int, int] = {}
+        self.by_memory: Dict[float, int] = {}
+        self.by_gpu_spec: Dict[str, int] = {}
+
+        for it_id, family, cpu, memory, arch, gpu_amount, gpu_spec, gpu_memory in rows:
+            row = len(self.ids)
+            self.ids.append(it_id)
+            self.row_of[it_id] = row
+            self.cpu.append(_NULL_INT if cpu is None else int(cpu))
+            self.memory.append(_NULL_FLOAT if memory is None else float(memory))
+            self.gpu_amount.append(_NULL_INT if gpu_amount is None else int(gpu_amount))
+            self.gpu_memory.append(_NULL_FLOAT if gpu_memory is None else float(gpu_memory))
+            self.family.append(_intern(family))
+            self.gpu_spec.append(_intern(gpu_spec))
+            self.architecture.append(_intern(arch))
+
+            if cpu is not None:
+                _add(self.by_cpu, int(cpu), row)
+            if memory is not None:
+                _add(self.by_memory, float(memory), row)
+            if gpu_spec:
+                _add(self.by_gpu_spec, self.gpu_spec[row], row)
+
+        self.all_rows = (1 << len(self.ids)) - 1
+        # 按需物化的行记录，命中过的规格再次返回时不用重新拼装
+        self._records: List[Optional[Dict[str, Any]]] = [None] * len(self.ids)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def _gpu_spec_mask(self, needle: str) -> int:
+        """gpu_spec 为不区分大小写的包含匹配：在去重后的规格名上匹配，再合并位图"""
+        needle = needle.lower()
+        mask = 0
+        for spec, rows in self.by_gpu_spec.items():
+            if needle in spec.lower():
+                mask |= rows
+        return mask
+
+    def mask(
+        self,
+        cpu_number: Optional[int] = None,
+        memory_number: Optional[float] = None,
+        gpu_spec: Optional[str] = None,
+    ) -> int:
+        """按 cpu / 内存（精确匹配）与 gpu_spec（包含匹配）求满足条件的行位图"""
+        mask = self.all_rows
+        if cpu_number:
+            mask &= self.by_cpu.get(int(cpu_number), 0)
+        if memory_number and mask:
+            mask &= self.by_memory.get(float(memory_number), 0)
+        if gpu_spec and mask:
+            mask &= self._gpu_spec_mask(gpu_spec)
+        return mask
+
+    def record(self, row: int) -> Dict[str, Any]:
+        """行的基础信息（返回副本，调用方可以继续往里加字段）"""
+        cached = self._records[row]
+        if cached is not None:
+            return dict(cached)
+        cpu, gpu_amount = self.cpu[row], self.gpu_amount[row]
+        memory, gpu_memory = self.memory[row], self.gpu_memory[row]
+        cached = self._records[row] = {
+            "instance_type_id": self.ids[row],
+            "cpu_core_count": None if cpu == _NULL_INT else cpu,
+            "memory_size": None if math.isnan(memory) else memory,
+            "gpu_amount": None if gpu_amount == _NULL_INT else gpu_amount,
+            "gpu_spec": self.gpu_spec[row],
+            "gpu_memory": None if math.isnan(gpu_memory) else gpu_memory,
+            "architecture": self.architecture[row],
+        }
+        return dict(cached)
+
+    def rows(self, mask: int) -> Iterator[int]:
+        """位图中的行号（升序）；只遍历置位的行，代价与命中数成正比"""
+        if mask == self.all_rows:
+            yield from range(len(self.ids))
+            return
+        while mask:
+            low = mask & -mask
+            yield low.bit_length() - 1
+            mask ^= low
+
+    def filter_available(
+        self,
+        statuses: Dict[str, str],
+        cpu_number: Optional[int],
+        memory_number: Optional[float],
+        gpu_spec: Optional[str],
+        gpu_name: Optional[str],
+        hide_soldout: bool,
+    ) -> List[Dict[str, Any]]:
+        """
+        只保留 DB 中存在且满足条件的可用规格（未分页、未查价格）。
+        statuses 为库存快照 {instance_type_id: status_category}；
+        从索引命中的行出发再查 statuses，结果按目录顺序（规格主键）排列，分页稳定。
+        """
+        out = []
+        gpu_name = gpu_name.lower() if gpu_name else None
+        for row in self.rows(self.mask(cpu_number, memory_number, gpu_spec)):
+            it_id = self.ids[row]
+            status_cat = statuses.get(it_id, _MISSING)
+            if status_cat is _MISSING:
+                continue
+            status_cat = status_cat or ""
+            if hide_soldout and status_cat not in ("WithStock",):
+                continue
+            if gpu_name and gpu_name not in (it_id or "").split()[0].lower():
+                continue
+            item = self.record(row)
+            item["status_category"] = status_cat
+            out.append(item)
+        return out
+
+
+class InstanceTypeCatalogIndex:
+    """
+    按厂商缓存 InstanceTypeCatalog：
+    - 本进程同步规格后 invalidate() 立即失效
+    - 其他 worker 同步后，按 check_interval 比对 catalog_sync_state 的同步时间再重建
+    """
+
+    def __init__(self, check_interval: float):
+        self.check_interval = check_interval
+        self._catalogs: Dict[str, InstanceTypeCatalog] = {}
+        self._checked_at: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def _outdated(self, provider_code: str, catalog: InstanceTypeCatalog) -> bool:
+        now = time.monotonic()
+        if now - self._checked_at.get(provider_code, 0.0) < self.check_interval:
+            return False
+        self._checked_at[provider_code] = now
+        try:
+            synced_at = catalog_freshness.synced_at(provider_code, "instance_types", scope_of())
+        except Exception as e:
+            logger.warning("read instance type sync state failed for %s: %s", provider_code, e)
+            return False
+        return synced_at is not None and synced_at.timestamp() > catalog.built_at
+
+    def get(self, provider_code: str, load_rows: Callable[[], Iterable[Sequence[Any]]]) -> InstanceTypeCatalog:
+        catalog = self._catalogs.get(provider_code)
+        if catalog is not None and not self._outdated(provider_code, catalog):
+            return catalog
+
+        with self._lock:
+            current = self._catalogs.get(provider_code)
+            if current is not None and current is not catalog:
+                # 等锁期间已被其他线程重建
+                return current
+            built_at = datetime.now(timezone.utc).timestamp()
+            start = time.perf_counter()
+            catalog = InstanceTypeCatalog(load_rows(), built_at)
+            self._catalogs[provider_code] = catalog
+            self._checked_at[provider_code] = time.monotonic()
+            logger.info("instance type catalog for %s built: %s rows in %.1f ms",
+                        provider_code, len(catalog), (time.perf_counter() - start) * 1000)
+            return catalog
+
+    def invalidate(self, provider_code: Optional[str] = None) -> None:
+        with self._lock:
+            if provider_code is None:
+                self._catalogs.clear()
+            else:
+                self._catalogs.pop(provider_code, None)
+
+
+instance_type_catalog = InstanceTypeCatalogIndex(settings.INSTANCE_TYPE_INDEX_CHECK_SECONDS)
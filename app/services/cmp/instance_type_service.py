@@ -1,17 +1,25 @@
 from sqlalchemy.orm import Session
-from typing import List, Optional, Dict, Any
-from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeoutError
+from starlette.concurrency import run_in_threadpool
+from typing import Iterator, List, Optional, Dict, Any
 
 from app.models.cmp.instance_type import InstanceType
-from app.services.public.cloud_service import CloudService
+from app.services.public.cloud_service import CloudService, stock_snapshots
+from app.services.public.async_cloud_service import AsyncCloudService
+from app.services.cmp.price_service import price_resolver
+from app.services.cmp.instance_type_catalog import instance_type_catalog
+from app.services.public.stock_snapshot import best_status
 
 from app.repositories.public.cloud_provider_repo import CloudProviderRepository
 
 from app.repositories.cmp.instance_type_repo import InstanceTypeRepo
 
-from app.schemas.cmp.instance_type_schema import InstanceTypeSearch, InstanceTypeBase
+from app.schemas.cmp.instance_type_schema import InstanceTypeSearch, InstanceTypeRegionSearch, InstanceTypeBase
 
+from app.common.exceptions import BusinessException
+from app.common.status_code import ErrorCode
+from app.common.messages import Message
 from app.core.logger import logger
+from app.common.streaming import ExportFormat, stream_export
 
 class InstanceTypeService:
     def __init__(self, cmp_db: Session, public_db: Session):
@@ -40,129 +48,49 @@ class InstanceTypeService:
         instance_types = client_region.list_instance_types(provider_code)
         return instance_types
 
+    async def list_instance_types_async(self, provider_code: str):
+        provider = await run_in_threadpool(self.provider_repo.get_by_code, provider_code)
+        if not provider:
+            raise BusinessException(
+                code=ErrorCode.DATA_NOT_FOUND,
+                message=Message.DATA_NOT_FOUND
+            )
+
+        client_region = AsyncCloudService(
+            self.db,
+            provider_code,
+            provider.access_key_id,
+            provider.access_key_secret,
+            provider.endpoint,
+        )
+        return await client_region.list_instance_types(provider_code)
+
     def full_instance_table(self, type_id: str) -> Optional[type[InstanceType]]:
         data = self.instance_type_repo.get_by_instance_type_find(type_id)
         if not data:
             return None
         return data
 
-    def _filter_available_instances(
-            self,
-            available_map: Dict[str, Dict[str, Any]],
-            db_map: Dict[str, InstanceType],
-            cpu_number: Optional[int],
-            memory_number: Optional[int],
-            gpu_spec: Optional[str],
-            gpu_name: Optional[str],
-            hide_soldout: bool
-    ) -> List[Dict[str, Any]]:
-        """
-        available_map: {instance_type_id: {"status_category": "...", ...}}
-        db_map: {instance_type_id: InstanceType}
-        返回符合过滤条件的、合并好基础信息的 list（未分页、未查价格）
-        """
-        out = []
-        soldout_categories = {"WithoutStock", "ClosedWithoutStock"}  # 根据需调整
-        for it_id, avail in available_map.items():
-            inst = db_map.get(it_id)
-            if not inst:
-                # DB 没有该规格（可能是新规格），跳过或记录日志
-                continue
-
-            # 隐藏售罄
-            status_cat = avail.get("status_category") or avail.get("StatusCategory") or ""
-            if hide_soldout and status_cat not in ("WithStock",):
-                continue
-
-            # cpu 过滤
-            if cpu_number and inst.cpu_core_count != cpu_number:
-                continue
-
-            # memory 过滤（假设以整数 GB 匹配）
-            if memory_number and inst.memory_size != memory_number:
-                continue
-
-            # gpu_spec 过滤（模糊匹配，比如 "A10"）
-            if gpu_spec and (not inst.gpu_spec or gpu_spec.lower() not in inst.gpu_spec.lower()):
-                continue
-
-            # gpu_name 过滤（模糊匹配 GPU 制造商或名称）
-            if gpu_name:
-                gpname = (inst.instance_type_id or "").split()[0]  # 简单提取
-                if gpu_name.lower() not in gpname.lower():
-                    continue
-
-            out.append({
-                "instance_type_id": it_id,
-                "status_category": status_cat,
-                "cpu_core_count": inst.cpu_core_count,
-                "memory_size": inst.memory_size,
-                "gpu_amount": inst.gpu_amount,
-                "gpu_spec": inst.gpu_spec,
-                "gpu_memory": inst.gpu_memory,
-                "architecture": inst.architecture,
-            })
-        return out
-
-    def _fetch_prices_concurrent(
+    def _fetch_prices(
             self,
-            client,
+            client: CloudService,
+            provider_code: str,
             region_id: str,
             instance_type_ids: List[str],
             instance_charge_type: str,
             system_disk_category: str,
-            max_workers: int = 10,
-            per_call_timeout: float = 8.0,
-            retry: int = 1,
     ) -> Dict[str, float]:
         """
-        并发请求 DescribePrice（或你 client 的 list_pricing），返回 {instance_type_id: price}
-        - per_call_timeout: 单次请求等待超时时间（秒）
-        - retry: 失败重试次数（默认再试 1 次）
-        如果失败或超时，价格设为 0（可改为 None）。
+        通过 price_resolver 获取价格（按地域 / 付费方式 / 磁盘 / 时长缓存、合并并发请求），返回 {instance_type_id: price}
         """
-        prices: Dict[str, float] = {}
-
-        def _call_price(it_id: str):
-            last_exc = None
-            for attempt in range(retry + 1):
-                try:
-                    # 这里调用你们的 client.list_pricing 或 client.describe_price 的封装
-                    # 如果你的 client 支持传 timeout，请在 client 层实现并传入。
-                    res = client.list_pricing(region_id, it_id, instance_charge_type, system_disk_category)
-                    # 你的 client 可能返回 dict 嵌套，取 instancetype 字段或按你的实现调整
-                    # 下面兼容常见两种结构
-                    if isinstance(res, dict):
-                        price = res.get("instancetype") or res.get("instanceType") or res.get("price") or 0
-                    else:
-                        price = getattr(res, "price", 0)
-                    return it_id, price
-                except Exception as e:
-                    last_exc = e
-                    logger.warning("price fetch failed (attempt %s) for %s: %s", attempt + 1, it_id, e)
-                    # 简短退避
-                    time.sleep(0.2 * (attempt + 1))
-            # 全部重试失败
-            logger.error("price fetch ultimately failed for %s: %s", it_id, last_exc)
-            return it_id, 0
-
-        # 使用 ThreadPoolExecutor 并发
-        with ThreadPoolExecutor(max_workers=max_workers) as exe:
-            future_to_it = {exe.submit(_call_price, it_id): it_id for it_id in instance_type_ids}
-            for fut in as_completed(future_to_it):
-                it_id = future_to_it[fut]
-                try:
-                    # fut.result() 默认会阻塞直到完成；这里也可以加超时保护
-                    res_it, price = fut.result(timeout=per_call_timeout)
-                except FuturesTimeoutError:
-                    logger.error("price request timeout for %s", it_id)
-                    price = 0
-                except Exception as e:
-                    logger.exception("unexpected error when fetching price for %s: %s", it_id, e)
-                    price = 0
-                prices[it_id] = price
-
-        return prices
+        return price_resolver.resolve_many(
+            client,
+            provider_code,
+            region_id,
+            instance_type_ids,
+            instance_charge_type,
+            system_disk_category,
+        )
 
     #   可用区
     #   provider_code: 云厂商, region_id: 区域, zone_id: 可用区, instance_charge_type: 付费方式, cpu_number: cpu核数,
@@ -185,32 +113,29 @@ class InstanceTypeService:
             provider.endpoint,
         )
 
-        available_raw = client.list_available_type(
+        # 库存来自后台刷新的快照，翻页 / 过滤不再每次调用 DescribeAvailableResource；
+        # 返回快照时间供前端展示数据新鲜度，force_live 时现查
+        snapshot = client.stock_snapshot(
             search.region_id,
             search.zone_id,
             search.instance_charge_type,
-            'cloud_essd'
+            'cloud_essd',
+            force_live=search.force_live,
+        )
+        freshness = {"snapshot_at": snapshot.taken_at, "snapshot_age": round(snapshot.age, 1)}
+
+        if not snapshot.statuses:
+            return {"total": 0, "page": search.page, "page_size": search.page_size, "items": [], **freshness}
+
+        # 3) 规格详情走进程内列式索引（同步后自动重建），不再每次 IN (...) 查库
+        catalog = instance_type_catalog.get(
+            search.provider_code,
+            lambda: self.instance_type_repo.index_rows(search.provider_code),
         )
-        available_map = {}
-
-        for item in available_raw:
-            it_id = item.get("instance_type_id") or item.get("Value") or item.get("InstanceType")
-            # 标准化状态字段名
-            status = item.get("status_category") or item.get("StatusCategory") or item.get("status") or item.get(
-                "Status")
-            available_map[it_id] = {"status_category": status}
-
-        if not available_map:
-            return {"total": 0, "page": search.page, "page_size": search.page_size, "items": []}
-
-            # 3) 批量从 DB 里拿这些 instanceType 的详细信息（一次 SQL）
-        all_ids = list(available_map.keys())
-        db_map = self.instance_type_repo.batch_fetch_instance_types_from_db(all_ids)
-
-        # 4) 在内存中过滤（CPU / 内存 / GPU 等）
-        filtered = self._filter_available_instances(
-            available_map=available_map,
-            db_map=db_map,
+
+        # 4) 位图索引过滤（CPU / 内存 / GPU 等）
+        filtered = catalog.filter_available(
+            statuses=snapshot.statuses,
             cpu_number=search.cpu_number,
             memory_number=search.memory_number,
             gpu_spec=search.gpu_spec,
@@ -227,18 +152,18 @@ class InstanceTypeService:
         page_items = filtered[start:end]
 
         if not page_items:
-            return {"total": total, "page": page, "page_size": page_size, "items": []}
+            return {"total": total, "page": page, "page_size": page_size, "items": [], **freshness}
 
         # 6) 并发查询价格（只查当前页的 items，避免 N 次全量调用）
         instance_type_ids_page = [it["instance_type_id"] for it in page_items]
 
-        prices = self._fetch_prices_concurrent(
+        prices = self._fetch_prices(
             client=client,
+            provider_code=search.provider_code,
             region_id=search.region_id,
             instance_type_ids=instance_type_ids_page,
             instance_charge_type=search.instance_charge_type,
             system_disk_category="cloud_essd",
-            max_workers=10,
         )
 
         # 7) 合并并返回（把价格合并到每个 item）
@@ -263,6 +188,7 @@ class InstanceTypeService:
             "page": page,
             "page_size": page_size,
             "items": out_items,
+            **freshness,
         }
 
         # instance_all = []
@@ -291,3 +217,119 @@ class InstanceTypeService:
         #             "memory_size": inst.memory_size,
         #         })
         # return instance_all
+
+    #   region 级可用规格：各规格在哪些可用区有货 + 价格，前端对比可用区不用逐个可用区翻页
+    #   库存只用一次 region 级 DescribeAvailableResource（快照），价格与单可用区查询共用 price_resolver 缓存
+    def list_region_available_instance_types(self, search: InstanceTypeRegionSearch):
+        provider = self.provider_repo.get_by_code(search.provider_code)
+        if not provider:
+            raise BusinessException(
+                code=ErrorCode.DATA_NOT_FOUND,
+                message=Message.DATA_NOT_FOUND
+            )
+
+        client = CloudService(
+            self.db,
+            search.provider_code,
+            provider.access_key_id,
+            provider.access_key_secret,
+            provider.endpoint,
+        )
+
+        snapshots = client.region_stock_snapshots(
+            search.region_id,
+            search.instance_charge_type,
+            'cloud_essd',
+            force_live=search.force_live,
+        )
+        page = max(1, int(search.page or 1))
+        page_size = max(1, int(search.page_size or 10))
+        freshness = {
+            "snapshot_at": min((s.taken_at for s in snapshots.values()), default=None),
+            "snapshot_age": round(max((s.age for s in snapshots.values()), default=0.0), 1),
+        }
+        if not snapshots:
+            return {"total": 0, "page": page, "page_size": page_size, "items": [], **freshness}
+
+        # 1) 按规格合并各可用区的状态：{instance_type_id: {zone_id: status_category}}
+        zones_of: Dict[str, Dict[str, str]] = {}
+        for zone_id in sorted(snapshots):
+            for it_id, status in snapshots[zone_id].statuses.items():
+                zones_of.setdefault(it_id, {})[zone_id] = status
+
+        # 2) 合并后的状态取各可用区中最好的一个，hide_soldout 即"所有可用区都无货"
+        catalog = instance_type_catalog.get(
+            search.provider_code,
+            lambda: self.instance_type_repo.index_rows(search.provider_code),
+        )
+        filtered = catalog.filter_available(
+            statuses={it_id: best_status(list(zones.values())) for it_id, zones in zones_of.items()},
+            cpu_number=search.cpu_number,
+            memory_number=search.memory_number,
+            gpu_spec=search.gpu_spec,
+            gpu_name=search.gpu_name,
+            hide_soldout=bool(search.hide_soldout),
+        )
+
+        total = len(filtered)
+        start = (page - 1) * page_size
+        page_items = filtered[start:start + page_size]
+        if not page_items:
+            return {"total": total, "page": page, "page_size": page_size, "items": [], **freshness}
+
+        # 3) 价格只查当前页；DescribePrice 按 region 计价，各可用区同价，与单可用区查询命中同一缓存
+        prices = self._fetch_prices(
+            client=client,
+            provider_code=search.provider_code,
+            region_id=search.region_id,
+            instance_type_ids=[it["instance_type_id"] for it in page_items],
+            instance_charge_type=search.instance_charge_type,
+            system_disk_category="cloud_essd",
+        )
+
+        out_items = []
+        for it in page_items:
+            it_id = it["instance_type_id"]
+            zones = zones_of[it_id]
+            out_items.append({
+                "instance_type_id": it_id,
+                "cpu_core_count": it["cpu_core_count"],
+                "memory_size": it["memory_size"],
+                "gpu_amount": it["gpu_amount"],
+                "gpu_spec": it["gpu_spec"],
+                "gpu_memory": it["gpu_memory"],
+                "architecture": it["architecture"],
+                "price": prices.get(it_id, 0),
+                "status_category": it.get("status_category"),
+                "in_stock_zones": [z for z, status in zones.items() if status == "WithStock"],
+                "zones": [{"zone_id": z, "status_category": status} for z, status in zones.items()],
+            })
+
+        return {
+            "total": total,
+            "page": page,
+            "page_size": page_size,
+            "items": out_items,
+            **freshness,
+        }
+
+    #   可用区库存快照中记录的最近状态变化（如 WithStock -> WithoutStock），新的在前
+    def stock_changes(self, provider_code: str, region_id: str, zone_id: str,
+                      instance_charge_type: Optional[str] = None, only_soldout: bool = False) -> Dict[str, Any]:
+        snapshot = stock_snapshots.get(provider_code, region_id, zone_id, instance_charge_type, 'cloud_essd')
+        if snapshot is None:
+            return {"snapshot_at": None, "changes": []}
+        changes = snapshot.changes
+        if only_soldout:
+            changes = [c for c in changes if c.before == "WithStock" and c.after != "WithStock"]
+        return {
+            "snapshot_at": snapshot.taken_at,
+            "changes": [
+                {"instance_type_id": c.instance_type_id, "before": c.before, "after": c.after, "at": c.at}
+                for c in changes
+            ],
+        }
+
+    #   流式导出规格（不经过 ORM 对象，内存只保留一批）
+    def export(self, provider_code: str, fmt: ExportFormat = ExportFormat.NDJSON) -> Iterator[bytes]:
+        return stream_export("cmp", InstanceTypeRepo.export_stmt(provider_code), fmt)
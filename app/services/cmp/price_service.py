@@ -0,0 +1,148 @@
+# app/services/cmp/price_service.py
+import contextvars
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Callable, Dict, List, Optional, Tuple
+
+from app.clients.rate_limiter import RateLimitExceeded, call_deadline
+from app.common.cache import TieredCache, build_key, build_shared_backend
+from app.core.config import settings
+from app.core.logger import logger
+
+# (provider_code, region_id, instance_type, charge_type, disk_category, period)
+PriceKey = Tuple[str, str, str, Optional[str], Optional[str], int]
+
+_MISSING = object()
+
+
+def _extract_price(res) -> float:
+    """兼容 list_pricing 返回的 dict 嵌套 / 对象两种结构"""
+    if isinstance(res, dict):
+        return res.get("instancetype") or res.get("instanceType") or res.get("price") or 0
+    return getattr(res, "price", 0)
+
+
+class PriceResolver:
+    """
+    DescribePrice 价格解析器：
+    - 按完整的 (provider, region, instance_type, charge_type, disk_category, period) 缓存价格（TTL），
+      进程内 LRU + 与目录缓存共用的 Redis 二级缓存：重启 / LRU 淘汰后仍能命中，不必再调 DescribePrice
+    - 相同 key 的并发请求合并为一次云 API 调用
+    - 使用进程级常驻、有界的线程池，而不是每次请求新建线程池
+    """
+
+    def __init__(
+        self,
+        ttl: float,
+        max_workers: int,
+        max_entries: int = 20000,
+        per_call_timeout: float = 8.0,
+        retry: int = 1,
+        redis_url: Optional[str] = None,
+    ):
+        self.ttl = ttl
+        self.per_call_timeout = per_call_timeout
+        self.retry = retry
+        self.cache = TieredCache(max_entries, shared=build_shared_backend(redis_url))
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="price")
+        self._inflight: Dict[PriceKey, Future] = {}
+        self._lock = threading.Lock()
+
+    def _fetch(self, key: PriceKey, call: Callable[[], dict], deadline: float) -> float:
+        # 限流器排队不超过 resolve_many 的等待时间，超时的调用不再占着令牌 / 并发名额
+        call_deadline.set(deadline)
+        last_exc = None
+        for attempt in range(self.retry + 1):
+            try:
+                price = _extract_price(call())
+                self.cache.set(build_key("price", *key), price, self.ttl)
+                return price
+            except RateLimitExceeded:
+                # 本地限流说明已经等满了，再重试只会继续排队
+                raise
+            except Exception as e:
+                last_exc = e
+                logger.warning("price fetch failed (attempt %s) for %s: %s", attempt + 1, key[2], e)
+                # 简短退避；截止时间内来不及再试就不再重试
+                backoff = 0.2 * (attempt + 1)
+                if time.monotonic() + backoff >= deadline:
+                    break
+                time.sleep(backoff)
+        raise last_exc
+
+    def _submit(self, key: PriceKey, call: Callable[[], dict]) -> Future:
+        with self._lock:
+            fut = self._inflight.get(key)
+            if fut is not None:
+                return fut
+            # 带上当前请求的 contextvars，工作线程里的云调用耗时才能计入 request_timings
+            fut = self._executor.submit(
+                contextvars.copy_context().run, self._fetch, key, call, time.monotonic() + self.per_call_timeout)
+            self._inflight[key] = fut
+        # 回调可能在当前线程立即执行，必须放在锁外
+        fut.add_done_callback(lambda f, k=key: self._release(k, f))
+        return fut
+
+    def _release(self, key: PriceKey, fut: Future) -> None:
+        with self._lock:
+            if self._inflight.get(key) is fut:
+                del self._inflight[key]
+
+    def resolve_many(
+        self,
+        client,
+        provider_code: str,
+        region_id: str,
+        instance_type_ids: List[str],
+        instance_charge_type: Optional[str],
+        system_disk_category: Optional[str],
+        period: int = 1,
+    ) -> Dict[str, float]:
+        """
+        批量获取价格。
+        :param client: CloudService（提供 list_pricing）
+        :return: {instance_type_id: price}，失败或超时的价格为 0，且不会写入缓存
+        """
+        prices: Dict[str, float] = {}
+        pending: Dict[str, Future] = {}
+
+        for it_id in instance_type_ids:
+            key = (provider_code, region_id, it_id, instance_charge_type, system_disk_category, period)
+            cached = self.cache.get(build_key("price", *key), self.ttl, _MISSING)
+            if cached is not _MISSING:
+                prices[it_id] = cached
+                continue
+            pending[it_id] = self._submit(
+                key,
+                lambda it_id=it_id: client.list_pricing(
+                    region_id, it_id, instance_charge_type, system_disk_category, period
+                ),
+            )
+
+        if pending:
+            wait(pending.values(), timeout=self.per_call_timeout)
+            for it_id, fut in pending.items():
+                if not fut.done():
+                    logger.error("price request timeout for %s", it_id)
+                    prices[it_id] = 0
+                    continue
+                try:
+                    price = fut.result()
+                except Exception as e:
+                    logger.error("price fetch ultimately failed for %s: %s", it_id, e)
+                    prices[it_id] = 0
+                    continue
+                prices[it_id] = price
+
+        return prices
+
+    def invalidate(self) -> None:
+        self.cache.invalidate_prefix(build_key("price"))
+
+
+price_resolver = PriceResolver(
+    ttl=settings.PRICE_CACHE_TTL_SECONDS,
+    max_workers=settings.PRICE_RESOLVER_WORKERS,
+    redis_url=settings.CATALOG_CACHE_REDIS_URL,
+)
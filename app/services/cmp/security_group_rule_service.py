@@ -1,3 +1,4 @@
+from typing import Iterator, Optional
 from sqlalchemy.orm import Session
 
 from app.clients.cloud_client_factory import CloudClientFactory
@@ -8,6 +9,7 @@ from app.schemas.cmp.security_group_rule_schema import SecurityGroupRuleUpdate,
 from app.common.exceptions import BusinessException
 from app.common.status_code import ErrorCode
 from app.common.messages import Message
+from app.common.streaming import ExportFormat, stream_export
 
 
 class SecurityGroupRuleService:
@@ -104,4 +106,9 @@ class SecurityGroupRuleService:
         for r in rules:
             self.rule_repo.insert_cloud_rule(sg.id, r)
 
-        self.db.commit()
\ No newline at end of file
+        self.db.commit()
+
+    #   流式导出安全组规则
+    def export(self, security_group_id: Optional[str] = None,
+               fmt: ExportFormat = ExportFormat.NDJSON) -> Iterator[bytes]:
+        return stream_export("cmp", SecurityGroupRuleRepository.export_stmt(security_group_id), fmt)
@@ -1,11 +1,14 @@
-from typing import List
+from typing import Iterator, List, Optional
 from sqlalchemy.orm import Session
 from app.schemas.cmp.security_group_schema import SecurityGroupSearch, SecurityGroupPage, SecurityGroupCreate, SecurityGroup
 from app.repositories.public.cloud_provider_repo import CloudProviderRepository
 from app.repositories.cmp.security_group_repo import SecurityGroupRepository
-from app.common.pagination import paginate_query
+from app.common.pagination import paginate_query, CountMode, CursorResult
+from app.common.exceptions import BusinessException
 from app.common.status_code import ErrorCode
 from app.common.messages import Message
+from app.services.public.cloud_service import CloudService
+from app.common.streaming import ExportFormat, stream_export
 
 class SecurityGroupService:
     def __init__(self, cmp_db: Session, public_db: Session):
@@ -29,41 +32,31 @@ class SecurityGroupService:
 
         return SecurityGroupPage(total=total, page=filters.page, page_size=filters.page_size, items=items)
 
-    def security_groups(self, provider_code: str, region_id: str, page: int = 1, page_size: int = 50):
-        # provider = self.provider_repo.get_by_code(provider_code)
-        # if not provider:
-        #     raise BusinessException(...)
-        # cloud_client = CloudClientFactory.create_client(
-        #     provider_code,
-        #     provider.access_key_id,
-        #     provider.access_key_secret,
-        #     provider.endpoint,
-        # )
-        current_page = page
-
-        while True:
-            resp = cloud_client.list_security_groups(
-                region_id=region_id,
-                vpc_id=None,
-                page=current_page,
-                page_size=page_size
-            )
+    #   游标分页；首页为空时与 list_page 一样先从云端同步
+    def list_cursor(self, filters: SecurityGroupSearch, cursor: Optional[str] = None,
+                    count: CountMode = CountMode.NONE) -> CursorResult:
+        result = self.security_group_repo.search_cursor(filters, cursor, count)
+        if result.items or cursor or not (filters.cloud_provider_code and filters.region_id):
+            return result
 
-            items = resp.get("items", [])
-            if not items:
-                break
+        self.security_groups(provider_code=filters.cloud_provider_code, region_id=filters.region_id)
+        return self.security_group_repo.search_cursor(filters, cursor, count)
 
-            # 批量保存
-            self.security_group_repo.bulk_upsert_from_cloud(
-                provider_code, region_id, items
+    def security_groups(self, provider_code: str, region_id: str, page_size: int = 50):
+        provider = self.provider_repo.get_by_code(provider_code)
+        if not provider:
+            raise BusinessException(
+                code=ErrorCode.DATA_NOT_FOUND,
+                message=Message.DATA_NOT_FOUND
             )
-
-            # 如果少于 page_size 说明没有下一页
-            if len(items) < page_size:
-                break
-
-            current_page += 1
-
+        cloud = CloudService(
+            self.db,
+            provider_code,
+            provider.access_key_id,
+            provider.access_key_secret,
+            provider.endpoint,
+        )
+        cloud.sync_security_groups(region_id, page_size=page_size)
         return True
 
     # ----------------------------
@@ -138,4 +131,9 @@ class SecurityGroupService:
 
 
     def list_security_groups(self, provider_code: str, region_id: str, vpc_id: int) -> List[SecurityGroup]:
-        return self.security_group_repo.get_by_security_group(provider_code, region_id, vpc_id)
\ No newline at end of file
+        return self.security_group_repo.get_by_security_group(provider_code, region_id, vpc_id)
+
+    #   流式导出安全组
+    def export(self, provider_code: str, region_id: Optional[str] = None,
+               fmt: ExportFormat = ExportFormat.NDJSON) -> Iterator[bytes]:
+        return stream_export("cmp", SecurityGroupRepository.export_stmt(provider_code, region_id), fmt)
@@ -1,6 +1,6 @@
 # app/services/cmp/subnet_service.py
 from sqlalchemy.orm import Session
-from typing import List
+from typing import Iterator, List, Optional
 from nanoid import generate
 
 from app.repositories.public.cloud_provider_repo import CloudProviderRepository
@@ -10,6 +10,8 @@ from app.common.status_code import ErrorCode
 from app.common.messages import Message
 
 from app.services.public.cloud_service import CloudService
+from app.common.streaming import ExportFormat, stream_export
+from app.common.pagination import CountMode, CursorResult
 
 class SubnetService:
     def __init__(self, cmp_db: Session, public_db: Session):
@@ -38,6 +40,7 @@ class SubnetService:
     def create(self, data: SubnetCreate) -> SubnetOut:
         subnet_id = generate(size=12)  # 随机生成云子网ID
         obj = self.subnet_repo.create({**data.model_dump(), "subnet_id": subnet_id})
+        CloudService.invalidate("vswitches", obj.cloud_provider_code, obj.region_id)
         return SubnetOut.model_validate(obj)
 
     def release(self, subnet_id: str, cloud_provider_code: str) -> SubnetOut:
@@ -45,6 +48,7 @@ class SubnetService:
         if not obj:
             raise BusinessException(code=ErrorCode.DATA_NOT_FOUND, message=Message.DATA_NOT_FOUND)
         obj = self.subnet_repo.release(obj)
+        CloudService.invalidate("vswitches", obj.cloud_provider_code, obj.region_id)
         return SubnetOut.model_validate(obj)
 
     def page_subnets(
@@ -72,3 +76,31 @@ class SubnetService:
             page_size=page_size,
             items=[SubnetOut.model_validate(s) for s in items]
         )
+
+    #   游标分页查询子网
+    def cursor_subnets(
+            self,
+            cloud_provider_code: str = None,
+            region_id: str = None,
+            zone_id: str = None,
+            vpc_id: str = None,
+            resource_group_id: int = None,
+            cursor: Optional[str] = None,
+            page_size: int = 20,
+            count: CountMode = CountMode.NONE,
+    ) -> CursorResult:
+        return self.subnet_repo.list_cursor(
+            cloud_provider_code=cloud_provider_code,
+            region_id=region_id,
+            zone_id=zone_id,
+            vpc_id=vpc_id,
+            resource_group_id=resource_group_id,
+            cursor=cursor,
+            page_size=page_size,
+            count=count,
+        )
+
+    #   流式导出子网
+    def export(self, provider_code: str, region_id: Optional[str] = None, vpc_id: Optional[int] = None,
+               fmt: ExportFormat = ExportFormat.NDJSON) -> Iterator[bytes]:
+        return stream_export("cmp", SubnetRepository.export_stmt(provider_code, region_id, vpc_id), fmt)
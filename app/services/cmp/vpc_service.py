@@ -1,5 +1,5 @@
 # app/services/public/cloud_vpc_service.py
-from typing import List
+from typing import Iterator, List, Optional
 from sqlalchemy.orm import Session
 
 from app.schemas.cmp.vpc_schema import VpcOut, VpcCreate, VpcBase
@@ -11,6 +11,8 @@ from app.common.status_code import ErrorCode
 from app.common.messages import Message
 
 from app.services.public.cloud_service import CloudService
+from app.common.streaming import ExportFormat, stream_export
+from app.common.pagination import CountMode, CursorResult
 
 
 class VPCService:
@@ -47,11 +49,16 @@ class VPCService:
     def list_page(self, provider_code: str, region_id: str, page: int, page_size: int):
         return self.vpc_repo.list_page(provider_code, region_id, page, page_size)
 
+    def list_cursor(self, provider_code: str, region_id: str, cursor: Optional[str] = None,
+                    page_size: int = 20, count: CountMode = CountMode.NONE) -> CursorResult:
+        return self.vpc_repo.list_cursor(provider_code, region_id, cursor, page_size, count)
+
     # --------------------------------
     # 创建单个 VPC
     # --------------------------------
     def create(self, data: VpcCreate) -> VpcOut:
         obj = self.vpc_repo.create(data.model_dump())
+        CloudService.invalidate("vpcs", obj.cloud_provider_code, obj.region_id)
         return VpcOut.model_validate(obj)
 
     # 释放逻辑
@@ -64,4 +71,10 @@ class VPCService:
             raise BusinessException(code=ErrorCode.CLOUD_PROVIDER_NOT_FOUND, message= '该 VPC 已释放，无需重复释放')
 
         vpc = self.vpc_repo.release(vpc)
-        return VpcOut.model_validate(vpc)
\ No newline at end of file
+        CloudService.invalidate("vpcs", vpc.cloud_provider_code, vpc.region_id)
+        return VpcOut.model_validate(vpc)
+
+    #   流式导出 vpc
+    def export(self, provider_code: str, region_id: Optional[str] = None,
+               fmt: ExportFormat = ExportFormat.NDJSON) -> Iterator[bytes]:
+        return stream_export("cmp", VpcRepository.export_stmt(provider_code, region_id), fmt)
@@ -0,0 +1,129 @@
+# app/services/public/async_cloud_service.py
+from typing import List, Optional
+
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.clients.cloud_client_factory import CloudClientFactory
+from app.common.cache import build_key
+from app.core.logger import logger
+from app.services.public.cloud_service import CloudService, catalog_cache, cloud_flights, CATALOG_TTLS
+from app.services.public.catalog_freshness import catalog_freshness, scope_of, FRESH, STALE
+from app.schemas.public.cloud_region_schema import CloudRegionBase
+from app.schemas.public.cloud_zone_schema import CloudZoneList
+from app.schemas.cmp.instance_type_schema import InstanceTypeBase
+
+
+class AsyncCloudService:
+    """
+    CloudService 的协程版本：与 CloudService 共用目录缓存与仓储，
+    云 API 走 AsyncAliyunClient，数据库读写（短阻塞）放到线程池执行。
+    """
+
+    def __init__(self, db: Session, provider_code: str, access_key_id: str, access_key_secret: str, endpoint: str):
+        self.provider_code = provider_code
+        self.client = CloudClientFactory.create_async_client(provider_code, access_key_id, access_key_secret, endpoint)
+        # 仅复用其 DB 读写方法
+        self.sync = CloudService(db, provider_code, access_key_id, access_key_secret, endpoint)
+
+    async def _cached(self, kind: str, key_parts: tuple, loader):
+        key = build_key("catalog", kind, *key_parts)
+        return await catalog_cache.get_or_load_async(
+            key, CATALOG_TTLS[kind], lambda: cloud_flights.do_async(key, loader)
+        )
+
+    async def _read_through(self, kind: str, scope: str, read, fetch, store, sync: str, *sync_args):
+        """
+        CloudService._read_through 的协程版本：
+        后台刷新仍走线程池里的 CloudService.sync_*，同步刷新走异步客户端 fetch() 后 store() 入库
+        """
+        rows = await run_in_threadpool(read)
+        if rows:
+            state = await run_in_threadpool(catalog_freshness.state, self.provider_code, kind, scope)
+            if state == FRESH:
+                return rows
+            if state == STALE:
+                self.sync.refresh_in_background(kind, scope, sync, *sync_args)
+                return rows
+
+        try:
+            items = await fetch()
+            await run_in_threadpool(store, items)
+        except Exception as e:
+            if rows:
+                logger.warning("refresh %s failed for %s/%s, serving stale rows: %s", kind, self.provider_code, scope, e)
+                return rows
+            raise
+        return await run_in_threadpool(read)
+
+    async def list_regions(self) -> List[CloudRegionBase]:
+        async def _load():
+            return await self._read_through(
+                "regions",
+                scope_of(),
+                self.sync.regions_from_db,
+                self.client.list_regions,
+                self.sync.store_regions,
+                "sync_regions",
+            )
+
+        return await self._cached("regions", (self.provider_code,), _load)
+
+    async def list_zones(self, provider_code: str, region_id: str) -> List[CloudZoneList]:
+        async def _load():
+            return await self._read_through(
+                "zones",
+                scope_of(region_id),
+                lambda: self.sync.zones_from_db(provider_code, region_id),
+                lambda: self.client.list_zones(region_id),
+                lambda zones: self.sync.store_zones(region_id, zones),
+                "sync_zones",
+                region_id,
+            )
+
+        return await self._cached("zones", (provider_code, region_id), _load)
+
+    async def list_instance_types(self, provider_code: str) -> List[InstanceTypeBase]:
+        async def _load():
+            return await self._read_through(
+                "instance_types",
+                scope_of(),
+                lambda: self.sync.instance_types_from_db(provider_code),
+                lambda: self.client.list_instance_types(provider_code),
+                self.sync.store_instance_types,
+                "sync_instance_types",
+            )
+
+        return await self._cached("instance_types", (provider_code,), _load)
+
+    async def list_images(self, region_id: str, instance_type_id: str, architecture: str) -> List[dict]:
+        return await self._cached(
+            "images",
+            (self.provider_code, region_id, None, instance_type_id, architecture),
+            lambda: self.client.list_images(region_id, instance_type_id, architecture),
+        )
+
+    async def list_disk_types(
+        self,
+        region_id: Optional[str] = None,
+        zone_id: Optional[str] = None,
+        instance_type_id: Optional[str] = None,
+        instance_charge_type: Optional[str] = None,
+    ) -> List[str]:
+        return await self._cached(
+            "disk_types",
+            (self.provider_code, region_id, zone_id, instance_type_id, instance_charge_type),
+            lambda: self.client.list_system_disk_categories(region_id, zone_id, instance_type_id, instance_charge_type),
+        )
+
+    async def list_available_type(
+        self,
+        region_id: str = None,
+        zone_id: str = None,
+        instance_charge_type: str = None,
+        system_disk_category: str = None,
+    ) -> List[dict]:
+        # 库存走与同步版相同的快照（新鲜度、后台刷新、状态变化记录），缺快照时的整 region 拉取放到线程池
+        return await run_in_threadpool(
+            self.sync.list_available_type, region_id, zone_id, instance_charge_type, system_disk_category
+        )
@@ -0,0 +1,140 @@
+# app/services/public/audit_log_service.py
+import gzip
+import os
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.common.pagination import CountMode, CursorResult
+from app.common.streaming import ExportFormat, encode_batches, iter_batches, stream_export
+from app.core.config import settings
+from app.core.logger import logger
+from app.models.public.audit_log import AuditLog
+from app.repositories.public.audit_log_repo import AUDIT_DB, AuditLogRepository
+
+# 不传时间范围时默认查询最近几天
+DEFAULT_QUERY_DAYS = 7
+# 未分区时兜底清理的单批删除条数
+PURGE_BATCH_SIZE = 5000
+
+
+def month_start(value: date, offset: int = 0) -> date:
+    """value 所在月份往后 offset 个月的 1 号"""
+    months = value.year * 12 + value.month - 1 + offset
+    return date(months // 12, months % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    return f"p{month:%Y%m}"
+
+
+def partition_month(name: str) -> Optional[date]:
+    """pYYYYMM -> 当月 1 号；兜底分区等其他名字返回 None"""
+    try:
+        return datetime.strptime(name[1:], "%Y%m").date() if name.startswith("p") else None
+    except ValueError:
+        return None
+
+
+class AuditLogService:
+    """操作审计日志服务层"""
+
+    def __init__(self, db: Session):
+        self.db = db
+        self.audit_log_repo = AuditLogRepository(db)
+
+    #   按时间范围游标分页查询（默认最近 DEFAULT_QUERY_DAYS 天）
+    def list_cursor(
+            self,
+            start_time: Optional[datetime] = None,
+            end_time: Optional[datetime] = None,
+            module: Optional[str] = None,
+            action: Optional[str] = None,
+            user_id: Optional[str] = None,
+            status: Optional[str] = None,
+            cursor: Optional[str] = None,
+            page_size: int = 20,
+            count: CountMode = CountMode.NONE,
+    ) -> CursorResult:
+        end_time = end_time or datetime.now(timezone.utc)
+        start_time = start_time or end_time - timedelta(days=DEFAULT_QUERY_DAYS)
+        return self.audit_log_repo.list_cursor(
+            start_time, end_time, module, action, user_id, status, cursor, page_size, count)
+
+    #   流式导出审计日志
+    def export(
+            self,
+            module: Optional[str] = None,
+            user_id: Optional[str] = None,
+            start_time: Optional[datetime] = None,
+            end_time: Optional[datetime] = None,
+            fmt: ExportFormat = ExportFormat.NDJSON,
+    ) -> Iterator[bytes]:
+        stmt = AuditLogRepository.export_stmt(module, user_id, start_time, end_time)
+        return stream_export(AUDIT_DB, stmt, fmt)
+
+    # ============================================================
+    # 分区维护：提前建好未来月份分区；超过保留期的分区先归档再整体删除
+    # ============================================================
+    def maintain_partitions(self, today: Optional[date] = None) -> Dict[str, List[str]]:
+        today = today or datetime.now(timezone.utc).date()
+        current = month_start(today)
+        cutoff = month_start(today, -settings.AUDIT_LOG_RETENTION_MONTHS)
+        partitions = self.audit_log_repo.list_partitions()
+
+        if not partitions:
+            # 表未分区（或非 MySQL）：退化为分批 DELETE
+            removed = 0
+            while True:
+                count = self.audit_log_repo.delete_before(datetime.combine(cutoff, datetime.min.time()), PURGE_BATCH_SIZE)
+                removed += count
+                if count < PURGE_BATCH_SIZE:
+                    break
+            if removed:
+                logger.info("purged %s audit logs before %s (table not partitioned)", removed, cutoff)
+            return {"added": [], "dropped": []}
+
+        existing = set(partitions)
+        missing: List[Tuple[str, date]] = []
+        for offset in range(settings.AUDIT_LOG_PARTITION_AHEAD_MONTHS + 1):
+            month = month_start(current, offset)
+            if partition_name(month) not in existing:
+                missing.append((partition_name(month), month_start(month, 1)))
+        # 只能从兜底分区往后拆，早于最后一个月份分区的缺口无法补建
+        last = max((m for m in map(partition_month, partitions) if m), default=None)
+        missing = [(name, bound) for name, bound in missing if last is None or partition_month(name) > last]
+        self.audit_log_repo.add_partitions(missing)
+
+        dropped = []
+        for name in partitions:
+            month = partition_month(name)
+            # 分区上界（下月 1 号）不晚于保留期起点时，整个分区都已过期
+            if month is None or month_start(month, 1) > cutoff:
+                continue
+            self._archive(name, month)
+            self.audit_log_repo.drop_partition(name)
+            dropped.append(name)
+
+        if missing or dropped:
+            logger.info("audit partitions added %s, dropped %s", [n for n, _ in missing], dropped)
+        return {"added": [n for n, _ in missing], "dropped": dropped}
+
+    def _archive(self, name: str, month: date) -> Optional[str]:
+        """把一个月份分区导出为 gzip NDJSON；未配置归档目录时跳过"""
+        if not settings.AUDIT_LOG_ARCHIVE_DIR:
+            return None
+        os.makedirs(settings.AUDIT_LOG_ARCHIVE_DIR, exist_ok=True)
+        path = os.path.join(settings.AUDIT_LOG_ARCHIVE_DIR, f"{AuditLog.__tablename__}-{name}.ndjson.gz")
+        stmt = AuditLogRepository.export_stmt(
+            start_time=datetime.combine(month, datetime.min.time()),
+            end_time=datetime.combine(month_start(month, 1), datetime.min.time()),
+        )
+        # 先写临时文件，写完再改名：归档失败时不会留下半截文件，分区也不会被删除
+        tmp_path = path + ".tmp"
+        with gzip.open(tmp_path, "wb") as f:
+            for chunk in encode_batches(iter_batches(AUDIT_DB, stmt), ExportFormat.NDJSON):
+                f.write(chunk)
+        os.replace(tmp_path, path)
+        logger.info("archived audit partition %s to %s", name, path)
+        return path
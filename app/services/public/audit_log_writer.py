@@ -0,0 +1,296 @@
+# app/services/public/audit_log_writer.py
+import glob
+import json
+import os
+import queue
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.common.status_code import ErrorCode
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.logger import logger
+from app.core.metrics import Counter, Histogram, registry
+from app.core.security import verify_token
+from app.repositories.public.audit_log_repo import AUDIT_DB, AuditLogRepository
+
+AUDIT_LOG_RECORDS = registry.register(Counter(
+    "audit_log_records_total", "Audit records by outcome (db / spilled / replayed / dropped)", ("outcome",)))
+AUDIT_LOG_FLUSH_LATENCY = registry.register(Histogram(
+    "audit_log_flush_seconds", "Multi-row INSERT latency of one audit batch",
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)))
+
+# 路由里没有动词时按 HTTP 方法推断动作
+METHOD_ACTIONS = {"POST": "create", "PUT": "update", "PATCH": "update", "DELETE": "delete"}
+# 审计记录里保留的错误信息 / 请求参数最大长度
+_TEXT_LIMIT = 2000
+
+
+# ------------------------------------------------------------
+# 请求原始信息 -> 审计日志行（在后台线程执行，不占请求耗时）
+# ------------------------------------------------------------
+def _module_action(method: str, route_path: str) -> Tuple[str, str]:
+    """/api/cloud_providers/update/{record_id} -> (cloud_providers, update)"""
+    if route_path.startswith(settings.API_PREFIX):
+        route_path = route_path[len(settings.API_PREFIX):]
+    parts = [p for p in route_path.split("/") if p]
+    module = parts[0] if parts else "root"
+    verbs = [p for p in parts[1:] if not p.startswith("{")]
+    return module, verbs[-1] if verbs else METHOD_ACTIONS.get(method, method.lower())
+
+
+def _outcome(status_code: int, body: bytes) -> Tuple[str, Optional[str]]:
+    """HTTP 状态码 >= 400 或业务码非 SUCCESS（业务异常仍返回 200）都算失败"""
+    payload = None
+    if body:
+        try:
+            payload = json.loads(body)
+        except ValueError:
+            payload = None
+    if not isinstance(payload, dict):
+        payload = {}
+    code = payload.get("code")
+    message = payload.get("message") or payload.get("detail")
+    if status_code >= 400 or (isinstance(code, int) and code != ErrorCode.SUCCESS):
+        return "failed", str(message or f"HTTP {status_code}")[:_TEXT_LIMIT]
+    return "success", None
+
+
+def _identity(token: Optional[str]) -> Tuple[Optional[str], Optional[str]]:
+    if not token:
+        return None, None
+    try:
+        payload = verify_token(token)
+    except Exception:
+        return None, None
+    user_id = payload.get("user_id") or payload.get("sub")
+    return (str(user_id) if user_id is not None else None), payload.get("username")
+
+
+def to_row(record: Dict[str, Any]) -> Dict[str, Any]:
+    module, action = _module_action(record["method"], record["route_path"])
+    status, error_message = _outcome(record["status_code"], record["body"])
+    user_id, username = _identity(record["token"])
+    path_params = record["path_params"]
+    request_data = {"method": record["method"], "path": record["path"]}
+    if record["query"]:
+        request_data["query"] = record["query"]
+    return {
+        "user_id": user_id,
+        "username": username,
+        "module": module,
+        "action": action,
+        "target_type": module,
+        "target_id": str(next(iter(path_params.values())))[:100] if path_params else None,
+        "request_data": json.dumps(request_data, ensure_ascii=False)[:_TEXT_LIMIT],
+        "description": record["endpoint"],
+        "status": status,
+        "error_message": error_message,
+        "ip_address": record["ip"],
+        "created_at": record["created_at"],
+    }
+
+
+class AuditLogWriter:
+    """
+    审计日志异步批量写入：
+    - 中间件 submit() 只做一次非阻塞入队（有界队列），队列满时丢弃并计数，请求耗时与审计量无关
+    - 后台线程攒够 batch_size 条或等满 flush_interval 秒后，用一条多行 INSERT 写入 audit_center 库
+    - 写库失败或单批耗时超过 slow_seconds 时，接下来 retry_seconds 内的批次改为追加到本地 NDJSON 文件，
+      之后先回放文件再恢复直写
+    """
+
+    def __init__(self, max_queue: int, batch_size: int, flush_interval: float,
+                 slow_seconds: float, retry_seconds: float, spill_dir: str):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.slow_seconds = slow_seconds
+        self.retry_seconds = retry_seconds
+        self.spill_dir = spill_dir
+        self._queue: "queue.Queue[Dict[str, Any]]" = queue.Queue(maxsize=max_queue)
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._db_paused_until = 0.0
+        self._dropped = 0
+
+    @property
+    def _spill_path(self) -> str:
+        # 每个 worker 进程写自己的文件，避免多进程同时追加
+        return os.path.join(self.spill_dir, f"audit-{os.getpid()}.ndjson")
+
+    # ============================================================
+    # 请求路径
+    # ============================================================
+    def submit(self, record: Dict[str, Any]) -> bool:
+        try:
+            self._queue.put_nowait(record)
+            return True
+        except queue.Full:
+            AUDIT_LOG_RECORDS.inc("dropped")
+            # 只用于日志提示，计数不精确无妨
+            self._dropped += 1
+            return False
+
+    # ============================================================
+    # 生命周期
+    # ============================================================
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name="audit-log-writer", daemon=True)
+        self._thread.start()
+        logger.info("📝 Audit log writer started")
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """停止前把队列里剩余的记录写完（写不进库就落盘）"""
+        if self._thread is None:
+            return
+        self._stopped.set()
+        self._thread.join(timeout)
+        self._thread = None
+
+    # ============================================================
+    # 后台线程
+    # ============================================================
+    def _run(self) -> None:
+        while True:
+            stopping = self._stopped.is_set()
+            batch = self._drain(0 if stopping else self.flush_interval)
+            if batch:
+                self._flush(batch)
+            if self._dropped:
+                dropped, self._dropped = self._dropped, 0
+                logger.warning("audit queue full, dropped %s records", dropped)
+            if stopping and not batch:
+                return
+            if not stopping:
+                self._replay()
+
+    def _drain(self, wait: float) -> List[Dict[str, Any]]:
+        batch: List[Dict[str, Any]] = []
+        deadline = time.monotonic() + wait
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(self._queue.get(timeout=max(0.0, deadline - time.monotonic())))
+            except queue.Empty:
+                break
+        return batch
+
+    def _flush(self, batch: List[Dict[str, Any]]) -> None:
+        rows = []
+        for record in batch:
+            try:
+                rows.append(to_row(record))
+            except Exception as e:
+                logger.warning("build audit row failed for %s: %s", record.get("path"), e)
+        if not rows:
+            return
+        if time.monotonic() < self._db_paused_until or not self._insert(rows):
+            self._spill(rows)
+            return
+        AUDIT_LOG_RECORDS.inc("db", amount=len(rows))
+
+    def _insert(self, rows: List[Dict[str, Any]]) -> bool:
+        start = time.perf_counter()
+        db = SessionLocal[AUDIT_DB]()
+        try:
+            AuditLogRepository(db).bulk_insert(rows)
+        except Exception as e:
+            db.rollback()
+            self._db_paused_until = time.monotonic() + self.retry_seconds
+            logger.warning("audit log insert failed, spilling to %s for %ss: %s", self.spill_dir, self.retry_seconds, e)
+            return False
+        finally:
+            db.close()
+        elapsed = time.perf_counter() - start
+        AUDIT_LOG_FLUSH_LATENCY.observe(elapsed)
+        if elapsed > self.slow_seconds:
+            # 这一批已经写进去了，后续批次先落盘，给数据库喘息时间
+            self._db_paused_until = time.monotonic() + self.retry_seconds
+            logger.warning("audit log insert took %.2fs, spilling to %s for %ss", elapsed, self.spill_dir, self.retry_seconds)
+        return True
+
+    # ============================================================
+    # 本地文件兜底
+    # ============================================================
+    def _spill(self, rows: List[Dict[str, Any]]) -> None:
+        try:
+            os.makedirs(self.spill_dir, exist_ok=True)
+            with open(self._spill_path, "a", encoding="utf-8") as f:
+                for row in rows:
+                    f.write(json.dumps({**row, "created_at": row["created_at"].isoformat()}, ensure_ascii=False))
+                    f.write("\n")
+            AUDIT_LOG_RECORDS.inc("spilled", amount=len(rows))
+        except Exception as e:
+            AUDIT_LOG_RECORDS.inc("dropped", amount=len(rows))
+            logger.error("audit log spill failed, dropped %s records: %s", len(rows), e)
+
+    def _spill_files(self) -> List[str]:
+        """本进程的落盘文件，以及其他进程留下、超过一段时间没再写入的文件（进程已退出）"""
+        own = self._spill_path
+        stale_before = time.time() - max(60.0, 2 * self.retry_seconds)
+        files = []
+        for path in glob.glob(os.path.join(self.spill_dir, "*.ndjson")):
+            try:
+                if path == own or os.path.getmtime(path) < stale_before:
+                    files.append(path)
+            except OSError:
+                continue
+        return files
+
+    def _replay(self) -> None:
+        """数据库恢复后每轮回放一个落盘文件；回放到一半失败时剩余记录写回本进程文件"""
+        if time.monotonic() < self._db_paused_until or not os.path.isdir(self.spill_dir):
+            return
+        files = self._spill_files()
+        if not files:
+            return
+        # 先改名认领并刷新 mtime，其他进程不会再处理它，本进程新的落盘也会写到新文件；
+        # 回放中途进程退出时，该文件过一段时间会被当作遗留文件再次回放
+        claimed = os.path.join(self.spill_dir, f"replay-{os.getpid()}-{time.time_ns()}.ndjson")
+        try:
+            os.rename(files[0], claimed)
+            os.utime(claimed)
+        except OSError:
+            return
+
+        with open(claimed, encoding="utf-8") as f:
+            rows = []
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    row = json.loads(line)
+                    row["created_at"] = datetime.fromisoformat(row["created_at"])
+                    rows.append(row)
+                except (ValueError, KeyError) as e:
+                    logger.warning("skip malformed audit spill line: %s", e)
+
+        replayed = 0
+        for i in range(0, len(rows), self.batch_size):
+            chunk = rows[i:i + self.batch_size]
+            if not self._insert(chunk):
+                self._spill(rows[i:])
+                break
+            replayed += len(chunk)
+        os.remove(claimed)
+        AUDIT_LOG_RECORDS.inc("replayed", amount=replayed)
+        logger.info("replayed %s/%s audit records from %s", replayed, len(rows), files[0])
+
+    def collect(self) -> List[str]:
+        """/metrics 渲染时输出队列深度"""
+        return ["# TYPE audit_log_queue_depth gauge", f"audit_log_queue_depth {self._queue.qsize()}"]
+
+
+audit_log_writer = AuditLogWriter(
+    max_queue=settings.AUDIT_LOG_QUEUE_SIZE,
+    batch_size=settings.AUDIT_LOG_BATCH_SIZE,
+    flush_interval=settings.AUDIT_LOG_FLUSH_SECONDS,
+    slow_seconds=settings.AUDIT_LOG_SLOW_SECONDS,
+    retry_seconds=settings.AUDIT_LOG_RETRY_SECONDS,
+    spill_dir=settings.AUDIT_LOG_SPILL_DIR,
+)
+registry.add_collector(audit_log_writer.collect)
@@ -0,0 +1,105 @@
+# app/services/public/catalog_freshness.py
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Callable, Dict, Optional, Set, Tuple
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.logger import logger
+from app.repositories.public.catalog_sync_state_repo import CatalogSyncStateRepository
+
+FRESH = "fresh"
+STALE = "stale"
+EXPIRED = "expired"
+
+# 各目录表的 (软 TTL, 硬 TTL)，单位秒：
+#   未过软 TTL 直接返回；过软 TTL 返回旧数据并后台刷新；过硬 TTL 或表为空时同步刷新
+CATALOG_FRESHNESS = {
+    "regions": (24 * 3600, 7 * 24 * 3600),
+    "zones": (24 * 3600, 7 * 24 * 3600),
+    "instance_types": (6 * 3600, 3 * 24 * 3600),
+    "vpcs": (300, 3600),
+    "vswitches": (300, 3600),
+}
+
+
+def scope_of(*parts: Optional[str]) -> str:
+    """同步范围：region_id、region_id/vpc_id，厂商级为空串"""
+    return "/".join(p for p in parts if p)
+
+
+class CatalogFreshness:
+    """
+    目录表新鲜度：同步时间记录在 public 库 catalog_sync_state 表（多 worker 共享），
+    后台刷新按 (provider, kind, scope) 在进程内去重，同一范围同时只刷新一次。
+    """
+
+    def __init__(self, policies: Dict[str, Tuple[int, int]], max_workers: int):
+        self.policies = policies
+        self.max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._inflight: Set[Tuple[str, str, str]] = set()
+        self._lock = threading.Lock()
+
+    def synced_at(self, provider_code: str, kind: str, scope: str) -> Optional[datetime]:
+        db = SessionLocal["public"]()
+        try:
+            return CatalogSyncStateRepository(db).get_synced_at(provider_code, kind, scope)
+        finally:
+            db.close()
+
+    def mark_synced(self, provider_code: str, kind: str, scope: str) -> None:
+        db = SessionLocal["public"]()
+        try:
+            CatalogSyncStateRepository(db).mark_synced(provider_code, kind, scope)
+        except Exception as e:
+            db.rollback()
+            logger.warning("mark catalog %s synced failed for %s/%s: %s", kind, provider_code, scope, e)
+        finally:
+            db.close()
+
+    def state(self, provider_code: str, kind: str, scope: str) -> str:
+        try:
+            synced_at = self.synced_at(provider_code, kind, scope)
+        except Exception as e:
+            # 状态表不可用时退回原来的“有数据就用”
+            logger.warning("read catalog %s sync state failed for %s/%s: %s", kind, provider_code, scope, e)
+            return FRESH
+        if synced_at is None:
+            # 有数据但从未记录过同步时间（历史数据），先用着再后台刷新
+            return STALE
+
+        soft, hard = self.policies[kind]
+        age = (datetime.now(timezone.utc) - synced_at).total_seconds()
+        if age < soft:
+            return FRESH
+        if age < hard:
+            return STALE
+        return EXPIRED
+
+    def refresh_in_background(self, provider_code: str, kind: str, scope: str, refresh: Callable[[], None]) -> bool:
+        """提交后台刷新；同一范围已在刷新中时直接返回 False"""
+        key = (provider_code, kind, scope)
+        with self._lock:
+            if key in self._inflight:
+                return False
+            self._inflight.add(key)
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="catalog-refresh")
+            executor = self._executor
+
+        def _run():
+            try:
+                refresh()
+            except Exception as e:
+                logger.warning("background refresh of %s failed for %s/%s: %s", kind, provider_code, scope, e)
+            finally:
+                with self._lock:
+                    self._inflight.discard(key)
+
+        executor.submit(_run)
+        return True
+
+
+catalog_freshness = CatalogFreshness(CATALOG_FRESHNESS, settings.CATALOG_REFRESH_WORKERS)
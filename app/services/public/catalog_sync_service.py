@@ -0,0 +1,103 @@
+# app/services/public/catalog_sync_service.py
+from typing import List, Optional
+
+from sqlalchemy.orm import Session
+
+from app.models.public.cloud_provider import CloudCredentialsPlatform
+from app.repositories.public.cloud_provider_repo import CloudProviderRepository
+from app.repositories.public.cloud_region_repo import CloudRegionRepository
+from app.repositories.public.cloud_zone_repo import CloudZoneRepository
+from app.repositories.cmp.vpc_repo import VpcRepository
+from app.services.public.cloud_service import CloudService
+from app.core.config import settings
+from app.core.logger import logger
+
+# 预热库存快照时覆盖的计费方式 / 系统盘
+STOCK_CHARGE_TYPES = ("PostPaid", "PrePaid")
+STOCK_DISK_CATEGORY = "cloud_essd"
+
+
+class CatalogSyncService:
+    """
+    云资源目录后台同步：把区域、可用区、规格、库存、VPC、子网、安全组写入本地表，
+    请求路径只读已预热的表和缓存，不再阻塞在云 API 上。
+    区域/可用区在 public 库，其余在 cmp 库，所以各用一个 CloudService。
+    """
+
+    def __init__(self, public_db: Session, cmp_db: Session):
+        self.public_db = public_db
+        self.cmp_db = cmp_db
+        self.provider_repo = CloudProviderRepository(public_db)
+        self.region_repo = CloudRegionRepository(public_db)
+        self.zone_repo = CloudZoneRepository(public_db)
+        self.vpc_repo = VpcRepository(cmp_db)
+
+    def providers(self) -> List[CloudCredentialsPlatform]:
+        return self.provider_repo.list_all()
+
+    @staticmethod
+    def _cloud(db: Session, provider: CloudCredentialsPlatform) -> CloudService:
+        return CloudService(
+            db,
+            provider.provider_code,
+            provider.access_key_id,
+            provider.access_key_secret,
+            provider.endpoint,
+        )
+
+    def _region_ids(self, provider_code: str) -> List[str]:
+        if settings.CATALOG_SYNC_REGIONS:
+            return list(settings.CATALOG_SYNC_REGIONS)
+        return [r.region_id for r in self.region_repo.region_list(provider_code)]
+
+    def _each_region(self, provider: CloudCredentialsPlatform, task: str, fn) -> None:
+        """逐个 region 执行，单个 region 失败不影响其他 region"""
+        for region_id in self._region_ids(provider.provider_code):
+            self._guarded(provider, task, region_id, fn, region_id)
+
+    def _guarded(self, provider: CloudCredentialsPlatform, task: str, scope: str, fn, *args) -> None:
+        """执行单个同步步骤，失败时回滚并记录日志，不影响后续步骤"""
+        try:
+            fn(*args)
+        except Exception as e:
+            self.public_db.rollback()
+            self.cmp_db.rollback()
+            logger.warning("catalog sync %s failed for %s/%s: %s", task, provider.provider_code, scope, e)
+
+    #   区域 + 可用区
+    def sync_regions_and_zones(self, provider: CloudCredentialsPlatform) -> None:
+        cloud = self._cloud(self.public_db, provider)
+        result = cloud.sync_regions()
+        logger.info("catalog sync regions %s: %s", provider.provider_code, result)
+        self._each_region(provider, "zones", cloud.sync_zones)
+
+    #   全量规格
+    def sync_instance_types(self, provider: CloudCredentialsPlatform) -> None:
+        result = self._cloud(self.cmp_db, provider).sync_instance_types()
+        logger.info("catalog sync instance types %s: %s", provider.provider_code, result)
+
+    #   可用区库存（每个 region 每种计费方式一次 DescribeAvailableResource）
+    def sync_stock(self, provider: CloudCredentialsPlatform) -> None:
+        cloud = self._cloud(self.cmp_db, provider)
+
+        def _refresh(region_id: str):
+            for charge_type in STOCK_CHARGE_TYPES:
+                cloud.refresh_available_type(region_id, charge_type, STOCK_DISK_CATEGORY)
+
+        self._each_region(provider, "stock", _refresh)
+
+    #   VPC / 子网 / 安全组
+    def sync_network(self, provider: CloudCredentialsPlatform) -> None:
+        cloud = self._cloud(self.cmp_db, provider)
+
+        def _refresh(region_id: str):
+            # VPC / 子网 / 安全组各自兜底：某一步失败不跳过其余步骤
+            self._guarded(provider, "vpcs", region_id, cloud.sync_vpcs, region_id)
+            for vpc in self.vpc_repo.get_by_vpcs(provider.provider_code, region_id):
+                if vpc.vpc_id:
+                    # 用云厂商 VPC ID 调 API，子网表写本地 Vpc.id
+                    self._guarded(provider, "vswitches", f"{region_id}/{vpc.vpc_id}",
+                                  cloud.sync_vswitches, region_id, vpc.vpc_id, vpc.id)
+            self._guarded(provider, "security_groups", region_id, cloud.sync_security_groups, region_id)
+
+        self._each_region(provider, "network", _refresh)
@@ -1,4 +1,4 @@
-from typing import Tuple
+from typing import Optional, Tuple
 from sqlalchemy.orm import Session
 
 from app.repositories.public.cloud_certificate_repo import CloudCertificateRepository
@@ -6,6 +6,7 @@ from app.models.public.cloud_certificate import CloudCertificate
 from app.common.exceptions import BusinessException
 from app.common.status_code import ErrorCode
 from app.common.messages import Message
+from app.common.pagination import CountMode, CursorResult
 
 class CloudCertificateService:
     def __init__(self, db: Session):
@@ -27,6 +28,10 @@ class CloudCertificateService:
     def list_certificates(self, page: int, page_size: int) -> Tuple[int, list[CloudCertificate]]:
         return self.repo.list_page(page, page_size)
 
+    def list_certificates_cursor(self, cursor: Optional[str] = None, page_size: int = 20,
+                                 count: CountMode = CountMode.NONE) -> CursorResult:
+        return self.repo.list_cursor(cursor, page_size, count)
+
     def update_certificate(self, record_id: int, **kwargs) -> CloudCertificate:
         obj = self.repo.update(record_id, **kwargs)
         if not obj:
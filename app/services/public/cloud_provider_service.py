@@ -1,12 +1,15 @@
 # app/services/public/cloud_provider_service.py
 
+from typing import Optional
 from sqlalchemy.orm import Session
 
+from app.clients.client_pool import cloud_client_pool
 from app.repositories.public.cloud_provider_repo import CloudProviderRepository
 from app.models.public.cloud_provider import CloudCredentialsPlatform
 from app.common.exceptions import BusinessException
 from app.common.status_code import ErrorCode
 from app.common.messages import Message
+from app.common.pagination import CountMode, CursorResult
 
 
 class CloudProviderService:
@@ -25,21 +28,33 @@ class CloudProviderService:
         return self.provider_repo.create(**kwargs)
 
     def update_provider(self, record_id: int, **kwargs):
-        if not self.provider_repo.get_by_id(record_id):
+        provider = self.provider_repo.get_by_id(record_id)
+        if not provider:
             raise BusinessException(
                 code=ErrorCode.CLOUD_PROVIDER_NOT_FOUND,
                 message=Message.CLOUD_PROVIDER_NOT_FOUND
             )
-        return self.provider_repo.update(record_id, **kwargs)
+        # 旧凭证的客户端不再复用
+        provider_code, access_key_id = provider.provider_code, provider.access_key_id
+        result = self.provider_repo.update(record_id, **kwargs)
+        cloud_client_pool.invalidate(provider_code, access_key_id)
+        return result
 
     def delete_provider(self, record_id: int) -> bool:
+        provider = self.provider_repo.get_by_id(record_id)
         success = self.provider_repo.delete(record_id)
         if not success:
             raise BusinessException(
                 code=ErrorCode.CLOUD_PROVIDER_DELETE_FAILED,
                 message=Message.CLOUD_PROVIDER_DELETE_FAILED
             )
+        if provider is not None:
+            cloud_client_pool.invalidate(provider.provider_code, provider.access_key_id)
         return True
 
     def list_providers(self, page: int, page_size: int):
         return self.provider_repo.list_page(page, page_size)
+
+    def list_providers_cursor(self, cursor: Optional[str] = None, page_size: int = 20,
+                              count: CountMode = CountMode.NONE) -> CursorResult:
+        return self.provider_repo.list_cursor(cursor, page_size, count)
@@ -1,6 +1,7 @@
 # app/services/public/cloud_region_service.py
 from typing import List
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
 from app.repositories.public.cloud_provider_repo import CloudProviderRepository
 from app.repositories.public.cloud_region_repo import CloudRegionRepository
@@ -11,6 +12,7 @@ from app.common.status_code import ErrorCode
 from app.schemas.public.cloud_region_schema import CloudRegionBase
 
 from app.services.public.cloud_service import CloudService
+from app.services.public.async_cloud_service import AsyncCloudService
 
 class CloudRegionService:
     """云厂商区域同步与查询服务"""
@@ -41,6 +43,23 @@ class CloudRegionService:
         return regions
 
 
+    async def sync_regions_async(self, provider_code: str) -> list[CloudRegionBase]:
+        """sync_regions 的协程版本，云 API 走异步客户端"""
+        provider = await run_in_threadpool(self.provider_repo.get_by_code, provider_code)
+        if not provider:
+            raise BusinessException(
+                code=ErrorCode.DATA_NOT_FOUND,
+                message=Message.DATA_NOT_FOUND
+            )
+        client_region = AsyncCloudService(
+            self.db,
+            provider_code,
+            provider.access_key_id,
+            provider.access_key_secret,
+            provider.endpoint,
+        )
+        return await client_region.list_regions()
+
     def list_regions(self, provider_code: str) -> List[CloudRegionBase]:
         """仅从数据库获取（不发云厂商API）"""
         return self.region_repo.region_list(provider_code)
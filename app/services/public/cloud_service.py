@@ -1,13 +1,17 @@
+from datetime import datetime, timezone
+
 from sqlalchemy.orm import Session
 
-from typing import List, Optional
+from typing import Dict, List, Optional
 from app.clients.cloud_client_factory import CloudClientFactory
+from app.clients.paginator import chunked
 from app.repositories.public.cloud_region_repo import CloudRegionRepository
 from app.repositories.public.cloud_zone_repo import CloudZoneRepository
 from app.repositories.public.cloud_provider_repo import  CloudProviderRepository
 from app.repositories.cmp.vpc_repo import VpcRepository
 from app.repositories.cmp.subnet_repo import SubnetRepository
 from app.repositories.cmp.instance_type_repo import InstanceTypeRepo
+from app.repositories.cmp.security_group_repo import SecurityGroupRepository
 
 from app.schemas.public.cloud_region_schema import CloudRegionBase
 from app.schemas.public.cloud_zone_schema import CloudZoneList
@@ -15,13 +19,51 @@ from app.schemas.cmp.vpc_schema import VpcBase
 from app.schemas.cmp.subnet_schema import SubnetBase
 from app.schemas.cmp.instance_type_schema import InstanceTypeBase
 
+from app.common.bulk_upsert import UpsertResult
+from app.common.cache import TieredCache, build_key, build_shared_backend, register_cache_types
+from app.common.singleflight import SingleFlight, mysql_named_lock
+from app.core.config import settings
+from app.core.database import engines
 from app.core.logger import logger
+from app.services.public.catalog_freshness import catalog_freshness, scope_of, CATALOG_FRESHNESS, FRESH, STALE
+from app.services.cmp.instance_type_catalog import instance_type_catalog
+from app.services.public.stock_snapshot import DEFAULT_CHARGE_TYPE, StockSnapshot, StockSnapshotStore
+
+# 各类目录数据的缓存时长（秒）；有本地表的类目与 CATALOG_FRESHNESS 的软 TTL 保持一致
+CATALOG_TTLS = {
+    "regions": 24 * 3600,
+    "zones": 24 * 3600,
+    "instance_types": 6 * 3600,
+    "images": 3600,
+    "disk_types": 600,
+    "vpcs": 300,
+    "vswitches": 300,
+}
+
+# 目录缓存里出现的 schema，Redis 二级缓存只按白名单还原
+register_cache_types(CloudRegionBase, CloudZoneList, VpcBase, SubnetBase, InstanceTypeBase)
+
+catalog_cache = TieredCache(
+    max_entries=settings.CATALOG_CACHE_MAX_ENTRIES,
+    shared=build_shared_backend(settings.CATALOG_CACHE_REDIS_URL),
+)
+
+stock_snapshots = StockSnapshotStore(
+    catalog_cache,
+    ttl=settings.STOCK_SNAPSHOT_TTL_SECONDS,
+    history=settings.STOCK_CHANGE_HISTORY,
+)
+
+# 相同的缓存加载 / 同步在进程内只执行一次，并发请求共享结果
+cloud_flights = SingleFlight()
+
 
 class CloudService:
     def __init__(self, db: Session, provider_code: str, access_key_id: str, access_key_secret: str, endpoint: str):
         self.db = db
         self.provider_code = provider_code
         self.client = CloudClientFactory.create_client(provider_code, access_key_id, access_key_secret, endpoint)
+        self._credentials = (access_key_id, access_key_secret, endpoint)
         self.provider_repo = CloudProviderRepository(db)
 
         self.region_repo = CloudRegionRepository(db)
@@ -29,81 +71,206 @@ class CloudService:
         self.vpc_repo = VpcRepository(db)
         self.subnet_repo = SubnetRepository(db)
         self.instance_type_repo = InstanceTypeRepo(db)
+        self.security_group_repo = SecurityGroupRepository(db)
+
+    # --------------------------
+    # 缓存：key = (kind, provider_code, region_id, zone_id, 其他参数)
+    # --------------------------
+    def _cached(self, kind: str, key_parts: tuple, loader):
+        key = build_key("catalog", kind, *key_parts)
+        return catalog_cache.get_or_load(key, CATALOG_TTLS[kind], lambda: cloud_flights.do(key, loader))
+
+    @staticmethod
+    def invalidate(kind: str, provider_code: str, region_id: Optional[str] = None, zone_id: Optional[str] = None):
+        """
+        失效指定类目的缓存，同步/创建/释放后调用。
+        region_id / zone_id 为空时按更大范围失效。
+        """
+        parts = [provider_code]
+        if region_id is not None:
+            parts.append(region_id)
+            if zone_id is not None:
+                parts.append(zone_id)
+        catalog_cache.invalidate_prefix(build_key("catalog", kind, *parts))
+
+    # --------------------------
+    # 本地表读取（stale-while-revalidate）：
+    #   新鲜 -> 直接返回；过软 TTL -> 返回旧数据 + 后台刷新（去重）；
+    #   过硬 TTL 或表为空 -> 当前请求同步刷新后重新读表
+    # --------------------------
+    def _read_through(self, kind: str, scope: str, read, sync: str, *sync_args):
+        rows = read()
+        if rows:
+            state = catalog_freshness.state(self.provider_code, kind, scope)
+            if state == FRESH:
+                return rows
+            if state == STALE:
+                self.refresh_in_background(kind, scope, sync, *sync_args)
+                return rows
+
+        try:
+            self._sync_once(kind, scope, sync, *sync_args)
+        except Exception as e:
+            if rows:
+                logger.warning("refresh %s failed for %s/%s, serving stale rows: %s", kind, self.provider_code, scope, e)
+                return rows
+            raise
+        return read()
+
+    # --------------------------
+    # 同步去重（single-flight）：
+    #   进程内相同 (kind, scope) 的同步只执行一次，其余线程等待共享结果；
+    #   开启 SINGLE_FLIGHT_DB_LOCK 时再用 MySQL 命名锁跨 worker 互斥，
+    #   等过锁的一方先 recheck()，别的 worker 已同步完就不再调用云 API
+    # --------------------------
+    def _sync_once(self, kind: str, scope: str, sync: str, *sync_args, recheck=None):
+        key = build_key("sync", self.provider_code, kind, scope)
+        if recheck is None and kind in CATALOG_FRESHNESS:
+            def recheck():
+                return True if catalog_freshness.state(self.provider_code, kind, scope) == FRESH else None
+
+        def _run():
+            if not settings.SINGLE_FLIGHT_DB_LOCK:
+                return getattr(self, sync)(*sync_args)
+            with mysql_named_lock(engines["public"], key, settings.SINGLE_FLIGHT_LOCK_TIMEOUT_SECONDS) as waited:
+                if waited and recheck is not None:
+                    done = recheck()
+                    if done is not None:
+                        logger.info("%s for %s/%s already synced by another worker", kind, self.provider_code, scope)
+                        return done
+                return getattr(self, sync)(*sync_args)
+
+        return cloud_flights.do(key, _run)
+
+    def refresh_in_background(self, kind: str, scope: str, sync: str, *sync_args) -> bool:
+        """后台线程用独立 session 执行 sync 方法，请求结束后 self.db 会被关闭"""
+        bind = self.db.get_bind()
+        provider_code = self.provider_code
+        credentials = self._credentials
+
+        def _refresh():
+            db = Session(bind=bind, autoflush=False)
+            try:
+                CloudService(db, provider_code, *credentials)._sync_once(kind, scope, sync, *sync_args)
+            finally:
+                db.close()
+
+        return catalog_freshness.refresh_in_background(provider_code, kind, scope, _refresh)
 
     def list_regions(self) -> List[CloudRegionBase]:
+        return self._cached("regions", (self.provider_code,), self._load_regions)
+
+    def regions_from_db(self) -> List[CloudRegionBase]:
         db_regions = self.region_repo.region_list(self.provider_code)
-        if db_regions:
-            return [
-                CloudRegionBase(
-                    provider_code=self.provider_code,
-                    region_id=r.region_id,
-                    region_name=r.region_name
-                ) for r in db_regions
-            ]
-
-        regions = self.client.list_regions()
-        self.region_repo.bulk_upsert(self.provider_code, regions)
-        return regions
+        return [
+            CloudRegionBase(
+                provider_code=self.provider_code,
+                region_id=r.region_id,
+                region_name=r.region_name
+            ) for r in db_regions
+        ]
+
+    def _load_regions(self) -> List[CloudRegionBase]:
+        return self._read_through("regions", scope_of(), self.regions_from_db, "sync_regions")
 
     def list_zones(self, provider_code: str, region_id: str) -> List[CloudZoneList]:
+        return self._cached("zones", (provider_code, region_id), lambda: self._load_zones(provider_code, region_id))
+
+    def zones_from_db(self, provider_code: str, region_id: str) -> List[CloudZoneList]:
         db_zones = self.zone_repo.get_by_zones(provider_code, region_id)
-        if db_zones:
-            return [
-                CloudZoneList(
-                    id=z.id,
-                    provider_code=z.provider_code,
-                    region_id=z.region_id,
-                    zone_id=z.zone_id,
-                    zone_name=z.zone_name
-                ) for z in db_zones
-            ]
-        zones = self.client.list_zones(region_id)
-        self.zone_repo.bulk_upsert(provider_code, region_id, zones)
-        return zones
+        return [
+            CloudZoneList(
+                id=z.id,
+                provider_code=z.provider_code,
+                region_id=z.region_id,
+                zone_id=z.zone_id,
+                zone_name=z.zone_name
+            ) for z in db_zones
+        ]
+
+    def _load_zones(self, provider_code: str, region_id: str) -> List[CloudZoneList]:
+        return self._read_through(
+            "zones",
+            scope_of(region_id),
+            lambda: self.zones_from_db(provider_code, region_id),
+            "sync_zones",
+            region_id,
+        )
 
     def list_vpcs(self, provider_code: str, region_id: str) -> List[VpcBase]:
+        return self._cached("vpcs", (provider_code, region_id), lambda: self._load_vpcs(provider_code, region_id))
+
+    def vpcs_from_db(self, provider_code: str, region_id: str) -> List[VpcBase]:
         db_vpcs = self.vpc_repo.get_by_vpcs(provider_code, region_id)
-        if db_vpcs:
-            return [
-                VpcBase(
-                    vpc_name=v.vpc_name,
-                    description=v.description,
-                    region_id=v.region_id,
-                    resource_group_id=v.resource_group_id,
-                    cloud_provider_code=v.cloud_provider_code,
-                    cloud_certificate_id=v.cloud_certificate_id,
-                    network_type=v.network_type
-                ) for v in db_vpcs
-            ]
-        vpcs = self.client.list_vpcs(region_id)
-        self.vpc_repo.bulk_upsert(provider_code, region_id, vpcs)
-        return vpcs
+        return [
+            VpcBase(
+                vpc_name=v.vpc_name,
+                description=v.description,
+                region_id=v.region_id,
+                resource_group_id=v.resource_group_id,
+                cloud_provider_code=v.cloud_provider_code,
+                cloud_certificate_id=v.cloud_certificate_id,
+                network_type=v.network_type
+            ) for v in db_vpcs
+        ]
+
+    def _load_vpcs(self, provider_code: str, region_id: str) -> List[VpcBase]:
+        return self._read_through(
+            "vpcs",
+            scope_of(region_id),
+            lambda: self.vpcs_from_db(provider_code, region_id),
+            "sync_vpcs",
+            region_id,
+        )
 
 
     def list_vswitches(self, provider_code, region_id: str, vpc_id: str) -> List[SubnetBase]:
-        db_subnet = self.subnet_repo.list_by_subnet(vpc_id)
-        if db_subnet:
-            return [
-                SubnetBase(
-                    subnet_name=s.subnet_name,
-                    description=s.description,
-                    vpc_id=s.vpc_id,
-                    resource_group_id=s.resource_group_id,
-                    cloud_provider_code=s.cloud_provider_code,
-                    cloud_certificate_id=s.cloud_certificate_id,
-                    region_id=s.region_id,
-                    zone_id=s.zone_id,
-                    cidr_block=s.cidr_block
-                ) for s in db_subnet
-            ]
+        return self._cached(
+            "vswitches",
+            (provider_code, region_id, None, vpc_id),
+            lambda: self._load_vswitches(provider_code, region_id, vpc_id),
+        )
 
-        subnets = self.client.list_vswitches(region_id, vpc_id)
-        self.subnet_repo.bulk_upsert(provider_code, region_id, vpc_id, subnets)
-        return subnets
+    def _local_vpc_id(self, vpc_id: str) -> Optional[int]:
+        """子网表的 vpc_id 存的是本地 Vpc.id，云 API 用的是 vpc-xxx"""
+        vpc = self.vpc_repo.get_by_cloud_id(self.provider_code, vpc_id)
+        return vpc.id if vpc else None
+
+    def vswitches_from_db(self, vpc_id: str) -> List[SubnetBase]:
+        local_vpc_id = self._local_vpc_id(vpc_id)
+        if local_vpc_id is None:
+            return []
+        db_subnet = self.subnet_repo.list_by_subnet(local_vpc_id)
+        return [
+            SubnetBase(
+                subnet_name=s.subnet_name,
+                description=s.description,
+                vpc_id=s.vpc_id,
+                resource_group_id=s.resource_group_id,
+                cloud_provider_code=s.cloud_provider_code,
+                cloud_certificate_id=s.cloud_certificate_id,
+                region_id=s.region_id,
+                zone_id=s.zone_id,
+                cidr_block=s.cidr_block
+            ) for s in db_subnet
+        ]
+
+    def _load_vswitches(self, provider_code, region_id: str, vpc_id: str) -> List[SubnetBase]:
+        return self._read_through(
+            "vswitches",
+            scope_of(region_id, vpc_id),
+            lambda: self.vswitches_from_db(vpc_id),
+            "sync_vswitches",
+            region_id,
+            vpc_id,
+        )
 
     def list_images(self, region_id: str, instance_type_id: str, architecture: str) -> List[dict]:
-        images = self.client.list_images(region_id, instance_type_id, architecture)
-        return images
+        return self._cached(
+            "images",
+            (self.provider_code, region_id, None, instance_type_id, architecture),
+            lambda: self.client.list_images(region_id, instance_type_id, architecture),
+        )
 
     def list_disk_types(
         self,
@@ -111,19 +278,167 @@ class CloudService:
         zone_id: Optional[str] = None,
         instance_type_id: Optional[str] = None,
         instance_charge_type: Optional[str] = None,):
-        return self.client.list_system_disk_categories(region_id, zone_id, instance_type_id, instance_charge_type)
+        return self._cached(
+            "disk_types",
+            (self.provider_code, region_id, zone_id, instance_type_id, instance_charge_type),
+            lambda: self.client.list_system_disk_categories(region_id, zone_id, instance_type_id, instance_charge_type),
+        )
 
     def list_instance_types(self, provider_code: str):
+        return self._cached("instance_types", (provider_code,), lambda: self._load_instance_types(provider_code))
+
+    def instance_types_from_db(self, provider_code: str) -> List[InstanceTypeBase]:
         db_instance_type = self.instance_type_repo.get_by_instance_type(provider_code)
-        if db_instance_type:
-            return [
-                InstanceTypeBase.model_validate(i, from_attributes=True) for i in db_instance_type
-            ]
+        return [
+            InstanceTypeBase.model_validate(i, from_attributes=True) for i in db_instance_type
+        ]
+
+    def _load_instance_types(self, provider_code: str):
+        return self._read_through(
+            "instance_types",
+            scope_of(),
+            lambda: self.instance_types_from_db(provider_code),
+            "sync_instance_types",
+        )
+
+    # --------------------------
+    # 主动同步：拉取云端数据写库、记录同步时间并失效缓存
+    # --------------------------
+    def sync_regions(self):
+        return self.store_regions(self.client.list_regions())
+
+    def store_regions(self, regions: List[dict]) -> UpsertResult:
+        result = self.region_repo.bulk_upsert(self.provider_code, regions)
+        catalog_freshness.mark_synced(self.provider_code, "regions", scope_of())
+        self.invalidate("regions", self.provider_code)
+        return result
+
+    def sync_zones(self, region_id: str):
+        return self.store_zones(region_id, self.client.list_zones(region_id))
+
+    def store_zones(self, region_id: str, zones: List[dict]) -> UpsertResult:
+        result = self.zone_repo.bulk_upsert(self.provider_code, region_id, zones)
+        catalog_freshness.mark_synced(self.provider_code, "zones", scope_of(region_id))
+        self.invalidate("zones", self.provider_code, region_id)
+        return result
+
+    def sync_vpcs(self, region_id: str):
+        result = self.vpc_repo.bulk_upsert(self.provider_code, region_id, self.client.list_vpcs(region_id))
+        catalog_freshness.mark_synced(self.provider_code, "vpcs", scope_of(region_id))
+        self.invalidate("vpcs", self.provider_code, region_id)
+        return result
+
+    def sync_vswitches(self, region_id: str, vpc_id: str, local_vpc_id: Optional[int] = None):
+        """vpc_id 为云厂商 VPC ID，用于调 API；local_vpc_id 为本地 Vpc.id，写入子网表（不传时按 vpc_id 查）"""
+        if local_vpc_id is None:
+            local_vpc_id = self._local_vpc_id(vpc_id)
+            if local_vpc_id is None:
+                # VPC 还没同步到本地，子网无处挂靠
+                logger.warning("skip vswitch sync: vpc %s/%s not in local table", self.provider_code, vpc_id)
+                return UpsertResult()
+        subnets = self.client.list_vswitches(region_id, vpc_id)
+        result = self.subnet_repo.bulk_upsert(self.provider_code, region_id, local_vpc_id, subnets)
+        catalog_freshness.mark_synced(self.provider_code, "vswitches", scope_of(region_id, vpc_id))
+        self.invalidate("vswitches", self.provider_code, region_id)
+        return result
+
+    def sync_instance_types(self):
+        return self.store_instance_types(self.client.list_instance_types(self.provider_code))
+
+    def store_instance_types(self, instance_types: List[dict]) -> UpsertResult:
+        result = self.instance_type_repo.bulk_upsert(self.provider_code, instance_types)
+        catalog_freshness.mark_synced(self.provider_code, "instance_types", scope_of())
+        self.invalidate("instance_types", self.provider_code)
+        instance_type_catalog.invalidate(self.provider_code)
+        return result
+
+    def sync_security_groups(self, region_id: str, page_size: int = 50, batch_size: int = 500) -> UpsertResult:
+        """分页器边拉边写：每攒够 batch_size 条做一次 bulk upsert"""
+        total = UpsertResult()
+        groups = self.client.iter_security_groups(region_id=region_id, vpc_id=None, page_size=page_size)
+        for items in chunked(groups, batch_size):
+            result = self.security_group_repo.bulk_upsert_from_cloud(self.provider_code, region_id, items)
+            total.inserted += result.inserted
+            total.updated += result.updated
+            total.unchanged += result.unchanged
+        return total
+
+    def refresh_available_type(self, region_id: str, instance_charge_type: str = None, system_disk_category: str = None):
+        """
+        不指定 zone 调用一次 DescribeAvailableResource，拿到整个 region 所有可用区的库存，
+        按可用区写入库存快照（并记录与上一份快照相比的状态变化）。
+        """
+        instance_charge_type = instance_charge_type or DEFAULT_CHARGE_TYPE
+        items = self.client.list_available_instance_types(region_id, None, instance_charge_type, system_disk_category)
+        return stock_snapshots.put_region(self.provider_code, region_id, instance_charge_type, system_disk_category, items)
 
-        instance_types = self.client.list_instance_types(provider_code)
-        self.instance_type_repo.bulk_upsert(provider_code, instance_types)
-        return instance_types
+    def _refresh_stock(self, region_id: str, instance_charge_type: str, system_disk_category: str,
+                       force_live: bool) -> Dict[str, StockSnapshot]:
+        """当前请求同步拉取 region 库存；并发请求合并为一次 DescribeAvailableResource"""
+        def recheck():
+            # force_live 要的是此刻的库存，不复用其他 worker 的结果
+            if force_live:
+                return None
+            return stock_snapshots.get_region(self.provider_code, region_id, instance_charge_type, system_disk_category)
+
+        return self._sync_once(
+            "stock", scope_of(region_id, instance_charge_type, system_disk_category),
+            "refresh_available_type", region_id, instance_charge_type, system_disk_category,
+            recheck=recheck,
+        )
+
+    def stock_snapshot(
+        self,
+        region_id: str,
+        zone_id: str,
+        instance_charge_type: str = None,
+        system_disk_category: str = None,
+        force_live: bool = False) -> StockSnapshot:
+        """
+        读取库存快照：超过 STOCK_SNAPSHOT_STALE_SECONDS 时返回旧快照并后台刷新；
+        没有快照或 force_live 时当前请求同步拉取整个 region。
+        """
+        instance_charge_type = instance_charge_type or DEFAULT_CHARGE_TYPE
+        if not force_live:
+            snapshot = stock_snapshots.get(self.provider_code, region_id, zone_id, instance_charge_type, system_disk_category)
+            if snapshot is not None:
+                if snapshot.age >= settings.STOCK_SNAPSHOT_STALE_SECONDS:
+                    self.refresh_in_background(
+                        "stock", scope_of(region_id, instance_charge_type, system_disk_category),
+                        "refresh_available_type", region_id, instance_charge_type, system_disk_category,
+                    )
+                return snapshot
+
+        snapshots = self._refresh_stock(region_id, instance_charge_type, system_disk_category, force_live)
+        snapshot = snapshots.get(zone_id)
+        if snapshot is None:
+            # 该可用区在此计费方式下没有任何可售规格
+            snapshot = StockSnapshot({}, datetime.now(timezone.utc))
+        return snapshot
+
+    def region_stock_snapshots(
+        self,
+        region_id: str,
+        instance_charge_type: str = None,
+        system_disk_category: str = None,
+        force_live: bool = False) -> Dict[str, StockSnapshot]:
+        """
+        region 下全部可用区的库存快照 {zone_id: snapshot}，刷新策略同 stock_snapshot；
+        缺快照或 force_live 时只调用一次 region 级 DescribeAvailableResource。
+        """
+        instance_charge_type = instance_charge_type or DEFAULT_CHARGE_TYPE
+        if not force_live:
+            snapshots = stock_snapshots.get_region(self.provider_code, region_id, instance_charge_type, system_disk_category)
+            if snapshots is not None:
+                if max(s.age for s in snapshots.values()) >= settings.STOCK_SNAPSHOT_STALE_SECONDS:
+                    self.refresh_in_background(
+                        "stock", scope_of(region_id, instance_charge_type, system_disk_category),
+                        "refresh_available_type", region_id, instance_charge_type, system_disk_category,
+                    )
+                return snapshots
 
+        snapshots = self._refresh_stock(region_id, instance_charge_type, system_disk_category, force_live)
+        return {zone_id: s for zone_id, s in snapshots.items() if s.statuses}
 
     def list_available_type(
         self,
@@ -131,7 +446,11 @@ class CloudService:
         zone_id: str = None,
         instance_charge_type: str = None,
         system_disk_category: str = None) -> List[dict]:
-        return self.client.list_available_instance_types(region_id, zone_id, instance_charge_type, system_disk_category)
+        snapshot = self.stock_snapshot(region_id, zone_id, instance_charge_type, system_disk_category)
+        return [
+            {"instance_type_id": it_id, "status_category": status, "zone_id": zone_id}
+            for it_id, status in snapshot.statuses.items()
+        ]
 
     def list_pricing(
         self,
@@ -1,5 +1,6 @@
 from typing import List
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
 from app.repositories.public.cloud_zone_repo import CloudZoneRepository
 from app.repositories.public.cloud_provider_repo import CloudProviderRepository
@@ -9,6 +10,7 @@ from app.common.status_code import ErrorCode
 
 from app.schemas.public.cloud_zone_schema import CloudZoneList
 from app.services.public.cloud_service import CloudService
+from app.services.public.async_cloud_service import AsyncCloudService
 
 
 class CloudZoneService:
@@ -37,5 +39,22 @@ class CloudZoneService:
         zones = client_zone.list_zones(provider_code, region_id)
         return zones
 
+    async def sync_zones_async(self, provider_code: str, region_id: str) -> List[CloudZoneList]:
+        """sync_zones 的协程版本，云 API 走异步客户端"""
+        provider = await run_in_threadpool(self.provider_repo.get_by_code, provider_code)
+        if not provider:
+            raise BusinessException(
+                code=ErrorCode.DATA_NOT_FOUND,
+                message=Message.DATA_NOT_FOUND
+            )
+        client_zone = AsyncCloudService(
+            self.db,
+            provider_code,
+            provider.access_key_id,
+            provider.access_key_secret,
+            provider.endpoint,
+        )
+        return await client_zone.list_zones(provider_code, region_id)
+
     def list_zones(self, provider_code: str, region_id: str) -> List[CloudZoneList]:
         return self.zone_repo.get_by_zones(provider_code, region_id)
\ No newline at end of file
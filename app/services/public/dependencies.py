@@ -2,13 +2,14 @@
 from fastapi import Depends
 from sqlalchemy.orm import Session
 
-from app.common.dependencies import get_public_db
+from app.common.dependencies import get_audit_db, get_public_db
 from app.services.public.resource_group_service import ResourceGroupService
 from app.services.public.resource_group_binding_service import ResourceGroupBindingService
 from app.services.public.cloud_certificate_service import CloudCertificateService
 from app.services.public.cloud_provider_service import CloudProviderService
 from app.services.public.cloud_region_service import CloudRegionService
 from app.services.public.cloud_zone_service import CloudZoneService
+from app.services.public.audit_log_service import AuditLogService
 
 #   云厂商
 def get_cloud_provider_service(db: Session = Depends(get_public_db)) -> CloudProviderService:
@@ -35,3 +36,7 @@ def get_resource_group_binding_service(
     db: Session = Depends(get_public_db),
 ) -> ResourceGroupBindingService:
     return ResourceGroupBindingService(db)
+
+#   审计日志
+def get_audit_log_service(db: Session = Depends(get_audit_db)) -> AuditLogService:
+    return AuditLogService(db)
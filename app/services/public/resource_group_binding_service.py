@@ -1,3 +1,4 @@
+from typing import Optional
 from sqlalchemy.orm import Session
 from app.repositories.public.resource_group_binding_repo import ResourceGroupBindingRepository
 from app.schemas.public.resource_group_binding_schema import (
@@ -6,6 +7,7 @@ from app.schemas.public.resource_group_binding_schema import (
 from app.common.exceptions import BusinessException
 from app.common.status_code import ErrorCode
 from app.common.messages import Message
+from app.common.pagination import CountMode, CursorResult
 
 class ResourceGroupBindingService:
     def __init__(self, db: Session):
@@ -42,3 +44,8 @@ class ResourceGroupBindingService:
     # 获取资源组绑定列表
     def list_bindings(self, group_id: int, page: int, page_size: int):
         return self.binding_repo.list_by_group_page(group_id, page, page_size)
+
+    # 获取资源组绑定列表（游标分页）
+    def list_bindings_cursor(self, group_id: int, cursor: Optional[str] = None, page_size: int = 20,
+                             count: CountMode = CountMode.NONE) -> CursorResult:
+        return self.binding_repo.list_by_group_cursor(group_id, cursor, page_size, count)
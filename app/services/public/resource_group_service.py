@@ -1,10 +1,11 @@
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 from sqlalchemy.orm import Session
 from app.repositories.public.resource_group_repo import ResourceGroupRepository
 from app.models.public.resource_group import ResourceGroup
 from app.common.exceptions import BusinessException
 from app.common.messages import Message
 from app.common.status_code import ErrorCode
+from app.common.pagination import CountMode, CursorResult
 
 class ResourceGroupService:
     """资源组业务服务层"""
@@ -35,6 +36,10 @@ class ResourceGroupService:
     def list_groups(self, page: int, page_size: int) -> Tuple[int, List[ResourceGroup]]:
         return self.repo.list_page(page, page_size)
 
+    def list_groups_cursor(self, cursor: Optional[str] = None, page_size: int = 20,
+                           count: CountMode = CountMode.NONE) -> CursorResult:
+        return self.repo.list_cursor(cursor, page_size, count)
+
     def update_group(self, record_id: int, data: dict) -> ResourceGroup:
         obj = self.repo.update(record_id, data)
         if not obj:
@@ -0,0 +1,132 @@
+# app/services/public/stock_snapshot.py
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+from app.common.cache import TieredCache, build_key, register_cache_types
+from app.core.logger import logger
+
+# 未指定计费方式时阿里云按 PostPaid（按量）处理；快照 key 统一成它，与定时预热的 key 一致
+DEFAULT_CHARGE_TYPE = "PostPaid"
+
+# 视为售罄的库存状态
+SOLDOUT_CATEGORIES = {"WithoutStock", "ClosedWithoutStock"}
+
+# 多个可用区合并时取"最好"的状态：有货 > 库存紧张 > 售罄待补货 > 售罄不补货
+_STATUS_RANK = {"WithStock": 0, "ClosedWithStock": 1, "WithoutStock": 2, "ClosedWithoutStock": 3}
+
+
+def best_status(statuses: List[Optional[str]]) -> Optional[str]:
+    return min(statuses, key=lambda s: _STATUS_RANK.get(s, len(_STATUS_RANK)), default=None)
+
+
+@dataclass
+class StockTransition:
+    instance_type_id: str
+    before: Optional[str]   # None：新上架
+    after: Optional[str]    # None：已下架
+    at: datetime
+
+
+@dataclass
+class StockSnapshot:
+    """单个 (region, zone, 计费方式, 系统盘) 的库存快照"""
+    statuses: Dict[str, str]                     # instance_type_id -> status_category
+    taken_at: datetime
+    changes: List[StockTransition] = field(default_factory=list)   # 最近的状态变化，新的在前
+
+    @property
+    def age(self) -> float:
+        return (datetime.now(timezone.utc) - self.taken_at).total_seconds()
+
+
+register_cache_types(StockTransition, StockSnapshot)
+
+
+def diff_statuses(old: Dict[str, str], new: Dict[str, str], at: datetime) -> List[StockTransition]:
+    changes = []
+    for it_id, status in new.items():
+        before = old.get(it_id)
+        if before != status:
+            changes.append(StockTransition(it_id, before, status, at))
+    for it_id, before in old.items():
+        if it_id not in new:
+            changes.append(StockTransition(it_id, before, None, at))
+    return changes
+
+
+class StockSnapshotStore:
+    """
+    库存快照存储：一次 region 级 DescribeAvailableResource 拆成各可用区快照，
+    写入目录缓存（配置了 Redis 时多 worker 共享）；每次写入与上一份快照比对，保留最近的状态变化。
+    """
+
+    def __init__(self, cache: TieredCache, ttl: float, history: int):
+        self.cache = cache
+        self.ttl = ttl
+        self.history = history
+
+    @staticmethod
+    def _key(provider_code: str, region_id: str, zone_id: Optional[str], charge_type: Optional[str],
+             disk_category: Optional[str]) -> str:
+        return build_key("stock", provider_code, region_id, zone_id, charge_type or DEFAULT_CHARGE_TYPE, disk_category)
+
+    def get(self, provider_code: str, region_id: str, zone_id: str, charge_type: Optional[str],
+            disk_category: Optional[str]) -> Optional[StockSnapshot]:
+        key = self._key(provider_code, region_id, zone_id, charge_type, disk_category)
+        return self.cache.get(key, self.ttl)
+
+    def zones(self, provider_code: str, region_id: str, charge_type: Optional[str],
+              disk_category: Optional[str]) -> List[str]:
+        """region 最近一次快照覆盖的可用区"""
+        key = self._key(provider_code, region_id, None, charge_type, disk_category)
+        return self.cache.get(key, self.ttl, [])
+
+    def get_region(self, provider_code: str, region_id: str, charge_type: Optional[str],
+                   disk_category: Optional[str]) -> Optional[Dict[str, StockSnapshot]]:
+        """region 下各可用区的快照；从未拉取过或部分可用区已过期时返回 None"""
+        zone_ids = self.zones(provider_code, region_id, charge_type, disk_category)
+        if not zone_ids:
+            return None
+        snapshots = {}
+        for zone_id in zone_ids:
+            snapshot = self.get(provider_code, region_id, zone_id, charge_type, disk_category)
+            if snapshot is None:
+                return None
+            snapshots[zone_id] = snapshot
+        return snapshots
+
+    def put_region(self, provider_code: str, region_id: str, charge_type: Optional[str],
+                   disk_category: Optional[str], items: List[dict]) -> Dict[str, StockSnapshot]:
+        """items 为 list_available_instance_types(region_id, None, ...) 的结果"""
+        now = datetime.now(timezone.utc)
+        by_zone: Dict[str, Dict[str, str]] = {}
+        for item in items:
+            by_zone.setdefault(item["zone_id"], {})[item["instance_type_id"]] = item.get("status_category")
+
+        # 上次有、这次整个可用区都没返回的，记为全部下架
+        for zone_id in self.zones(provider_code, region_id, charge_type, disk_category):
+            by_zone.setdefault(zone_id, {})
+
+        snapshots = {}
+        for zone_id, statuses in by_zone.items():
+            previous = self.get(provider_code, region_id, zone_id, charge_type, disk_category)
+            changes = []
+            if previous is not None:
+                changes = diff_statuses(previous.statuses, statuses, now)
+                self._log_soldout(region_id, zone_id, charge_type, changes)
+                changes = (changes + previous.changes)[:self.history]
+            snapshot = StockSnapshot(statuses, now, changes)
+            self.cache.set(self._key(provider_code, region_id, zone_id, charge_type, disk_category), snapshot, self.ttl)
+            snapshots[zone_id] = snapshot
+
+        zone_ids = sorted(z for z, s in snapshots.items() if s.statuses)
+        self.cache.set(self._key(provider_code, region_id, None, charge_type, disk_category), zone_ids, self.ttl)
+        return snapshots
+
+    @staticmethod
+    def _log_soldout(region_id: str, zone_id: str, charge_type: Optional[str], changes: List[StockTransition]) -> None:
+        soldout = [c.instance_type_id for c in changes
+                   if c.before == "WithStock" and (c.after is None or c.after in SOLDOUT_CATEGORIES)]
+        if soldout:
+            logger.info("stock sold out in %s/%s (%s): %s", region_id, zone_id, charge_type, ", ".join(soldout[:20]))
@@ -1,17 +1,19 @@
 # app/services/auth_service.py
 from sqlalchemy.orm import Session
 from datetime import datetime, timedelta, timezone
-from app.core.security import hash_password, verify_password, create_access_token, create_refresh_token, decode_token, REFRESH_EXPIRE_DAYS
+from app.core.security import hash_password, verify_password, create_access_token, create_refresh_token, decode_token, hash_refresh_token, REFRESH_EXPIRE_DAYS
 
 from app.models.sso.user import User
 from app.models.sso.session import UserSession
 
 from app.services.sso.session_service import SessionService
+from app.services.sso.token_revocation import token_revocations
 
 from app.repositories.sso.user_repo import UserRepository
 from app.repositories.sso.session_repo import SessionRepository
 from app.schemas.sso.auth_schema import LoginRequest, TokenResponse, UserRegister
 
+from app.common.exceptions import BusinessException
 from app.common.status_code import ErrorCode
 from app.common.messages import Message
 
@@ -31,8 +33,9 @@ class AuthService:
             raise BusinessException(code=ErrorCode.PASSWORD_INCORRECT, message=Message.PASSWORD_INCORRECT)
 
 
-        # 单点登录：清除历史会话
+        # 单点登录：清除历史会话，之前签发的 access token 一并吊销
         self.session_repo.clear_user_sessions(user.id)
+        token_revocations.revoke(self.db, user.id)
 
         subject = {"user_id": user.id, "username": user.username}
         access = create_access_token(subject)
@@ -42,7 +45,7 @@ class AuthService:
         expires_at = datetime.now(timezone.utc) + timedelta(days=REFRESH_EXPIRE_DAYS)
         session_model = UserSession(
             user_id=user.id,
-            refresh_token=refresh,
+            token_hash=hash_refresh_token(refresh),
             expires_at=expires_at,
             ip=ip,
             user_agent=user_agent
@@ -69,8 +72,9 @@ class AuthService:
         return TokenResponse(access_token=access, refresh_token=refresh_token, token_type="bearer")
 
     def logout(self, user_id: int):
-        # 注销直接删除会话（使 refresh 无效）
+        # 注销直接删除会话（使 refresh 无效），并吊销已签发的 access token
         self.session_repo.clear_user_sessions(user_id)
+        token_revocations.revoke(self.db, user_id)
 
     def register(self, data: UserRegister):
         # 检查重复
@@ -1,7 +1,7 @@
 from datetime import datetime, timedelta, timezone
 from sqlalchemy.orm import Session
 from app.models.sso.session import UserSession
-from app.core.security import create_access_token, create_refresh_token
+from app.core.security import create_access_token, create_refresh_token, hash_refresh_token
 from app.core.config import settings
 from app.repositories.sso.session_repo import SessionRepository
 
@@ -18,7 +18,7 @@ class SessionService:
         # 存入 DB（refresh session）
         session = UserSession(
             user_id=user.id,
-            refresh_token=refresh_token,  # 可以 hash 后存储更安全
+            token_hash=hash_refresh_token(refresh_token),  # 只存摘要
             expires_at=expires_at,
         )
         # 存入数据库
@@ -32,3 +32,13 @@ class SessionService:
             "refresh_token": refresh_token,
             "user": user
         }
+
+    def purge_expired(self) -> int:
+        """分批删除已过期的会话，返回删除条数"""
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        removed = 0
+        while True:
+            count = self.session_repo.delete_expired(now, settings.SESSION_PURGE_BATCH_SIZE)
+            removed += count
+            if count < settings.SESSION_PURGE_BATCH_SIZE:
+                return removed
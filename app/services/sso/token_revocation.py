@@ -0,0 +1,99 @@
+# app/services/sso/token_revocation.py
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional
+
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.logger import logger
+from app.repositories.sso.token_revocation_repo import TokenRevocationRepository
+
+
+class TokenRevocations:
+    """
+    access token 吊销集合（进程内 {user_id: 吊销时间点}）：
+    - 注销 / 单点登录清会话时 revoke()：本进程立即生效，同时写入 ss_token_revocations
+    - 其他 worker 每 sync_interval 秒增量拉取一次，请求路径上不逐个查库
+    - revoked_before 是写入方的时间而不是提交时间，晚提交的记录可能早于已读到的水位线，
+      所以每次从水位线往前回看 sync_interval + overlap 秒，重复读取无副作用
+    - 早于 access token 有效期的记录不会再命中任何 token，同步时顺带清理
+    """
+
+    def __init__(self, sync_interval: float, token_lifetime: float, overlap: float):
+        self.sync_interval = sync_interval
+        self.overlap = overlap
+        self.token_lifetime = token_lifetime
+        self._revoked: Dict[int, float] = {}
+        self._synced_until: Optional[datetime] = None
+        self._next_sync = 0.0
+        self._sync_lock = threading.Lock()
+
+    def _remember(self, user_id: int, revoked_before: float) -> None:
+        if revoked_before > self._revoked.get(user_id, 0.0):
+            self._revoked[user_id] = revoked_before
+
+    def revoke(self, db: Session, user_id: int, at: Optional[datetime] = None) -> None:
+        # JWT 的 iat 精确到秒，吊销时间点同样取整秒，避免误伤同一秒内新签发的 token
+        at = (at or datetime.now(timezone.utc)).replace(microsecond=0)
+        self._remember(user_id, at.timestamp())
+        try:
+            TokenRevocationRepository(db).upsert(user_id, at)
+        except Exception as e:
+            db.rollback()
+            logger.warning("persist token revocation failed for user %s: %s", user_id, e)
+
+    def _sync(self) -> None:
+        now = time.monotonic()
+        if now < self._next_sync or not self._sync_lock.acquire(blocking=False):
+            return
+        try:
+            self._next_sync = now + self.sync_interval
+            if self._synced_until is not None:
+                since = self._synced_until - timedelta(seconds=self.sync_interval + self.overlap)
+            else:
+                since = datetime.now(timezone.utc) - timedelta(seconds=self.token_lifetime)
+            db = SessionLocal["sso"]()
+            try:
+                rows = TokenRevocationRepository(db).list_since(since)
+            finally:
+                db.close()
+            for user_id, revoked_before in rows:
+                self._remember(user_id, revoked_before.timestamp())
+                if self._synced_until is None or revoked_before > self._synced_until:
+                    self._synced_until = revoked_before
+            if self._synced_until is None:
+                self._synced_until = since
+
+            cutoff = time.time() - self.token_lifetime
+            for user_id in [u for u, ts in self._revoked.items() if ts < cutoff]:
+                self._revoked.pop(user_id, None)
+        except Exception as e:
+            # 同步失败时沿用本地集合，下个周期重试
+            logger.warning("sync token revocations failed: %s", e)
+        finally:
+            self._sync_lock.release()
+
+    def is_revoked(self, payload: Dict) -> bool:
+        """payload 为已验签的 access token；签发时间早于该用户吊销时间点即视为已吊销"""
+        self._sync()
+        user_id = payload.get("user_id") or payload.get("sub")
+        if user_id is None:
+            return False
+        revoked_before = self._revoked.get(int(user_id))
+        if revoked_before is None:
+            return False
+        issued_at = payload.get("iat")
+        if issued_at is None:
+            # 旧 token 没有 iat，按 exp 倒推签发时间
+            issued_at = payload.get("exp", 0) - self.token_lifetime
+        return issued_at < revoked_before
+
+
+token_revocations = TokenRevocations(
+    sync_interval=settings.TOKEN_REVOCATION_SYNC_SECONDS,
+    token_lifetime=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+    overlap=settings.TOKEN_REVOCATION_SYNC_OVERLAP_SECONDS,
+)
@@ -0,0 +1,126 @@
+# scripts/bench_instance_catalog.py
+"""
+规格目录过滤基准：对比逐行循环过滤（原 _filter_available_instances 逻辑）与列式位图索引，
+并校验两者返回的结果一致（索引按目录顺序返回，比对前把参考结果按同样顺序排列）。
+
+用法（在项目根目录）：
+    python scripts/bench_instance_catalog.py                 # 默认 2000 个规格
+    python scripts/bench_instance_catalog.py --rows 5000 --repeat 2000
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.cmp.instance_type_catalog import InstanceTypeCatalog  # noqa: E402
+
+FAMILIES = ["ecs.g7", "ecs.c7", "ecs.r7", "ecs.gn7i", "ecs.gn6v", "ecs.g8y", "ecs.ebmg7"]
+GPU_SPECS = [None, "NVIDIA A10", "NVIDIA V100", "NVIDIA T4", "NVIDIA A100"]
+CPUS = [2, 4, 8, 16, 32, 64, 128]
+
+
+def _rows(n: int):
+    rnd = random.Random(42)
+    rows = []
+    for i in range(n):
+        cpu = rnd.choice(CPUS)
+        spec = rnd.choice(GPU_SPECS)
+        rows.append((
+            f"{rnd.choice(FAMILIES)}.{i}xlarge",
+            rnd.choice(FAMILIES),
+            cpu,
+            float(cpu * rnd.choice([1, 2, 4, 8])),
+            rnd.choice(["X86", "ARM"]),
+            rnd.choice([1, 2, 4, 8]) if spec else None,
+            spec,
+            24.0 if spec else None,
+        ))
+    return rows
+
+
+def _reference(available_map, db_map, cpu_number, memory_number, gpu_spec, gpu_name, hide_soldout):
+    """逐行过滤的参考实现"""
+    out = []
+    for it_id, avail in available_map.items():
+        inst = db_map.get(it_id)
+        if not inst:
+            continue
+        status_cat = avail or ""
+        if hide_soldout and status_cat not in ("WithStock",):
+            continue
+        if cpu_number and inst.cpu_core_count != cpu_number:
+            continue
+        if memory_number and inst.memory_size != memory_number:
+            continue
+        if gpu_spec and (not inst.gpu_spec or gpu_spec.lower() not in inst.gpu_spec.lower()):
+            continue
+        if gpu_name and gpu_name.lower() not in (inst.instance_type_id or "").split()[0].lower():
+            continue
+        out.append({
+            "instance_type_id": it_id,
+            "status_category": status_cat,
+            "cpu_core_count": inst.cpu_core_count,
+            "memory_size": inst.memory_size,
+            "gpu_amount": inst.gpu_amount,
+            "gpu_spec": inst.gpu_spec,
+            "gpu_memory": inst.gpu_memory,
+            "architecture": inst.architecture,
+        })
+    return out
+
+
+def _timeit(fn, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="instance type catalog filter benchmark")
+    parser.add_argument("--rows", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=500)
+    args = parser.parse_args(argv)
+
+    rows = _rows(args.rows)
+    db_map = {
+        r[0]: SimpleNamespace(instance_type_id=r[0], cpu_core_count=r[2], memory_size=r[3], architecture=r[4],
+                              gpu_amount=r[5], gpu_spec=r[6], gpu_memory=r[7])
+        for r in rows
+    }
+    rnd = random.Random(7)
+    available_map = {
+        r[0]: rnd.choice(["WithStock", "WithStock", "WithoutStock"])
+        for r in rows if rnd.random() < 0.7
+    }
+
+    start = time.perf_counter()
+    catalog = InstanceTypeCatalog(rows, built_at=time.time())
+    print(f"build {len(catalog)} rows: {(time.perf_counter() - start) * 1000:.2f} ms")
+
+    cases = [
+        ("no filter", dict(cpu_number=None, memory_number=None, gpu_spec=None, gpu_name=None, hide_soldout=False)),
+        ("cpu", dict(cpu_number=16, memory_number=None, gpu_spec=None, gpu_name=None, hide_soldout=False)),
+        ("cpu+memory", dict(cpu_number=16, memory_number=64, gpu_spec=None, gpu_name=None, hide_soldout=True)),
+        ("cpu+memory+gpu", dict(cpu_number=32, memory_number=128, gpu_spec="a10", gpu_name=None, hide_soldout=True)),
+    ]
+    print(f"{'case':<16} {'rows':>6} {'loop(us)':>10} {'index(us)':>10} {'speedup':>8}")
+    for name, kwargs in cases:
+        expected = sorted(_reference(available_map, db_map, **kwargs),
+                          key=lambda it: catalog.row_of[it["instance_type_id"]])
+        actual = catalog.filter_available(available_map, **kwargs)
+        if expected != actual:
+            print(f"{name}: results differ")
+            return 1
+        loop_us = _timeit(lambda: _reference(available_map, db_map, **kwargs), args.repeat)
+        index_us = _timeit(lambda: catalog.filter_available(available_map, **kwargs), args.repeat)
+        print(f"{name:<16} {len(actual):>6} {loop_us:>10.1f} {index_us:>10.1f} {loop_us / index_us:>7.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
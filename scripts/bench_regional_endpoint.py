@@ -0,0 +1,104 @@
+# scripts/bench_regional_endpoint.py
+"""
+中心 Endpoint 与 region Endpoint 的延迟对比。
+
+两种模式：
+- handshake（默认，无需凭证）：对每个 region 分别测中心 / region Endpoint 的 TCP + TLS 建连耗时
+- sync：用真实 AccessKey 按目录同步的调用组合（DescribeZones + region 级 DescribeAvailableResource）
+  分别走中心 / region Endpoint，对比每个 region 的耗时
+
+用法（在项目根目录）：
+    python scripts/bench_regional_endpoint.py --regions cn-qingdao,ap-southeast-1,eu-central-1
+    ALIBABA_CLOUD_ACCESS_KEY_ID=... ALIBABA_CLOUD_ACCESS_KEY_SECRET=... \\
+        python scripts/bench_regional_endpoint.py --mode sync --repeat 3
+"""
+import argparse
+import os
+import socket
+import ssl
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.clients.aliyun_client import AliyunClient, regional_endpoint  # noqa: E402
+
+CENTRAL = "ecs.aliyuncs.com"
+DEFAULT_REGIONS = "cn-hangzhou,cn-qingdao,cn-hongkong,ap-southeast-1,us-west-1,eu-central-1"
+
+
+def _handshake_ms(host: str, timeout: float) -> float:
+    context = ssl.create_default_context()
+    start = time.perf_counter()
+    with socket.create_connection((host, 443), timeout=timeout) as sock:
+        with context.wrap_socket(sock, server_hostname=host):
+            pass
+    return (time.perf_counter() - start) * 1000
+
+
+def _sync_ms(client: AliyunClient, region_id: str) -> float:
+    start = time.perf_counter()
+    client.list_zones(region_id)
+    client.list_available_instance_types(region_id, None, "PostPaid", "cloud_essd")
+    return (time.perf_counter() - start) * 1000
+
+
+def _median(fn, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        try:
+            samples.append(fn())
+        except Exception as e:
+            print(f"  failed: {e}")
+    return statistics.median(samples) if samples else float("nan")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="central vs regional ECS endpoint latency")
+    parser.add_argument("--mode", choices=["handshake", "sync"], default="handshake")
+    parser.add_argument("--regions", default=DEFAULT_REGIONS)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--timeout", type=float, default=10.0)
+    args = parser.parse_args(argv)
+    regions = [r.strip() for r in args.regions.split(",") if r.strip()]
+
+    if args.mode == "sync":
+        access_key_id = os.getenv("ALIBABA_CLOUD_ACCESS_KEY_ID")
+        access_key_secret = os.getenv("ALIBABA_CLOUD_ACCESS_KEY_SECRET")
+        if not access_key_id or not access_key_secret:
+            print("sync mode needs ALIBABA_CLOUD_ACCESS_KEY_ID / ALIBABA_CLOUD_ACCESS_KEY_SECRET")
+            return 2
+        central = AliyunClient(access_key_id, access_key_secret, CENTRAL)
+        central.client.regional = False
+        regional = AliyunClient(access_key_id, access_key_secret, CENTRAL)
+        # 先各跑一次，把建连 / 凭证初始化排除在计时之外
+        for region_id in regions:
+            for client in (central, regional):
+                _median(lambda: _sync_ms(client, region_id), 1)
+        measure = {
+            "central": lambda region_id: _median(lambda: _sync_ms(central, region_id), args.repeat),
+            "regional": lambda region_id: _median(lambda: _sync_ms(regional, region_id), args.repeat),
+        }
+    else:
+        measure = {
+            "central": lambda region_id: _median(lambda: _handshake_ms(CENTRAL, args.timeout), args.repeat),
+            "regional": lambda region_id: _median(
+                lambda: _handshake_ms(regional_endpoint(region_id), args.timeout), args.repeat),
+        }
+
+    print(f"mode={args.mode} repeat={args.repeat} (median ms)")
+    print(f"{'region':<18} {'central':>10} {'regional':>10} {'saved':>8}")
+    total_central = total_regional = 0.0
+    for region_id in regions:
+        central_ms = measure["central"](region_id)
+        regional_ms = measure["regional"](region_id)
+        total_central += central_ms
+        total_regional += regional_ms
+        print(f"{region_id:<18} {central_ms:>10.1f} {regional_ms:>10.1f} {central_ms - regional_ms:>8.1f}")
+    print(f"{'total':<18} {total_central:>10.1f} {total_regional:>10.1f} {total_central - total_regional:>8.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
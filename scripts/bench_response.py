@@ -0,0 +1,146 @@
+# scripts/bench_response.py
+"""
+Response.success 序列化基准：对比参考实现（_convert_payload + JSONResponse）与快速路径，
+并校验两者输出的响应体字节完全一致；浮点数与 NaN / Infinity 单独校验（orjson 写法不同，见 app/common/response.py）。
+
+用法（在项目根目录）：
+    python scripts/bench_response.py                # 默认 1500 条规格
+    python scripts/bench_response.py --rows 5000 --repeat 20
+"""
+import argparse
+import json
+import math
+import os
+import sys
+import time
+from datetime import datetime, timezone
+from decimal import Decimal
+from enum import Enum
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.responses import JSONResponse  # noqa: E402
+
+from app.common.messages import Message  # noqa: E402
+from app.common.response import Response, _convert_payload, orjson  # noqa: E402
+from app.common.status_code import ErrorCode  # noqa: E402
+from app.schemas.cmp.instance_type_schema import InstanceTypeBase  # noqa: E402
+
+
+class ChargeType(str, Enum):
+    POSTPAID = "PostPaid"
+
+
+class _Row:
+    """模拟已加载的 ORM 实例（__dict__ 中带 _sa_instance_state）"""
+
+    def __init__(self, i: int):
+        self._sa_instance_state = object()
+        self.id = i
+        self.vpc_id = f"vpc-{i:08d}"
+        self.vpc_name = f"默认专有网络-{i}"
+        self.cidr_block = "172.16.0.0/12"
+        self.is_default = i % 2 == 0
+        self.created_at = datetime(2025, 1, 1, 8, 30, i % 60, 123000)
+        self.updated_at = datetime(2025, 1, 2, tzinfo=timezone.utc)
+
+
+def instance_types(rows: int):
+    return [
+        InstanceTypeBase(
+            instance_type_id=f"ecs.g7.{i}xlarge",
+            instance_family="ecs.g7",
+            generation="g7",
+            cpu_core_count=4 * (i % 32 + 1),
+            memory_size=16.0 * (i % 32 + 1),
+            architecture="X86",
+            gpu_amount=0,
+            gpu_memory=None,
+            local_storage_amount=None,
+            network_performance="{'bandwidth': 10}",
+            price=Decimal("0.352") * (i % 7 + 1),
+            cloud_provider_code="aliyun",
+        )
+        for i in range(rows)
+    ]
+
+
+def payloads(rows: int):
+    return {
+        "instance_types(pydantic)": instance_types(rows),
+        "vpcs(orm)": [_Row(i) for i in range(rows)],
+        "available(dict)": [
+            {"instance_type_id": f"ecs.c7.{i}", "status": "Available", "status_category": "WithStock",
+             "zone_id": "cn-hangzhou-k", "charge": ChargeType.POSTPAID, "price": Decimal("1.20")}
+            for i in range(rows)
+        ],
+        "single(pydantic)": instance_types(1)[0],
+    }
+
+
+def legacy(data):
+    return JSONResponse(
+        status_code=200,
+        content={"code": ErrorCode.SUCCESS, "message": Message.SUCCESS, "data": _convert_payload(data)},
+    )
+
+
+# 标准库与 orjson 写法不同的浮点数：只要求解析后数值相同
+FLOATS = [1e-7, 1e16, 1.5e300, 5e-324, -0.0, 0.1, 123456789.123, 2.0 ** 53]
+
+
+def check_floats() -> bool:
+    ok = True
+    data = [{"price": f} for f in FLOATS]
+    legacy_body, fast_body = legacy(data).body, Response.success(data).body
+    same = json.loads(legacy_body) == json.loads(fast_body)
+    ok &= same
+    print(f"{'floats(value)':<26} identical bytes={legacy_body == fast_body} identical values={same}")
+
+    for value in (math.nan, math.inf, -math.inf):
+        try:
+            legacy([{"price": value}])
+            legacy_out = "ok"
+        except ValueError:
+            legacy_out = "ValueError"
+        try:
+            fast_out = json.loads(Response.success([{"price": value}]).body)["data"][0]["price"]
+        except ValueError:
+            fast_out = "ValueError"
+        # 标准库拒绝 NaN / Infinity；orjson 输出 null，两者之外的结果都算异常
+        expected = "ValueError" if orjson is None else None
+        ok &= legacy_out == "ValueError" and fast_out == expected
+        print(f"{'floats(' + repr(value) + ')':<26} legacy={legacy_out} fast={fast_out}")
+    return ok
+
+
+def bench(fn, data, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(data)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Response.success serialization benchmark")
+    parser.add_argument("--rows", type=int, default=1500)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args(argv)
+
+    print(f"encoder: {'orjson' if orjson is not None else 'json (stdlib)'}")
+    print(f"{'payload':<26} {'legacy(ms)':>11} {'fast(ms)':>9} {'speedup':>8}  identical")
+    ok = True
+    for name, data in payloads(args.rows).items():
+        same = legacy(data).body == Response.success(data).body
+        ok &= same
+        t_legacy = bench(legacy, data, args.repeat)
+        t_fast = bench(Response.success, data, args.repeat)
+        print(f"{name:<26} {t_legacy:>11.2f} {t_fast:>9.2f} {t_legacy / t_fast:>7.1f}x  {same}")
+    ok &= check_floats()
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
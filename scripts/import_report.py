@@ -0,0 +1,114 @@
+# scripts/import_report.py
+"""
+启动耗时报告：用 `python -X importtime` 导入目标模块，列出最慢的导入，并检查总耗时预算。
+
+用法（在项目根目录）：
+    python scripts/import_report.py                       # 默认 main，列出前 20
+    python scripts/import_report.py app.core.database --top 10
+    python scripts/import_report.py --budget-ms 1500      # 超出预算时退出码为 1
+
+测试中可直接调用：
+    from scripts.import_report import check_budget
+    assert check_budget("main", 1500)
+"""
+import argparse
+import os
+import subprocess
+import sys
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 默认预算（毫秒）：初始估计值，尚未在 CI 上校准。开发机（Python 3.11）单次实测
+# main 约 630 ms、app.core.database 约 220 ms，预算按 3~4 倍留余量；部署环境差异大时用 --budget-ms 覆盖
+DEFAULT_BUDGET_MS = {
+    "main": 2500,
+    "app.core.database": 600,
+}
+
+
+@dataclass
+class ImportRecord:
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def _parse(stderr: str) -> List[ImportRecord]:
+    records = []
+    for line in stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        try:
+            _, rest = line.split(":", 1)
+            self_us, cumulative_us, name = rest.split("|", 2)
+        except ValueError:
+            continue
+        depth = (len(name) - len(name.lstrip(" "))) // 2
+        records.append(ImportRecord(name.strip(), int(self_us), int(cumulative_us), depth))
+    return records
+
+
+def measure(module: str, env: Optional[dict] = None) -> List[ImportRecord]:
+    """在干净的子进程中导入 module，返回每个被导入模块的耗时"""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        env={**os.environ, **(env or {})},
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        # importtime 输出和异常都在 stderr，只取最后几行
+        tail = "\n".join(proc.stderr.strip().splitlines()[-10:])
+        raise RuntimeError(f"import {module} failed:\n{tail}")
+    return _parse(proc.stderr)
+
+
+def total_ms(records: List[ImportRecord], module: str) -> float:
+    """目标模块的 cumulative 即整次导入耗时"""
+    for r in reversed(records):
+        if r.module == module:
+            return r.cumulative_us / 1000
+    return sum(r.self_us for r in records) / 1000
+
+
+def check_budget(module: str, budget_ms: Optional[float] = None) -> bool:
+    budget = budget_ms if budget_ms is not None else DEFAULT_BUDGET_MS.get(module)
+    if budget is None:
+        raise ValueError(f"no budget configured for {module}")
+    return total_ms(measure(module), module) <= budget
+
+
+def report(module: str, top: int) -> Tuple[float, List[ImportRecord]]:
+    records = measure(module)
+    slowest = sorted(records, key=lambda r: r.self_us, reverse=True)[:top]
+    return total_ms(records, module), slowest
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="import time report")
+    parser.add_argument("module", nargs="?", default="main")
+    parser.add_argument("--top", type=int, default=20)
+    parser.add_argument("--budget-ms", type=float, default=None)
+    args = parser.parse_args(argv)
+
+    total, slowest = report(args.module, args.top)
+    print(f"import {args.module}: {total:.1f} ms")
+    print(f"{'self(ms)':>10} {'cumul(ms)':>10}  module")
+    for r in slowest:
+        print(f"{r.self_us / 1000:>10.1f} {r.cumulative_us / 1000:>10.1f}  {r.module}")
+
+    budget = args.budget_ms if args.budget_ms is not None else DEFAULT_BUDGET_MS.get(args.module)
+    if budget is not None:
+        ok = total <= budget
+        print(f"budget {budget:.0f} ms: {'OK' if ok else 'EXCEEDED'}")
+        return 0 if ok else 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
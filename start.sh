@@ -20,8 +20,12 @@ case "$1" in
     echo "📦 执行数据库迁移..."
     alembic upgrade head
     ;;
+  importtime)
+    echo "⏱️ 统计启动导入耗时..."
+    python "$BASE_DIR/scripts/import_report.py" "${@:2}"
+    ;;
   *)
-    echo "用法: ./start.sh [dev|prod|migrate]"
+    echo "用法: ./start.sh [dev|prod|migrate|importtime]"
     exit 1
     ;;
 esac